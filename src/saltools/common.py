@@ -25,6 +25,20 @@
           * All params from all classes with no default value are considered positional, they must 
             be supplies to ``__init__`` following the order of classes return by 
             ``inspect.getmro`` then their order in ``EasyObj_PARAMS``.
+        * The merged params are resolved once per class and cached, call ``reset_schema`` 
+          after modifying ``EasyObj_PARAMS`` of an existing class.
+        * If ``EasyObj_IS_FAST_INIT`` is set to True, a specialized ``__init__`` is generated 
+          for the class on first use, it behaves exactly as ``EasyObj.__init__``.
+        * Classes decorated with ``slotted`` store their params and ``EasyObj_SLOTS`` in 
+          ``__slots__`` instead of ``__dict__``.
+        * If ``EasyObj_IS_FROZEN`` is set to True, ``__hash__`` is computed from the params values 
+          and cached until a param is set, in place changes to mutable params values are not detected.
+        * The default ``datetime`` parser tries epochs, iso strings and ``DATE_FORMATS`` before the fuzzy 
+          ``dateutil`` parser and caches its results, use ``parse_dates`` for lists.
+        * Objects are pickled as a tuple of their params values, see ``EasyObj.__reduce__`` and 
+          ``EasyObj.to_bytes``, converters, adapters and ``_on_init`` are not called on unpickling.
+        * Classes are registered in ``TYPE_REGISTRY`` under their fqn and ``EasyObj_ALIASES``, 
+          ``select_type`` resolves names through it.
 
 
     Example:
@@ -54,34 +68,141 @@
 from    collections     import  OrderedDict , Sequence
 from    enum            import  Enum
 from    inspect         import  getmro
+from    keyword         import  iskeyword
+from    operator        import  attrgetter
 from    pprint          import  pformat
 from    datetime        import  datetime    as dt
-from    dateutil.parser import  parse       as dparse
+from    functools       import  lru_cache
+from    itertools       import  islice
+from    weakref         import  WeakValueDictionary
 
 import  importlib
+import  pickle
 import  json
 
+#Protocol used by EasyObj.to_bytes, 5 supports out-of-band buffers.
+PICKLE_PROTOCOL = 5
+
 MY_CLASS    = '''
     Just something to indicate that the type of the parameter is the same
         as the declaring class since the type cannot be used before is declared.
     '''
+#Marks a param with no value in generated code.
+_MISSING    = object()
+#Number of records validated at once by EasyObj.from_records
+_RECORDS_CHUNK  = 1024
+#Attributes not pickled by EasyObj.__reduce__.
+_NOT_STATE  = frozenset(('__dict__', '__weakref__', '_EasyObj_hash'))
+
+#Max number of distinct datetime strings cached by _parse_date.
+DATE_CACHE_SIZE = 4096
+#Fixed formats tried before the fuzzy parser, (format, does the format include the time).
+DATE_FORMATS    = (
+    ('%Y/%m/%d %H:%M:%S'    , True  ),
+    ('%m/%d/%Y %H:%M:%S'    , True  ),
+    ('%Y%m%dT%H%M%S'        , True  ),
+    ('%Y/%m/%d'             , False ),
+    ('%m/%d/%Y'             , False ),)
+
+def _g_epoch_date       (
+    ts  ):
+    '''Gets a datetime from an epoch in seconds, milliseconds, microseconds or nanoseconds.
+    '''
+    if      ts > 9999999999999999   :
+        ts  /= 10** 9
+    elif    ts > 9999999999999      :
+        ts  /= 10** 6
+    elif    ts > 9999999999         :
+        ts  /= 10** 3
+    return dt.fromtimestamp(ts)
+@lru_cache(maxsize= DATE_CACHE_SIZE)
+def _parse_date_fast    (
+    dt_str      ,
+    is_start    ):
+    '''Parses epochs, iso strings and ``DATE_FORMATS``, returns None on failure.
 
-def _parse_date (
+        Date only strings are parsed only if ``is_start``, the fuzzy parser sets the 
+        time to the end of the day otherwise.
+    '''
+    try                         :
+        return _g_epoch_date(float(dt_str))
+    except  (ValueError, TypeError, OverflowError, OSError) :
+        pass
+    if      not isinstance(dt_str, str)     :
+        return None
+    if      is_start or len(dt_str) >= 19   :
+        try                 :
+            return dt.fromisoformat(dt_str)
+        except  ValueError  :
+            pass
+    for format_, is_full in DATE_FORMATS    :
+        if      not (is_start or is_full)   :
+            continue
+        try                 :
+            return dt.strptime(dt_str, format_)
+        except  ValueError  :
+            pass
+    return None
+@lru_cache(maxsize= DATE_CACHE_SIZE)
+def _parse_date_fuzzy   (
+    dt_str      ,
+    is_start    ,
+    year        ):
+    #Imported on first use, dateutil is slow to import
+    from    dateutil.parser import  parse   as dparse
+    default_date    = dt(year, 1, 1, 0, 0, 0) if is_start else dt(year, 12, 31, 23, 59, 59)
+    return dparse(dt_str,fuzzy= True, default= default_date )
+def _parse_date         (
     dt_str              ,
     is_start    = True  ):
+    '''Parses a datetime.
+
+        Tries in order: epochs (seconds, ms, us or ns), iso strings, ``DATE_FORMATS`` and 
+        finally the fuzzy ``dateutil`` parser, missing parts default to the start of the 
+        current year if ``is_start`` else its end. Results are cached.
+
+        Args:
+            dt_str      (str | float    ): The datetime string or epoch.
+            is_start    (bool           ): The default for missing parts.
+        
+        Returns:
+            datetime.datetime   : The parsed datetime.
+    '''
+    try                 :
+        date    = _parse_date_fast(dt_str, is_start)
+    except  TypeError   :
+        #Unhashable
+        date    = None
+    if      date is not None    :
+        return date
     try         :
-        ts  = float(dt_str)
-        if      ts > 9999999999 :
-            ts  /= 100
-        return dt.fromtimestamp(ts)
-    except      :
-        pass
-    try         :
-        default_date    = dt(dt.now().year, 1, 1, 0, 0, 0) if is_start else dt(dt.now().year, 12, 31, 23, 59, 59)
-        return dparse(dt_str,fuzzy= True, default= default_date )
+        return _parse_date_fuzzy(dt_str, is_start, dt.now().year)
     except      :
         pass
     raise(ValueError(f'Can not parse datetime {dt_str}'))
+def parse_dates         (
+    dt_strs             ,
+    is_start    = True  ):
+    '''Parses a list of datetimes.
+
+        Each distinct value is parsed once, see ``_parse_date``.
+
+        Args:
+            dt_strs     (Iterable: str  ): The datetime strings or epochs.
+            is_start    (bool           ): The default for missing parts.
+
+        Returns:
+            list    : The parsed datetimes.
+    '''
+    dates   = {}
+    result  = []
+    for dt_str in dt_strs   :
+        date    = dates.get(dt_str)
+        if      date is None    :
+            date            = _parse_date(dt_str, is_start)
+            dates[dt_str]   = date
+        result.append(date)
+    return result
 
 class InfoExceptionType   (Enum):
     PROVIDED_TWICE  = 1
@@ -154,7 +275,484 @@ class ExceptionWrongType  (Exception):
 
     def __repr__(self):
         return str(self)
+class ExceptionRecords    (Exception):
+    '''Raised by `EasyObj.from_records`.
+
+        Raised after all the records are processed if any of them failed.
+
+        Args:
+            errors  (list   ): (index, exception) of all the failed records.
+    '''
+    def __init__(
+        self    ,
+        errors  ):
+        self.errors = errors
+
+    def __str__(self):
+        return '{} records failed:\n\t'.format(len(self.errors))+ '\n\t'.join(
+            '{:<6}: {}'.format(i, repr(e)) for i, e in self.errors)
+
+    def __repr__(self):
+        return str(self)
  
+class TypeRegistry  :
+    '''Maps fqn type names and aliases to types.
+
+        `EasyObj` subclasses are registered on creation under their fqn and ``EasyObj_ALIASES``, 
+        other names are imported on first use and cached. The types are weakly referenced, a 
+        type no longer used elsewhere is removed once collected.
+
+        Example:
+            >>> TYPE_REGISTRY.alias('Task', 'saltools.schedule.ScheduledTask')
+            >>> #saltools.schedule is imported here, not when the alias is created
+            >>> TYPE_REGISTRY.g_type('Task')
+    '''
+    def __init__(
+        self    ):
+        #Name, type
+        self.types  = WeakValueDictionary()
+        #Name, fqn of a type not resolved yet
+        self.lazy   = {}
+
+    @staticmethod
+    def g_fqn   (
+        type_   ):
+        '''Gets the fqn of a type.
+        '''
+        return f'{type_.__module__}.{type_.__qualname__}'
+    def register(
+        self        ,
+        type_       ,
+        *aliases    ):
+        '''Registers a type under its fqn and the given aliases.
+
+            Args:
+                type_   (type   ): The type to register.
+                aliases (str    ): Other names of the type.
+        '''
+        fqn             = self.g_fqn(type_)
+        self.types[fqn] = type_
+        for alias in aliases    :
+            self.alias(alias, type_)
+    def alias   (
+        self    ,
+        alias   ,
+        target  ):
+        '''Adds an alias.
+
+            Args:
+                alias   (str        ): The alias.
+                target  (type | str ): The type or its fqn, a fqn is imported on first use.
+
+            Raises:
+                ValueError  : If the alias is already used by a different type.
+        '''
+        fqn     = target if isinstance(target, str) else self.g_fqn(target)
+        current = self.types.get(alias)
+        current = self.g_fqn(current) if current is not None else self.lazy.get(alias)
+        if      current is not None and current != fqn  :
+            raise ValueError(f'Alias {alias} is already used by {current}.')
+        if      isinstance(target, str) :
+            self.types.pop(alias, None)
+            self.lazy[alias]    = target
+        else                            :
+            self.lazy.pop(alias, None)
+            self.types[alias]   = target
+    def g_type  (
+        self                ,
+        name                ,
+        namespace   = None  ):
+        '''Gets a type by name.
+
+            Args:
+                name        (str    ): A fqn or an alias.
+                namespace   (str    ): If provided, ``namespace.name`` is tried first.
+
+            Returns:
+                type    : The type.
+        '''
+        if      namespace is not None   :
+            type_   = self.types.get(f'{namespace}.{name}')
+            if      type_ is not None   :
+                return type_
+        type_   = self.types.get(name)
+        if      type_ is not None   :
+            return type_
+        
+        fqn     = self.lazy.get(name, name)
+        if      namespace is not None and '.' not in fqn    :
+            fqn     = f'{namespace}.{fqn}'
+        module_, _, class_  = fqn.rpartition('.')
+        type_   = getattr(importlib.import_module(module_), class_)
+        self.lazy.pop(name, None)
+        self.types[name]    = type_
+        return type_
+
+#The registry used by `EasyObj.select_type`.
+TYPE_REGISTRY   = TypeRegistry()
+
+class EasyObjSchema :
+    '''The resolved params of an `EasyObj` class.
+
+        Created once per class by ``EasyObj._g_schema`` and reused by all instances, 
+        must be treated as read only.
+
+        Args:
+            type_   (type   ): The `EasyObj` class.
+    '''
+    def __init__(
+        self    ,
+        type_   ):
+        self.type_              = type_
+        self.params             = type_._c_all_params()
+        self.names              = tuple(self.params.keys())
+        self.recursive_params   = type_._g_recursive_params(self.params)
+        self.on_inits           = tuple(
+            base._on_init for base in list(reversed(getmro(type_)))[:-1]    \
+                if      hasattr(base, '_on_init')                           \
+                        and base._on_init is not EasyObj._on_init           )
+        self.names_set          = frozenset(self.names)
+        #Runtime attributes and slots that are not params, pickled after the params values
+        slots                   = [
+            name for base in reversed(getmro(type_)) for name in base.__dict__.get('__slots__', ())]
+        self.state_names        = tuple(OrderedDict.fromkeys(
+            name for base in reversed(getmro(type_))                                \
+                for name in list(base.__dict__.get('EasyObj_SLOTS', ())) + slots    \
+                    if name not in self.names_set and name not in _NOT_STATE))
+        self.all_names          = self.names+ self.state_names
+        self.all_names_set      = frozenset(self.all_names)
+        self.g_all_values       = attrgetter(*self.all_names) if len(self.all_names) > 1 else \
+            lambda obj, names= self.all_names: tuple(getattr(obj, name) for name in names)
+        #If True, all the attributes are stored in the instances __dict__
+        self.is_dict            = bool(type_.__dictoffset__) and \
+            not any(name not in _NOT_STATE for name in slots)
+        self.g_values           = attrgetter(*self.names) if len(self.names) > 1 else \
+            lambda obj, names= self.names: tuple(getattr(obj, name) for name in names)
+        self.converters         = OrderedDict(
+            (param, self._c_converter(param)) for param in self.names)
+        #If True, the class or one of its bases overrides __init__, see EasyObj._g_batch
+        self.is_custom_init     = not (
+            type_.__init__ is EasyObj.__init__ or getattr(type_.__init__, '_EasyObj_IS_GENERATED', False))
+        self.init               = self._c_init() if type_.EasyObj_IS_FAST_INIT else None
+
+    def _c_item_converter   (
+        self        ,
+        param       ,
+        def_type    ):
+        '''Creates the converter of a single value, adapters excluded.
+
+            Args:
+                param       (str            ): The param name.
+                def_type    (type | list    ): The expected type of the value.
+
+            Returns:
+                function    : Converts a value, raises on failure.
+        '''
+        type_       = self.type_
+        if      def_type    == MY_CLASS             :
+            def_type    = type_
+        if      def_type    == None                 :
+            return lambda value : value
+        if      isinstance(def_type, list)          :
+            item_converter  = self._c_item_converter(param, def_type[0])
+            adapter         = self.params[param].get('adapter')
+            if      adapter     :
+                item_converter  = lambda value, convert= item_converter: adapter(convert(value))
+            def convert_list(
+                value   ):
+                if      value is None           :
+                    return value
+                elif    isinstance(value, list) :
+                    return [item_converter(x) for x in value]
+                else                            :
+                    return [item_converter(value)]
+            return convert_list
+        
+        parser          = self.params[param].get(
+            'parser'                    ,
+            type_.DEFAULT_PARSERS.get   (
+                def_type                ) if isinstance(def_type, type) else None)
+        members         = def_type.__members__ if \
+            isinstance(def_type, type) and issubclass(def_type, Enum) else None
+        is_recursive    = param in self.recursive_params
+        def convert (
+            value   ):
+            if      value is None or isinstance(value, def_type):
+                return value
+            elif    members is not None and isinstance(value, str)  :
+                member  = members.get(value)
+                return member if member is not None else getattr(def_type, value)
+            elif    is_recursive                                    :
+                if      isinstance(value    , dict      )   :
+                    return def_type(**value)
+                elif    isinstance(value    , list      )   :
+                    return def_type(*value)
+                else                                        :
+                    return def_type(value)
+            elif    parser      != None                             :
+                param_value = parser(value)
+                assert  isinstance(param_value, def_type),\
+                    f'Parser type {type(param_value)} is not {def_type} : {param} = {value}'
+                return param_value
+            else                                                    :
+                raise ExceptionWrongType(
+                            type_       ,
+                            param       ,
+                            def_type    ,
+                            type(value) ,
+                            value       )
+        return convert
+    def _c_converter        (
+        self    ,
+        param   ):
+        '''Creates the converter of a param, see ``EasyObj._g_param_value``.
+
+            Args:
+                param   (str    ): The param name.
+
+            Returns:
+                function    : Converts a value of the param, adapter included.
+        '''
+        convert = self._c_item_converter(param, self.params[param].get('type'))
+        adapter = self.params[param].get('adapter')
+        if      adapter :
+            return lambda value : adapter(convert(value))
+        return convert
+
+    def _c_param_code   (
+        self    ,
+        i       ,
+        param   ,
+        ns      ):
+        '''Generates the ``__init__`` code converting a single param.
+
+            Mirrors ``EasyObj._g_param_value``, list types are delegated to the param converter, 
+            the value is read into ``v{i}`` by ``_c_init``.
+
+            Args:
+                i       (int    ): The param index, used to name the generated variables.
+                param   (str    ): The param name.
+                ns      (dict   ): The namespace of the generated code, updated in place.
+
+            Returns:
+                list    : The generated code lines.
+        '''
+        type_       = self.type_
+        def_param   = self.params[param]
+        def_type    = def_param.get('type')
+        parser      = def_param.get(
+            'parser'                    ,
+            type_.DEFAULT_PARSERS.get   (
+                def_type                ) if isinstance(def_type, type) else None)
+        adapter     = def_param.get('adapter')
+        value       = f'v{i}'
+        ns[f'_t{i}']= def_type
+        ns[f'_p{i}']= parser
+        ns[f'_a{i}']= adapter
+        lines       = []
+        if      def_type    == None                 :
+            pass
+        elif    isinstance(def_type, list)          :
+            #Adapters are applied to the list and its items by the converter
+            ns[f'_c{i}']= self.converters[param]
+            lines  += [
+                f'{value} = _c{i}({value})'                                 ]
+            adapter = None
+        else                                        :
+            lines  += [
+                f'if {value} is not None and not isinstance({value}, _t{i}):']
+            if      issubclass(def_type, Enum)      :
+                lines  += [
+                    f'    if isinstance({value}, str):'                         ,
+                    f'        {value} = getattr(_t{i}, {value})'                ,
+                    f'    else:'                                                ]
+            else                                    :
+                lines  += [
+                    f'    if True:'                                             ]
+            if      param in self.recursive_params  :
+                lines  += [
+                    f'        if isinstance({value}, dict):'                    ,
+                    f'            {value} = _t{i}(**{value})'                   ,
+                    f'        elif isinstance({value}, list):'                  ,
+                    f'            {value} = _t{i}(*{value})'                    ,
+                    f'        else:'                                            ,
+                    f'            {value} = _t{i}({value})'                     ]
+            elif    parser      != None             :
+                lines  += [
+                    f'        _value = {value}'                                 ,
+                    f'        {value} = _p{i}({value})'                         ,
+                    f'        assert isinstance({value}, _t{i}), '
+                        f'f\'Parser type {{type({value})}} is not {{_t{i}}} : {param} = {{_value}}\'']
+            else                                    :
+                lines  += [
+                    f'        raise ExceptionWrongType(_cls, {param!r}, _t{i}, type({value}), {value})']
+        if      adapter     != None                 :
+            lines  += [
+                f'{value} = _a{i}({value})'                                 ]
+        if      type_.EasyObj_IS_FROZEN                         :
+            #Nothing to invalidate yet
+            lines  += [
+                f'_setattr(self, {param!r}, {value})'                       ]
+        elif    param.isidentifier() and not iskeyword(param)   :
+            lines  += [
+                f'self.{param} = {value}'                                   ]
+        else                                                    :
+            lines  += [
+                f'setattr(self, {param!r}, {value})'                        ]
+        return lines
+    def _c_init         (
+        self    ):
+        '''Generates a specialized ``__init__`` for the class.
+
+            The generated code inlines the positional order, default values, type checks, 
+            parsers and adapters of every param, errors are raised by ``EasyObj._g_all_values`` 
+            to keep the exact same exceptions as ``EasyObj.__init__``. As there, extra and missing 
+            params are checked before any param is converted.
+
+            Returns:
+                function    : The generated ``__init__``.
+        '''
+        type_   = self.type_
+        ns      = {
+            '_cls'              : type_                         ,
+            '_init'             : EasyObj.__init__              ,
+            '_names'            : self.names                    ,
+            '_names_set'        : self.names_set                ,
+            '_params'           : self.params                   ,
+            '_rps'              : self.recursive_params         ,
+            '_on_inits'         : self.on_inits                 ,
+            '_MISSING'          : _MISSING                      ,
+            '_setattr'          : object.__setattr__            ,
+            'ExceptionWrongType': ExceptionWrongType            }
+        lines   = [
+            'if self.__class__ is not _cls:'                            ,
+            '    return _init(self, *args, **kwargs)'                   ]
+        if      type_._EasyObj_parser.__func__ is not EasyObj._EasyObj_parser.__func__ :
+            lines  += [
+                'args, kwargs = _cls._EasyObj_parser(*args, **kwargs)'  ]
+        lines  += [
+            'if args:'                                                  ,
+            f'    if len(args) > {len(self.names)} or not kwargs.keys().isdisjoint(_names[:len(args)]):',
+            '        _cls._g_all_values(self, args, kwargs, _params)'   ,
+            '    kwargs.update(zip(_names, args))'                      ,
+            'if not _names_set.issuperset(kwargs):'                     ,
+            '    _cls._g_all_values(self, (), kwargs, _params)'         ]
+        #All the values are read and the missing params checked before any conversion
+        missing = []
+        for i, param in enumerate(self.names)   :
+            ns[f'_d{i}']= self.params[param].get('default', _MISSING)
+            lines      += [
+                f'v{i} = kwargs.get({param!r}, _d{i})'                  ]
+            if      'default' not in self.params[param] :
+                missing.append(f'v{i} is _MISSING')
+        if      missing :
+            lines  += [
+                f'if {" or ".join(missing)}:'                           ,
+                '    _cls._g_all_values(self, (), kwargs, _params)'     ]
+        for i, param in enumerate(self.names)   :
+            lines  += self._c_param_code(i, param, ns)
+        lines  += [
+            'for on_init in _on_inits:'                                 ,
+            '    on_init(self)'                                         ,
+            'self._on_init()'                                           ]
+        code    = 'def __init__(self, *args, **kwargs):\n'+ '\n'.join(
+            '    '+ line for line in lines)
+        exec(compile(code, f'<EasyObj {type_.__qualname__}.__init__>', 'exec'), ns)
+        init                        = ns['__init__']
+        init.__qualname__           = f'{type_.__qualname__}.__init__'
+        init.__module__             = type_.__module__
+        init._EasyObj_IS_GENERATED  = True
+        return init
+
+def _g_hashable (
+    value   ):
+    '''Gets a hashable equivalent of value.
+
+        Lists, tuples, dicts and sets are converted recursively, other unhashable values 
+        are replaced by their type.
+    '''
+    try                 :
+        hash(value)
+        return value
+    except  TypeError   :
+        pass
+    if      isinstance(value, (list, tuple))    :
+        return tuple(_g_hashable(x) for x in value)
+    elif    isinstance(value, dict)             :
+        return frozenset((k, _g_hashable(v)) for k, v in value.items())
+    elif    isinstance(value, (set, frozenset)) :
+        return frozenset(_g_hashable(x) for x in value)
+    else                                        :
+        return type(value)
+def _frozen_eq  (
+    self    ,
+    other   ):
+    if      isinstance(other, type(self))   :
+        return type(self)._g_schema().g_values(self) == type(other)._g_schema().g_values(other)
+    else                                    :
+        return False
+def _frozen_hash(
+    self    ):
+    value   = getattr(self, '_EasyObj_hash', None)
+    if      value is None   :
+        value   = hash(_g_hashable(type(self)._g_schema().g_values(self)))
+        object.__setattr__(self, '_EasyObj_hash', value)
+    return value
+def _frozen_setattr (
+    self    ,
+    name    ,
+    value   ):
+    object.__setattr__(self, name, value)
+    if      name in type(self)._g_schema().names_set            \
+            and getattr(self, '_EasyObj_hash', None) is not None:
+        object.__setattr__(self, '_EasyObj_hash', None)
+#Methods of classes with EasyObj_IS_FROZEN set to True
+_FROZEN_METHODS = {
+    '__eq__'        : _frozen_eq        ,
+    '__hash__'      : _frozen_hash      ,
+    '__setattr__'   : _frozen_setattr   }
+
+def _init_fast   (
+    self    ,
+    *args   ,
+    **kwargs):
+    '''Placeholder ``__init__`` of fast init classes.
+
+        Generates the class ``__init__`` on first use then calls it.
+    '''
+    init    = type(self)._g_schema().init or EasyObj.__init__
+    init(self, *args, **kwargs)
+_init_fast._EasyObj_IS_GENERATED    = True
+def _c_easyObj  (
+    type_           ,
+    values          ,
+    state   = None  ):
+    '''Creates an `EasyObj` from its params values, see ``EasyObj.__reduce__``.
+
+        The values are set as they are, converters, adapters and ``_on_init`` are not called.
+
+        Args:
+            type_   (type   ): The `EasyObj` class.
+            values  (tuple  ): The params values, ordered as the schema names, optionally followed by the 
+                state names values.
+            state   (dict   ): Other attributes of the object.
+
+        Returns:
+            EasyObj : The object.
+    '''
+    schema  = type_.__dict__.get('_EasyObj_SCHEMA') or type_._g_schema()
+    names   = schema.all_names if len(values) == len(schema.all_names) else schema.names
+    obj     = type_.__new__(type_)
+    if      schema.is_dict  :
+        obj.__dict__.update(zip(names, values))
+    else                    :
+        for name, value in zip(names, values)   :
+            object.__setattr__(obj, name, value)
+    if      state   :
+        for name, value in state.items()    :
+            object.__setattr__(obj, name, value)
+    return obj
+
 class EasyObj   :
     '''Automatic attribute creation from params.
 
@@ -173,6 +771,46 @@ class EasyObj   :
     #Contains params and validators for creating the object, must be overridden
     #Must be an ordered dict.
     EasyObj_PARAMS  = OrderedDict()
+    #Cached EasyObjSchema, set by _g_schema on each class.
+    _EasyObj_SCHEMA = None
+    #If True, a specialized __init__ is generated for the class, see EasyObjSchema._c_init.
+    #Ignored if the class or one of its bases overrides __init__.
+    EasyObj_IS_FAST_INIT    = False
+    #If True, __hash__ is cached and __eq__ compares the params values tuples, the cached
+    #hash is dropped when a param is set.
+    EasyObj_IS_FROZEN       = False
+    #Cached hash of frozen instances.
+    _EasyObj_hash           = None
+    #Runtime attributes (not params) set by the class, used by `slotted`.
+    EasyObj_SLOTS           = ()
+    #Allows slotted subclasses, see `slotted`, a bare EasyObj instance has no __dict__ as a result, 
+    #subclasses without __slots__ still have one.
+    __slots__               = ()
+    #Other names of the class in TYPE_REGISTRY, the fqn is always registered.
+    EasyObj_ALIASES         = ()
+
+    def __init_subclass__   (
+        cls         ,
+        **kwargs    ):
+        super().__init_subclass__(**kwargs)
+        TYPE_REGISTRY.register(cls, *cls.__dict__.get('EasyObj_ALIASES', ()))
+        for name, frozen_method in _FROZEN_METHODS.items()  :
+            method  = getattr(cls, name)
+            if      name in cls.__dict__                            :
+                continue
+            elif    cls.EasyObj_IS_FROZEN and method is not frozen_method   :
+                setattr(cls, name, frozen_method)
+            elif    not cls.EasyObj_IS_FROZEN and method is frozen_method   :
+                setattr(cls, name, getattr(EasyObj, name))
+        
+        if      '__init__' in cls.__dict__  :
+            return
+        is_generated    = getattr(cls.__init__, '_EasyObj_IS_GENERATED', False)
+        if      cls.EasyObj_IS_FAST_INIT                        and \
+                (is_generated or cls.__init__ is EasyObj.__init__)  :
+            cls.__init__    = _init_fast
+        elif    not cls.EasyObj_IS_FAST_INIT and is_generated       :
+            cls.__init__    = EasyObj.__init__
 
     @classmethod            
     def _EasyObj_parser     (
@@ -200,7 +838,7 @@ class EasyObj   :
         #Check for params appearing twice
         def_params_names= list(def_params.keys()) 
         params_args     = {
-            list(def_params.keys())[i] : args[i] for i in range(len(args))}
+            def_params_names[i] : args[i] for i in range(len(args))}
         twice_params    = [
             kwarg for kwarg in kwargs if kwarg in params_args]
         if twice_params:
@@ -225,8 +863,13 @@ class EasyObj   :
             raise ExceptionKwargs(obj, missing_params, InfoExceptionType.MISSING, def_params)
         return  params
     @classmethod
-    def _g_all_params       (
+    def _c_all_params       (
         cls ):
+        '''Creates the merged params of all the classes in the mro.
+
+            Walks the mro and merges all ``EasyObj_PARAMS``, positional params first.
+            Use ``_g_all_params`` instead, it returns the cached result.
+        '''
         def_params                  = OrderedDict()
         def_positional_params       = OrderedDict()
         def_non_positional_params   = OrderedDict()
@@ -257,6 +900,42 @@ class EasyObj   :
 
         return def_params
     @classmethod
+    def _g_all_params       (
+        cls ):
+        return cls._g_schema().params
+    @classmethod
+    def _g_schema           (
+        cls ):
+        '''Gets the class schema.
+
+            The schema is created on first use and cached on the class itself, 
+            subclasses never share the schema of their parents.
+
+            Returns:
+                EasyObjSchema   : The cached schema.
+        '''
+        schema  = cls.__dict__.get('_EasyObj_SCHEMA')
+        if      schema is None  :
+            schema              = EasyObjSchema(cls)
+            cls._EasyObj_SCHEMA = schema
+            if      schema.init                                             and \
+                    cls.__dict__.get('__init__') is _init_fast                  :
+                cls.__init__    = schema.init
+        return schema
+    @classmethod
+    def reset_schema        (
+        cls ):
+        '''Drops the cached schema.
+
+            Drops the cached schema of the class and all of its subclasses, must be called 
+            if ``EasyObj_PARAMS`` is modified after the class is created.
+        '''
+        cls._EasyObj_SCHEMA = None
+        if      getattr(cls.__dict__.get('__init__'), '_EasyObj_IS_GENERATED', False):
+            cls.__init__        = _init_fast
+        for subclass in cls.__subclasses__()    :
+            subclass.reset_schema()
+    @classmethod
     def _g_recursive_params (
         cls         ,
         def_params  ):
@@ -309,7 +988,12 @@ class EasyObj   :
                 - If all the above failed, raise an exception.
                 - Apply the adapter if any.
 
+            The class params use the converters compiled by the schema.
         '''
+        schema  = cls._g_schema()
+        if      def_type    == None                 \
+                and def_params is schema.params     :
+            return schema.converters[param](value)
         if      def_type    == None :
             def_type            = def_params[param].get('type')
         parser              = def_params[param].get(
@@ -368,15 +1052,248 @@ class EasyObj   :
         
         return adapter(param_value) if adapter else param_value
     
+    @staticmethod
+    def _g_fqn_type         (
+        fqn ):
+        return TYPE_REGISTRY.g_type(fqn)
     @classmethod
     def select_type         (
         cls     ,
         fqn     ,
         kwargs  ):
-        module_ = '.'.join(fqn.split('.')[:-1])
-        class_  = fqn.split('.')[-1]
-        type_   = getattr(importlib.import_module(module_), class_)
-        return type_(**kwargs)
+        '''Creates an object of the type ``fqn``.
+
+            Args:
+                fqn     (str    ): The type fqn or alias, see `TypeRegistry`.
+                kwargs  (dict   ): The object kwargs.
+        '''
+        return cls._g_fqn_type(fqn)(**kwargs)
+    @classmethod
+    def from_records        (
+        cls                 ,
+        records             ,
+        errors      = None  ,
+        type_key    = None  ):
+        '''Creates objects from an iterable of kwargs dicts.
+
+            A generator, the records are read by chunks of ``_RECORDS_CHUNK``, each chunk is validated 
+            and converted column by column with the compiled converters of the class schema, see 
+            ``_g_batch``, then the objects are created lazily. A failed record does not stop the 
+            iteration.
+
+            Args:
+                records     (Iterable: dict ): The kwargs of each object.
+                errors      (list           ): If provided, (index, exception) of the failed records 
+                    are appended to it, else `ExceptionRecords` is raised at the end.
+                type_key    (str            ): If provided, the key holding the object fqn type as in 
+                    ``select_type``, the key is removed from the kwargs, the type must be a subclass 
+                    of the class.
+
+            Yields:
+                EasyObj : The created objects.
+        '''
+        is_raise    = errors is None
+        errors      = [] if is_raise else errors
+        records     = iter(records)
+        offset      = 0
+        while True  :
+            chunk   = list(islice(records, _RECORDS_CHUNK))
+            if      not chunk   :
+                break
+            fqns    = [
+                (record.get(type_key) if type_key else None) if isinstance(record, dict) else \
+                    TypeError(f'Record is not a dict: {record!r}') for record in chunk]
+            groups  = []
+            for type_, positions in cls._g_types(fqns)  :
+                names   = OrderedDict.fromkeys(
+                    name for j in positions if isinstance(chunk[j], dict) for name in chunk[j] \
+                        if name != type_key)
+                groups.append((type_, positions, {
+                    name: [chunk[j].get(name, _MISSING) for j in positions] for name in names}))
+            yield from cls._g_batch(groups, len(chunk), offset, errors)
+            offset += len(chunk)
+        if      is_raise and errors :
+            raise ExceptionRecords(errors)
+    @classmethod
+    def from_columns        (
+        cls                 ,
+        columns             ,
+        errors      = None  ,
+        type_key    = None  ):
+        '''Creates objects from a dict of columns.
+
+            Same as ``from_records``, all columns must have the same length, the columns are 
+            validated and converted at once.
+
+            Args:
+                columns (dict   ): Param name, list of values.
+
+            Yields:
+                EasyObj : The created objects.
+        '''
+        lengths = set(len(column) for column in columns.values())
+        if      len(lengths) > 1    :
+            raise ValueError(f'Columns lengths do not match: {lengths}')
+        is_raise    = errors is None
+        errors      = [] if is_raise else errors
+        n           = lengths.pop() if lengths else 0
+        columns     = OrderedDict(columns)
+        fqns        = columns.pop(type_key) if type_key in columns else [None]* n
+        groups      = []
+        for type_, positions in cls._g_types(fqns)  :
+            groups.append((type_, positions, columns if len(positions) == n else {
+                name: [column[j] for j in positions] for name, column in columns.items()}))
+        yield from cls._g_batch(groups, n, 0, errors)
+        if      is_raise and errors :
+            raise ExceptionRecords(errors)
+    @classmethod
+    def _g_types            (
+        cls     ,
+        fqns    ):
+        '''Groups the rows of a batch by type, see ``from_records``.
+
+            Args:
+                fqns    (list   ): The fqn type of each row, None for the class, or an exception.
+
+            Returns:
+                list    : (type or exception, rows positions) of each group.
+        '''
+        groups  = OrderedDict()
+        for j, fqn in enumerate(fqns)   :
+            key = id(fqn) if isinstance(fqn, Exception) else fqn
+            if      key not in groups   :
+                groups[key] = (fqn, [])
+            groups[key][1].append(j)
+        types   = []
+        for fqn, positions in groups.values()   :
+            try                     :
+                type_   = fqn if fqn is None or isinstance(fqn, Exception) else cls._g_fqn_type(fqn)
+            except  Exception as e  :
+                type_   = e
+            types.append((cls if type_ is None else type_, positions))
+        return types
+    @classmethod
+    def _g_batch            (
+        cls     ,
+        groups  ,
+        n       ,
+        offset  ,
+        errors  ):
+        '''Validates and converts a batch then creates its objects lazily, see ``from_records``.
+
+            Each param is converted for all the rows of a type at once with the schema converter, 
+            the objects are created from the converted values as unpickled objects are, then 
+            ``_on_init`` is called. The objects of a type overriding ``__init__`` are created by 
+            calling the type with the row kwargs instead.
+
+            Args:
+                groups  (list   ): (type or exception, rows positions, columns) of each type, the 
+                    columns are lists of values by param name, ``_MISSING`` if not provided.
+                n       (int    ): Number of rows.
+                offset  (int    ): Index of the first row.
+                errors  (list   ): (index, exception) of the failed rows are appended to it.
+
+            Yields:
+                EasyObj : The created objects.
+        '''
+        rows    = [None]* n
+        for type_, positions, columns in groups :
+            if      not isinstance(type_, Exception)                            and \
+                    not (isinstance(type_, type) and issubclass(type_, cls))    :
+                type_   = TypeError(f'{type_} is not a subclass of {cls}')
+            if      isinstance(type_, Exception)    :
+                for j in positions  :
+                    rows[j] = type_
+                continue
+            if      type_._g_schema().is_custom_init    :
+                #The kwargs dict of each row
+                for k, j in enumerate(positions)    :
+                    rows[j] = (type_, {
+                        name: column[k] for name, column in columns.items() if column[k] is not _MISSING})
+                continue
+            for j, values in zip(positions, type_._g_columns_values(columns, len(positions))):
+                rows[j] = values if isinstance(values, Exception) else (type_, values)
+        schemas     = {}
+        setattr_    = object.__setattr__
+        for j, row in enumerate(rows)   :
+            if      isinstance(row, Exception)  :
+                errors.append((offset+ j, row))
+                continue
+            type_, values   = row
+            schema          = schemas.get(type_)
+            if      schema is None  :
+                schema          = type_._g_schema()
+                schemas[type_]  = schema
+            try                     :
+                if      values.__class__ is dict    :
+                    obj     = type_(**values)
+                else                                :
+                    #As in _c_easyObj
+                    obj     = type_.__new__(type_)
+                    if      schema.is_dict  :
+                        obj.__dict__.update(zip(schema.names, values))
+                    else                    :
+                        for name, value in zip(schema.names, values)    :
+                            setattr_(obj, name, value)
+                    for on_init in schema.on_inits  :
+                        on_init(obj)
+                    obj._on_init()
+            except  Exception as e  :
+                errors.append((offset+ j, e))
+                continue
+            yield obj
+    @classmethod
+    def _g_columns_values   (
+        cls     ,
+        columns ,
+        n       ):
+        '''Validates and converts columns of params values, column by column.
+
+            Args:
+                columns (dict   ): Lists of values by param name, ``_MISSING`` if not provided.
+                n       (int    ): Number of rows.
+
+            Returns:
+                list    : The params values of each row as a tuple ordered as the schema names, or 
+                    the exception raised by the row.
+        '''
+        schema  = cls._g_schema()
+        if      cls._EasyObj_parser.__func__ is not EasyObj._EasyObj_parser.__func__ :
+            #The parser works on the kwargs of a single object
+            rows    = [cls._EasyObj_parser(**{
+                name: column[j] for name, column in columns.items() if column[j] is not _MISSING})[1] \
+                    for j in range(n)]
+            names   = OrderedDict.fromkeys(name for row in rows for name in row)
+            columns = {name: [row.get(name, _MISSING) for row in rows] for name in names}
+        failed  = [None]* n
+        for name, column in columns.items() :
+            if      name in schema.names_set    :
+                continue
+            for j, value in enumerate(column)   :
+                if      value is not _MISSING and failed[j] is None :
+                    failed[j]   = ExceptionKwargs(
+                        cls.__new__(cls), [name], InfoExceptionType.EXTRA, schema.params)
+        values  = []
+        for name in schema.names    :
+            convert     = schema.converters[name]
+            default     = schema.params[name].get('default', _MISSING)
+            column      = columns.get(name) or [_MISSING]* n
+            converted   = [None]* n
+            for j, value in enumerate(column)   :
+                if      failed[j] is not None   :
+                    continue
+                if      value is _MISSING       :
+                    if      default is _MISSING :
+                        failed[j]   = ExceptionKwargs(
+                            cls.__new__(cls), [name], InfoExceptionType.MISSING, schema.params)
+                        continue
+                    value   = default
+                try                     :
+                    converted[j]    = convert(value)
+                except  Exception as e  :
+                    failed[j]       = e
+            values.append(converted)
+        return [row if error is None else error for row, error in zip(zip(*values) if values else [()]* n, failed)]
     
     def __init__    (
         self    , 
@@ -384,28 +1301,20 @@ class EasyObj   :
         **kwargs):
         my_type             = type(self)
         args, kwargs        = my_type._EasyObj_parser(*args, **kwargs)
-        #Get all inherited params
-        def_params          = my_type._g_all_params()
+        #Get all inherited params and their converters
+        schema              = my_type._g_schema()
+        converters          = schema.converters
         #Checks values params 
-        params              = my_type._g_all_values(self, args, kwargs, def_params)
-        #Get EasyObj params
-        recursive_params    = my_type._g_recursive_params(def_params)
-        #Try custom parsing logic
-
+        params              = my_type._g_all_values(self, args, kwargs, schema.params)
 
         for param in params :
             setattr(
-                self                    , 
-                param                   , 
-                my_type._g_param_value  (
-                    param           , 
-                    params[param]   , 
-                    def_params      , 
-                    recursive_params)   )
+                self                        , 
+                param                       , 
+                converters[param](params[param]))
         
-        for base in list(reversed(getmro(my_type)))[:-1]    :
-            if      hasattr(base, '_on_init')   :
-                    base._on_init(self)
+        for on_init in schema.on_inits  :
+            on_init(self)
         self._on_init()
     def __str__     (
         self        ):
@@ -425,6 +1334,70 @@ class EasyObj   :
     def __hash__    (
         self    ):
         return hash(str(self))
+    def __reduce__  (
+        self    ):
+        '''Pickles the params values and ``EasyObj_SLOTS`` as a tuple, ordered as the schema names.
+
+            Other attributes are pickled as a dict, the cached hash of frozen objects is not.
+        '''
+        my_type = type(self)
+        schema  = my_type.__dict__.get('_EasyObj_SCHEMA') or my_type._g_schema()
+        try                     :
+            values  = schema.g_all_values(self)
+            state   = {}
+        except  AttributeError  :
+            #Some state attributes are not set
+            values  = schema.g_values(self)
+            state   = {
+                name: getattr(self, name) for name in schema.state_names if hasattr(self, name)}
+        
+        #Other attributes
+        dict_   = getattr(self, '__dict__', None)
+        if      dict_ and (
+                    not schema.is_dict                                                      or \
+                    len(dict_)- ('_EasyObj_hash' in dict_) > len(values)+ len(state)    )   :
+            state.update({
+                k: v for k, v in dict_.items() if k not in schema.all_names_set and k not in _NOT_STATE})
+        if      state   :
+            return _c_easyObj, (my_type, values, state)
+        return _c_easyObj, (my_type, values)
+    def to_bytes    (
+        self            ,
+        buffers = None  ):
+        '''Pickles the object with ``PICKLE_PROTOCOL``.
+
+            Args:
+                buffers (list   ): If provided, the out-of-band buffers (``pickle.PickleBuffer`` 
+                    values) are appended to it instead of being copied into the result.
+
+            Returns:
+                bytes   : The pickled object.
+        '''
+        return pickle.dumps(
+            self                                                    ,
+            protocol        = PICKLE_PROTOCOL                       ,
+            buffer_callback = None if buffers is None else buffers.append)
+    @classmethod
+    def from_bytes  (
+        cls             ,
+        data            ,
+        buffers = None  ):
+        '''Unpickles an object created by ``to_bytes``.
+
+            Args:
+                data    (bytes          ): The pickled object.
+                buffers (Iterable       ): The out-of-band buffers, as returned by ``to_bytes``.
+
+            Returns:
+                EasyObj : The object.
+
+            Raises:
+                TypeError   : If the object is not an instance of the class.
+        '''
+        obj = pickle.loads(data, buffers= buffers)
+        if      not isinstance(obj, cls)    :
+            raise TypeError(f'Expected {cls.__name__}, got {type(obj).__name__}.')
+        return obj
 
     def _on_init            (
         self    ):
@@ -434,7 +1407,67 @@ class EasyObj   :
         pass
     def _g_easyObj_values   (
         self    ):
-        return {k: getattr(self, k) for k in self._g_all_params().keys()}
+        return {k: getattr(self, k) for k in self._g_schema().names}
+
+def slotted (
+    cls ):
+    '''Rebuilds an `EasyObj` class with ``__slots__``.
+
+        A class decorator, the slots are the merged ``EasyObj_PARAMS`` and ``EasyObj_SLOTS`` of 
+        all the classes in the mro, minus the ones already declared by the bases.
+        Instances have no ``__dict__`` only if all the bases are slotted too.
+
+        Example:
+            >>> @slotted
+            >>> class A(EasyObj):
+            >>>     EasyObj_PARAMS  = OrderedDict((
+            >>>         ('name'     , {'default': 'Sal' }),))
+            >>>     EasyObj_SLOTS   = ('age',)
+            >>>     def _on_init(self):
+            >>>         self.age    = 20
+
+        Args:
+            cls (type   ): The class to rebuild.
+
+        Returns:
+            type    : The slotted class.
+    '''
+    names       = []
+    inherited   = set()
+    for type_ in reversed(getmro(cls))  :
+        names  += list(type_.__dict__.get('EasyObj_PARAMS'  , ()))
+        names  += list(type_.__dict__.get('EasyObj_SLOTS'   , ()))
+    if      getattr(cls, 'EasyObj_IS_FROZEN', False)    :
+        names.append('_EasyObj_hash')
+    for type_ in getmro(cls)[1:]        :
+        inherited.update(type_.__dict__.get('__slots__', ()))
+        if      '__dict__' in type_.__dict__    :
+            inherited.add('__dict__')
+    
+    ns  = dict(cls.__dict__)
+    for name in ['__dict__', '__weakref__', '_EasyObj_SCHEMA']  :
+        ns.pop(name, None)
+    if      getattr(ns.get('__init__'), '_EasyObj_IS_GENERATED', False) :
+        ns.pop('__init__')
+    ns['__slots__'] = tuple(OrderedDict.fromkeys(
+        name for name in names if name not in inherited))
+
+    slotted_cls                 = type(cls)(cls.__name__, cls.__bases__, ns)
+    slotted_cls.__qualname__    = cls.__qualname__
+    TYPE_REGISTRY.register(slotted_cls)
+    #Methods using super() without args reference the class in a __class__ cell
+    for value in ns.values()    :
+        value   = getattr(value, '__func__', value)
+        if      isinstance(value, property) :
+            value   = value.fget
+        if      not getattr(value, '__closure__', None)    :
+            continue
+        for name, cell in zip(value.__code__.co_freevars, value.__closure__):
+            if      name == '__class__' :
+                cell.cell_contents  = slotted_cls
+    return slotted_cls
+
+TYPE_REGISTRY.register(EasyObj)
 
 class AutoObj   :
     def __init__(
@@ -3,7 +3,10 @@
     Logging utility and exception handling.
     
     Notes:
-        * This module offers multiple logging options (console, files, csv, sql database).
+        * This module offers multiple logging options (console, files, csv, JSON lines, sql database).
+        * The text of the console and file loggers is set by their ``formatter``, see ``Formatter``.
+        * ``MultiLogger`` writes the same logs to many loggers with a single queue.
+        * ``JsonLogger`` files are indexed by time and read back with ``read_json_logs``.
         * All the loggers do share the same interface and can be used interchangeably.
         * A simple wrapper for exception handling with many features.
         * After calling ``logger.start``, a thread is created for logging, ``logger.stop()`` 
@@ -11,6 +14,10 @@
           care of stoping all runing loggers on ``sys.exit``.
         * Since the logging is done on a separate thread, this works well with multi-threaded 
           applications, only a single thread is responsible for writing the logs.
+        * Coroutines can use ``alog``, ``aflush`` and ``astop`` which never block the event loop, 
+          ``AsyncLogger`` writes the logs from a task on the event loop instead of a thread.
+        * Many loggers can share the threads of a ``LogPool`` instead of a thread each.
+        * ``Logger.stats`` returns the queue depth, throughput, latency and errors of a logger.
 
     Examples:
         Simple Logger usage:
@@ -129,25 +136,26 @@
             ..........
             .....
 '''
-from    sqlalchemy.ext.declarative  import  declarative_base
-from    sqlalchemy                  import  Column          , Integer   , String    , Text  , UnicodeText
-from    sqlalchemy.exc              import  OperationalError
-from    sqlalchemy.orm              import  sessionmaker
 from    functools                   import  wraps   , reduce
 from    collections                 import  OrderedDict
 from    collections.abc             import  Callable
 from    datetime                    import  datetime
-from    threading                   import  Thread
+from    time                        import  time_ns
+from    threading                   import  Thread  , Lock  , Event   , get_ident
 from    enum                        import  Enum
 
-from    .common                     import  EasyObj             , DummyObj
+from    .common                     import  EasyObj             , DummyObj  , TYPE_REGISTRY
 from    .misc                       import  SQLAlchemyEBuilder  , g_path
 
 import  traceback
 import  textwrap
+import  re
+import  pickle
+import  json
 import  inspect
 import  atexit
 import  queue
+import  time
 import  sys
 import  csv
 import  os
@@ -164,6 +172,47 @@ class Level(Enum):
     WARN        = 3
     ERROR       = 4
     CRITICAL    = 5
+class OverflowPolicy(Enum):
+    '''What to do with a log when the logger queue is full.
+    '''
+    #Wait for the logging thread for up to ``block_timeout`` seconds, then drop the log.
+    BLOCK       = 0
+    #Drop the log.
+    DROP_NEWEST = 1
+    #Drop the oldest log in the queue.
+    DROP_OLDEST = 2
+    #Keep one log out of ``sample_rate`` as in ``BLOCK``, drop the others.
+    SAMPLE      = 3
+
+def _log_no_op  (
+    x                   ,
+    is_one_line = None  ,
+    is_raw      = False ):
+    '''Replaces the logging methods of disabled levels, see ``Logger.set_level``.
+    '''
+    pass
+
+def g_fingerprint   (
+    level       ,
+    log_dict    ):
+    '''The default rate limit key of a log, see ``Logger.rate_limit``.
+
+        Exception logs of ``handle_exception`` are keyed by origin, type and line, string logs by 
+        value, other logs are not limited.
+
+        Args:
+            level   (Level  ): The logging level.
+            log_dict(dict   ): The logging dict.
+        Returns:
+            tuple   : The key, None if the log is not limited.
+    '''
+    if      isinstance(log_dict, dict)  :
+        if      'Origin' in log_dict and 'Type' in log_dict :
+            return (level, log_dict['Origin'], log_dict['Type'], log_dict.get('Line'))
+        return None
+    if      isinstance(log_dict, str)   :
+        return (level, log_dict)
+    return None
 
 class Logger        (EasyObj        ):
     '''Logger base.
@@ -173,27 +222,111 @@ class Logger        (EasyObj        ):
         Args:
             id_         (str)   : The id of the logger, must be unique when running multiple loggers.
             is_print_log(bool)  : Prints the log on the console if True.
+            level       (Level) : Logs of a lower level are ignored, see ``set_level``.
+            batch_size  (int)   : Max number of logs taken from the queue at once by the logging thread.
+            flush_records   (int    ): Max number of logs written and not flushed.
+            flush_interval  (float  ): Max number of seconds a written log is not flushed.
+            flush_level     (Level  ): Logs of this level or higher are flushed immediately, None to disable.
+            capacity        (int            ): Max number of logs in the queue, 0 for no limit.
+            overflow_policy (OverflowPolicy ): What to do with a log when the queue is full.
+            block_timeout   (float          ): Max number of seconds to wait for the queue, None to wait forever.
+            sample_rate     (int            ): One log out of ``sample_rate`` is kept by ``OverflowPolicy.SAMPLE``.
+            dropped_interval(float          ): Min number of seconds between two dropped logs reports.
+            ts_precision    (int            ): Number of digits of the timestamps fraction of second, 
+                see ``TimestampFormatter``.
+            rate_limit          (float      ): Max number of logs per second with the same fingerprint, 
+                0 for no limit, see ``_is_allowed``.
+            rate_burst          (int        ): Max number of logs with the same fingerprint at once.
+            fingerprint         (Callable   ): ``fingerprint(level, log_dict)``, the rate limit key of a log, 
+                None to never limit it. ``g_fingerprint`` if None.
+            suppressed_interval (float      ): Min number of seconds between two suppressed logs reports.
+            pool                (LogPool    ): Writes the logs with the shared threads of the pool instead 
+                of a thread per logger, None for a thread.
+            is_stats            (bool       ): Measures the logger, see ``stats``.
+            stats_interval      (float      ): Number of seconds between two stats logs, 0 for none, 
+                enables ``is_stats``.
     '''
     
     LIVE_LOGGERS    = []
+    #Set in child processes by LogChannel.attach, loggers started in the process forward their logs to it.
+    CHANNEL         = None
     EasyObj_PARAMS          = OrderedDict((
         ('id_' , {
-            'default': 'sal-logger' },),))
+            'default': 'sal-logger' },),
+        ('level'        , {
+            'default'   : Level.DEBUG   ,
+            'type'      : Level         },),
+        ('batch_size'   , {
+            'default'   : 256   ,
+            'type'      : int   },),
+        ('flush_records'    , {
+            'default'   : 1     ,
+            'type'      : int   },),
+        ('flush_interval'   , {
+            'default'   : 0.0   ,
+            'type'      : float },),
+        ('flush_level'      , {
+            'default'   : None  ,
+            'type'      : Level },),
+        ('capacity'         , {
+            'default'   : 0     ,
+            'type'      : int   },),
+        ('overflow_policy'  , {
+            'default'   : OverflowPolicy.BLOCK  ,
+            'type'      : OverflowPolicy        },),
+        ('block_timeout'    , {
+            'default'   : None  ,
+            'type'      : float },),
+        ('sample_rate'      , {
+            'default'   : 10    ,
+            'type'      : int   },),
+        ('dropped_interval' , {
+            'default'   : 10.0  ,
+            'type'      : float },),
+        ('ts_precision'     , {
+            'default'   : 6     ,
+            'type'      : int   },),
+        ('rate_limit'       , {
+            'default'   : 0.0   ,
+            'type'      : float },),
+        ('rate_burst'       , {
+            'default'   : 10    ,
+            'type'      : int   },),
+        ('fingerprint'      , {
+            'default'   : None  },),
+        ('suppressed_interval'  , {
+            'default'   : 10.0  ,
+            'type'      : float },),
+        ('pool'             , {
+            'default'   : None  },),
+        ('is_stats'         , {
+            'default'   : False ,
+            'type'      : bool  },),
+        ('stats_interval'   , {
+            'default'   : 0.0   ,
+            'type'      : float },),))
     
+    def __new__             (
+        cls     ,
+        *args   ,
+        **kwargs):
+        '''Creates a logger of the type ``kwargs['type']`` if provided.
+
+            The type is a logger class name from this module, a fqn or an alias, see 
+            `saltools.common.TypeRegistry`.
+        '''
+        if      not len(args) and 'type' in kwargs :
+            cls = TYPE_REGISTRY.g_type(kwargs['type'], __name__)
+        return super().__new__(cls)
     @classmethod            
     def _EasyObj_parser     (
         cls     ,
         *args   ,
         **kwargs):
-        if      len(args)               \
-                or 'type' not in kwargs :
-            rv  = args, kwargs
-        else                            :
-            type_   = globals().get(kwargs['type'])
+        #The type is selected by __new__
+        if      not len(args) and 'type' in kwargs :
             del kwargs['type']
-            rv      = type_(*args, **kwargs)
-        
-        return rv
+        return args, kwargs
     
     @staticmethod
     @atexit.register
@@ -219,37 +352,402 @@ class Logger        (EasyObj        ):
 
     def _on_init    (
         self    ):
-        self._queue     = queue.Queue()
-        self.is_alive   = False
-
-        for level in Level :
-            setattr(
-                self                            , 
-                level.name.lower()              , 
-                lambda                      \
-                    x                       ,\
-                    l           = level     ,
-                    is_one_line = None      ,
-                    is_raw      = False     :\
-                    self.log(
-                        l           , 
-                        x           , 
-                        is_one_line ,
-                        is_raw      ) )   
+        self._queue         = queue.Queue(self.capacity) if self.pool is None else self.pool.c_queue(self)
+        self.is_alive       = False
+        #Overflow counters, updated under _overflow_lock
+        self._overflow_lock = Lock()
+        self.n_dropped      = 0
+        self.n_blocked      = 0
+        self._n_overflows   = 0
+        #Dropped logs reported by the logging thread
+        self._n_reported    = 0
+        self._last_report   = time.monotonic()
+        #Number of logs written and not flushed, used by the logging thread only
+        self._n_pending     = 0
+        self._last_flush    = time.monotonic()
+        #First flush error since the last flush requests, see _try_flush
+        self._flush_error   = None
+        #MultiLogger this logger is a sink of, notified of level changes
+        self._composite     = None
+        #The logs timestamps are captured in ns and formatted by the logging thread
+        self._ts_formatter  = TimestampFormatter(self.ts_precision)
+        #Token buckets by fingerprint, [tokens, last update, suppressed, first suppressed, level], 
+        #accessed under the lock of the fingerprint stripe
+        self._fingerprint       = self.fingerprint or g_fingerprint
+        self._buckets           = {}
+        self._rate_locks        = [Lock() for i in range(16)]
+        self._is_suppressed     = False
+        self._last_suppressed   = time.monotonic()
+        self.n_suppressed       = 0
+        #Stats, updated by the logging thread if is_stats, see stats
+        self.is_stats           = self.is_stats or bool(self.stats_interval)
+        self.n_written          = 0
+        self.n_errors           = 0
+        self.last_error         = None
+        self.max_queue_depth    = 0
+        self.write_time         = 0.0
+        #Enqueue to write latencies, the count of bucket i is for [2**(i-1), 2**i) microseconds
+        self._latencies         = [0]* 32
+        self._started_at        = time.monotonic()
+        self._last_stats        = time.monotonic()
+        self._n_stats_written   = 0
+        self.set_level(self.level)
+    def set_level   (
+        self    ,
+        level   ):
+        '''Sets the min logging level.
+
+            The ``debug``, ``info`` ... methods of lower levels are replaced by no-op functions, 
+            can be called at any time.
+
+            Args:
+                level   (Level | str    ): The level or its name.
+        '''
+        level                   = Level[level.upper()] if isinstance(level, str) else level
+        self.level              = level
+        self._disabled_levels   = tuple(level_ for level_ in Level if level_.value < level.value)
+        for level_ in Level :
+            if      level_.value < level.value  :
+                method  = _log_no_op
+            else                                :
+                method  = (
+                    lambda                      \
+                        x                       ,\
+                        l           = level_    ,
+                        is_one_line = None      ,
+                        is_raw      = False     :\
+                        self.log(
+                            l           , 
+                            x           , 
+                            is_one_line ,
+                            is_raw      ))
+            setattr(self, level_.name.lower(), method)
+        if      self._composite is not None :
+            self._composite._on_sink_level()
     def _loop       (
         self    ):
         '''Logging loop.
 
-            Keeps looping!
+            Keeps looping! Drains up to ``batch_size`` logs at once, ``_flush`` is called 
+            after ``flush_records`` logs, ``flush_interval`` seconds or a log of level ``flush_level`` 
+            or higher, whichever comes first, on ``flush`` requests and when the logger is stopped.
         '''
-        while True:
-            item = self._queue.get()
-            if      item == None:
-                break
-            else                :
-                self._execute_log(*item)
+        is_stop = False
+        while not is_stop:
+            try                 :
+                items   = [self._queue.get(timeout= self._g_timeout())]
+            except  queue.Empty :
+                items   = []
+            is_stop = self._step(items)
+        self._try_close()
           
         self.info('Logger stopped!')
+    def _step       (
+        self    ,
+        items   ):
+        '''One turn of the logging loop, writes a batch and flushes if due.
+
+            Args:
+                items   (list   ): Items already taken from the queue.
+            Returns:
+                bool    : True if the logger is stopped.
+        '''
+        logs, futures, is_stop  = self._g_batch(items)
+        logs                   += self._g_dropped(is_stop)+ self._g_suppressed(is_stop)+ self._g_stats()
+        if      logs                :
+            self._execute_logs(logs)
+        elif    self._n_pending     :
+            self._try_flush()
+        if      futures             :
+            self._try_flush()
+            self._set_flushed(futures, self._pop_flush_error())
+        return is_stop
+    def _g_batch    (
+        self    ,
+        items   ):
+        '''Drains up to ``batch_size`` items from the queue, called by the logging thread.
+
+            Args:
+                items   (list   ): The items already taken from the queue.
+            Returns:
+                list    : The logs before the stop signal.
+                list    : The flush requests, see ``flush``.
+                bool    : True if the stop signal was received.
+        '''
+        while len(items) < self.batch_size  :
+            try                 :
+                items.append(self._queue.get_nowait())
+            except  queue.Empty :
+                break
+        #The logs are lists, the flush requests futures
+        futures = [item for item in items if item.__class__ is not list and item is not None]
+        if      futures         :
+            items   = [item for item in items if item.__class__ is list or item is None]
+        is_stop = None in items
+        if      is_stop         :
+            items   = items[:items.index(None)]
+        return items, futures, is_stop
+    def _set_flushed(
+        self            ,
+        futures         ,
+        error   = None  ):
+        '''Notifies the flush requests, called by the logging thread after flushing.
+
+            Args:
+                futures (list       ): The flush requests.
+                error   (Exception  ): If provided, the requests fail with it.
+        '''
+        for future in futures   :
+            #False if the waiter gave up
+            if      not future.set_running_or_notify_cancel()   :
+                continue
+            if      error is None   :
+                future.set_result(None)
+            else                    :
+                future.set_exception(error)
+    def _try_flush  (
+        self    ):
+        '''Calls ``_flush``, called by the logging thread.
+
+            A failed flush is counted by ``_on_error`` and not retried, its logs are lost and 
+            the next flush requests fail with its error, see ``_pop_flush_error``.
+        '''
+        try                     :
+            self._flush()
+        except  Exception as e  :
+            self._on_flush_error(e)
+    def _on_flush_error (
+        self    ,
+        e       ):
+        '''Counts a flush error and resets the flush counters, see ``_try_flush``.
+        '''
+        self._on_error(e)
+        self._flush_error   = e
+        Logger._flush(self)
+    def _pop_flush_error(
+        self    ):
+        '''The first flush error since the last flush requests, None if none.
+        '''
+        error               = self._flush_error
+        self._flush_error   = None
+        return error
+    def _try_close  (
+        self    ):
+        '''Calls ``_close``, called by the logging thread, errors are counted by ``_on_error``.
+        '''
+        try                     :
+            self._close()
+        except  Exception as e  :
+            self._on_error(e)
+    def _is_flush_due   (
+        self    ,
+        items   ):
+        '''Counts the written logs and checks the flush policy, called by the logging thread.
+
+            Args:
+                items   (list   ): The logs just written.
+            Returns:
+                bool    : True if ``_flush`` must be called.
+        '''
+        self._n_pending    += len(items)
+        return  self._n_pending >= self.flush_records                                   or \
+                time.monotonic()- self._last_flush >= self.flush_interval               or \
+                (   self.flush_level is not None                                        and \
+                    any(item[0].value >= self.flush_level.value for item in items)  )
+    def _execute_logs   (
+        self    ,
+        items   ):
+        '''Write a batch of logs.
+
+            Called by the logging thread with the logs taken from the queue at once, calls 
+            ``_write_logs``.
+
+            Args:
+                items   (list   ): The ``_execute_log`` args of each log, ns timestamps.
+        '''
+        if      self.is_stats   :
+            self._count_latencies(items)
+        self._write_logs(items)
+    def _write_logs     (
+        self    ,
+        items   ):
+        '''Write a batch of logs.
+
+            Calls ``_execute_log`` for each log with its formatted timestamp then ``_flush`` if 
+            needed, never raises, the errors are counted and the log is skipped, see ``stats`` 
+            and ``_try_flush``.
+
+            Args:
+                items   (list   ): The ``_execute_log`` args of each log, ns timestamps.
+        '''
+        start       = time.perf_counter()
+        format_ts   = self._ts_formatter.format
+        for item in items   :
+            try                     :
+                self._execute_log(item[0], item[1], format_ts(item[2]), item[3], item[4])
+            except  Exception as e  :
+                self._on_error(e)
+        try                     :
+            self._after_batch(items)
+        except  Exception as e  :
+            self._on_error(e)
+        if      self._is_flush_due(items)   :
+            self._try_flush()
+        if      self.is_stats   :
+            self.n_written     += len(items)
+            self.write_time    += time.perf_counter()- start
+    def _on_error       (
+        self    ,
+        e       ):
+        '''Counts an error raised while writing or flushing logs, called by the logging thread.
+        '''
+        self.n_errors  += 1
+        self.last_error = f'{type(e).__name__}: {e}'
+    def _count_latencies(
+        self    ,
+        items   ):
+        '''Counts the enqueue to write latencies and the queue depth, called by the logging thread.
+
+            Args:
+                items   (list   ): The logs taken from the queue, timestamps not formatted yet.
+        '''
+        now         = time_ns()
+        latencies   = self._latencies
+        for item in items   :
+            latencies[min(((now- item[2])// 1000).bit_length(), 31)] += 1
+        depth       = self._queue.qsize()+ len(items)
+        if      depth > self.max_queue_depth    :
+            self.max_queue_depth    = depth
+    def _after_batch    (
+        self    ,
+        items   ):
+        '''Called by the logging thread after each batch of logs is written, does nothing by default.
+
+            Args:
+                items   (list   ): The logs just written, ns timestamps.
+        '''
+        pass
+    def _g_timeout  (
+        self    ):
+        '''Max number of seconds the logging thread waits for a log before calling ``_flush``.
+
+            Returns:
+                float   : The timeout, None to wait forever.
+        '''
+        timeouts    = []
+        if      self._n_pending                     :
+            timeouts.append(self._g_flush_deadline())
+        if      self.n_dropped > self._n_reported   :
+            timeouts.append(self._last_report+ self.dropped_interval)
+        if      self._is_suppressed                 :
+            timeouts.append(self._last_suppressed+ self.suppressed_interval)
+        if      self.stats_interval                 :
+            timeouts.append(self._last_stats+ self.stats_interval)
+        if      not timeouts    :
+            return None
+        return max(min(timeouts)- time.monotonic(), 0)
+    def _g_flush_deadline   (
+        self    ):
+        '''When the written logs must be flushed by, ``time.monotonic`` time.
+        '''
+        return self._last_flush+ self.flush_interval
+    def _g_dropped  (
+        self                ,
+        is_force    = False ):
+        '''Reports the number of logs dropped since the last report, called by the logging thread.
+
+            Reports at most once every ``dropped_interval`` seconds unless ``is_force``.
+
+            Returns:
+                list    : The report log, empty if there is nothing to report.
+        '''
+        n_dropped   = self.n_dropped
+        if      n_dropped == self._n_reported                                               or \
+                (not is_force and time.monotonic()- self._last_report < self.dropped_interval)  :
+            return []
+        log                 = [
+            Level.WARN                                                      ,
+            {'Logs dropped': f'{n_dropped- self._n_reported} logs dropped'} ,
+            time_ns()                                                       ,
+            None                                                            ,
+            False                                                           ]
+        self._n_reported    = n_dropped
+        self._last_report   = time.monotonic()
+        return [log]
+    def _g_stats    (
+        self    ):
+        '''The stats log, every ``stats_interval`` seconds, called by the logging thread.
+
+            Returns:
+                list    : The stats log, empty if it is not due.
+        '''
+        now     = time.monotonic()
+        if      not self.stats_interval or now- self._last_stats < self.stats_interval :
+            return []
+        stats   = self.stats()
+        del stats['latency_us']
+        n_written               = stats['n_written']- self._n_stats_written
+        stats['records_per_sec']= round(n_written/ (now- self._last_stats), 1)
+        log                     = [
+            Level.INFO                                                                          ,
+            {'Logger stats': f'{n_written} logs written in the last {now- self._last_stats:.1f} seconds', 
+                **stats}                                                                        ,
+            time_ns()                                                                           ,
+            None                                                                                ,
+            False                                                                               ]
+        self._n_stats_written   = stats['n_written']
+        self._last_stats        = now
+        return [log]
+    def _g_suppressed   (
+        self                ,
+        is_force    = False ):
+        '''Reports the logs suppressed by ``rate_limit`` by fingerprint, called by the logging thread.
+
+            Reports at most once every ``suppressed_interval`` seconds unless ``is_force``, the buckets 
+            of the fingerprints not logged recently are removed.
+
+            Returns:
+                list    : The report logs, a log per fingerprint with suppressed logs.
+        '''
+        now     = time.monotonic()
+        if      not self._buckets                                                               or \
+                (not is_force and now- self._last_suppressed < self.suppressed_interval)            :
+            return []
+        self._last_suppressed   = now
+        self._is_suppressed     = False
+        logs                    = []
+        for key, bucket in list(self._buckets.items())  :
+            with self._rate_locks[hash(key)& 15]    :
+                n, since, level = bucket[2], bucket[3], bucket[4]
+                bucket[2]       = 0
+                #Full bucket, same as a new one
+                if      not n and bucket[0]+ (now- bucket[1])* self.rate_limit >= self.rate_burst   :
+                    del self._buckets[key]
+            if      n   :
+                self.n_suppressed  += n
+                logs.append([
+                    level                                                                               ,
+                    {
+                        'Logs suppressed'   : 
+                            f'Suppressed {n} identical records in the last {now- since:.1f} seconds'    ,
+                        'Fingerprint'       : str(key)                                                  },
+                    time_ns()                                                                           ,
+                    None                                                                                ,
+                    False                                                                               ])
+        return logs
+    def _flush      (
+        self    ):
+        '''Flushes the written logs, called by the logging thread.
+
+            Derived classes must call ``super()._flush()`` after flushing.
+        '''
+        self._n_pending     = 0
+        self._last_flush    = time.monotonic()
+    def _close      (
+        self    ):
+        '''Flushes and releases the logger resources, called by the logging thread when stopped.
+        '''
+        self._flush()
     def _execute_log(
             self            , 
             level           , 
@@ -287,13 +785,144 @@ class Logger        (EasyObj        ):
                 level   (Level) : The logging level.
                 log_dict(dict)  : The logging dict.
         '''
+        if      level in self._disabled_levels                                      or \
+                (self.rate_limit and not self._is_allowed(level, log_dict))             :
+            return
+        self._put([
+            level                           ,
+            log_dict                        ,
+            time_ns()                       ,
+            is_one_line                     ,
+            is_raw                          ])
+    def _is_allowed     (
+        self        ,
+        level       ,
+        log_dict    ):
+        '''Applies ``rate_limit`` to a log, called by the producers.
+
+            A token bucket per fingerprint, refilled at ``rate_limit`` tokens per second up to 
+            ``rate_burst`` tokens, a log takes a token or is suppressed. The buckets are locked by 
+            stripes of fingerprints.
 
-        self._queue.put([
-                level                           ,
-                log_dict                        ,
-                datetime.now().isoformat()      ,
-                is_one_line                     ,
-                is_raw                          ])
+            Returns:
+                bool    : True if the log is allowed.
+        '''
+        key     = self._fingerprint(level, log_dict)
+        if      key is None :
+            return True
+        now     = time.monotonic()
+        with self._rate_locks[hash(key)& 15]    :
+            bucket  = self._buckets.get(key)
+            if      bucket is None  :
+                self._buckets[key]  = [self.rate_burst- 1, now, 0, now, level]
+                return True
+            tokens      = min(self.rate_burst, bucket[0]+ (now- bucket[1])* self.rate_limit)
+            bucket[1]   = now
+            if      tokens >= 1 :
+                bucket[0]   = tokens- 1
+                return True
+            bucket[0]   = tokens
+            if      not bucket[2]   :
+                bucket[3]   = now
+            bucket[2]  += 1
+        self._is_suppressed = True
+        return False
+    def _put            (
+        self    ,
+        item    ):
+        '''Pushes an item to the logging queue, applies ``overflow_policy`` if full.
+
+            Args:
+                item    (list   ): The ``_execute_log`` args.
+        '''
+        if      not self.capacity   :
+            self._queue.put(item)
+            return
+        try                 :
+            self._queue.put_nowait(item)
+        except  queue.Full  :
+            self._put_overflow(item)
+    def _put_overflow   (
+        self    ,
+        item    ):
+        '''Applies ``overflow_policy`` to a log, the queue is full.
+
+            Args:
+                item    (list   ): The queue item.
+        '''
+        policy  = self.overflow_policy
+        with self._overflow_lock    :
+            self._n_overflows  += 1
+            is_sampled          = self._n_overflows % self.sample_rate == 0
+        
+        if      policy == OverflowPolicy.DROP_NEWEST                    or \
+                (policy == OverflowPolicy.SAMPLE and not is_sampled)        :
+            is_dropped  = True
+        elif    policy == OverflowPolicy.DROP_OLDEST    :
+            q           = self._queue
+            with q.mutex    :
+                #Never drop the stop signal or a flush request, the log is dropped if there are only those
+                for i, queued in enumerate(q.queue) :
+                    if      queued.__class__ is list    :
+                        del q.queue[i]
+                        #The queue hooks are called, see AsyncQueue
+                        q._put(item)
+                        q.not_empty.notify()
+                        break
+            #Either the oldest log or this one is dropped
+            is_dropped  = True
+        else                                            :
+            with self._overflow_lock    :
+                self.n_blocked += 1
+            try                 :
+                self._queue.put(item, timeout= self.block_timeout)
+                is_dropped  = False
+            except  queue.Full  :
+                is_dropped  = True
+        if      is_dropped  :
+            with self._overflow_lock    :
+                self.n_dropped += 1
+    def stats       (
+        self    ):
+        '''Live metrics of the logger, measured if ``is_stats``, can be called from any thread.
+
+            Returns:
+                dict    : 
+                    * queue_depth, max_queue_depth  : Number of logs in the queue, now and the max seen 
+                        by the logging thread.
+                    * n_written, records_per_sec    : Number of logs written, per second since started.
+                    * n_dropped, n_suppressed       : See ``overflow_policy`` and ``rate_limit``.
+                    * n_errors, last_error          : Errors raised while writing or flushing, see 
+                        ``_write_logs`` and ``_try_flush``.
+                    * write_time                    : Number of seconds spent writing.
+                    * latency_us                    : Number of logs by enqueue to write latency, keyed by 
+                        the upper bound in microseconds, powers of 2.
+                    * latency_p50_us, latency_p99_us: Latency percentiles, upper bounds.
+        '''
+        latencies   = self._latencies.copy()
+        n_latencies = sum(latencies)
+        percentiles = {50: 0, 99: 0}
+        for percentile in percentiles if n_latencies else []   :
+            n   = 0
+            for i, count in enumerate(latencies):
+                n  += count
+                if      n* 100 >= n_latencies* percentile   :
+                    percentiles[percentile] = 2** i
+                    break
+        elapsed     = time.monotonic()- self._started_at
+        return {
+            'queue_depth'       : self._queue.qsize()                                           ,
+            'max_queue_depth'   : self.max_queue_depth                                          ,
+            'n_written'         : self.n_written                                                ,
+            'records_per_sec'   : round(self.n_written/ elapsed, 1)                             ,
+            'n_dropped'         : self.n_dropped                                                ,
+            'n_suppressed'      : self.n_suppressed                                             ,
+            'n_errors'          : self.n_errors                                                 ,
+            'last_error'        : self.last_error                                               ,
+            'write_time'        : round(self.write_time, 6)                                     ,
+            'latency_us'        : {2** i: count for i, count in enumerate(latencies) if count}  ,
+            'latency_p50_us'    : percentiles[50]                                               ,
+            'latency_p99_us'    : percentiles[99]                                               }
     def start       (
         self    ):
         '''Start loging.
@@ -303,17 +932,32 @@ class Logger        (EasyObj        ):
         if      self.is_alive:
             return 
         
-        self.is_alive   = True
-        self._thread    = Thread(
-            name    = self.id_      , 
-            target  = self._loop    , 
-            daemon  = True          ) 
-        self._thread.start()
+        self.is_alive       = True
+        self._started_at    = time.monotonic()
+        self._last_stats    = time.monotonic()
+        if      Logger.CHANNEL is not None  :
+            #Child process, the logs are written by the parent process
+            self._queue     = Logger.CHANNEL.c_queue(self.id_)
+            self._thread    = None
+        else                                :
+            self._start_writer()
 
         self.info('Logger started!')
         
         if      self not in Logger.LIVE_LOGGERS :
             Logger.LIVE_LOGGERS.append(self)
+    def _start_writer   (
+        self    ):
+        '''Starts writing the logs, the logging thread (self._loop) by default.
+        '''
+        if      self.pool is not None   :
+            self._thread    = self.pool.register(self)
+            return
+        self._thread    = Thread(
+            name    = self.id_      , 
+            target  = self._loop    , 
+            daemon  = True          ) 
+        self._thread.start()
     def stop        (
         self    ):
         '''Stop!
@@ -327,19 +971,289 @@ class Logger        (EasyObj        ):
         
         #Wait for the logger to log the remaining logs
         self._queue.put(None)
-        self._thread.join()
+        if      self._thread is not None    :
+            self._thread.join()
         self.is_alive  = False 
 
         if self in Logger.LIVE_LOGGERS:
             Logger.LIVE_LOGGERS.remove(self)
     
+    async def alog  (
+        self                    ,         
+        level                   , 
+        log_dict                ,
+        is_one_line    = None   ,
+        is_raw         = False  ):
+        '''Log the logs from a coroutine.
+
+            Same as ``log`` but never blocks the event loop, if the queue is full and ``overflow_policy`` 
+            waits for it, the log is pushed from an executor thread.
+            
+            Args    :
+                level   (Level) : The logging level.
+                log_dict(dict)  : The logging dict.
+        '''
+        if      level in self._disabled_levels                                      or \
+                (self.rate_limit and not self._is_allowed(level, log_dict))             :
+            return
+        item    = [
+            level                           ,
+            log_dict                        ,
+            time_ns()                       ,
+            is_one_line                     ,
+            is_raw                          ]
+        try                 :
+            self._queue.put_nowait(item)
+        except  queue.Full  :
+            if      self.overflow_policy in (OverflowPolicy.BLOCK, OverflowPolicy.SAMPLE)    :
+                import  asyncio
+                await asyncio.get_running_loop().run_in_executor(None, self._put_overflow, item)
+            else                                                                            :
+                self._put_overflow(item)
+    def _c_flush    (
+        self    ):
+        '''Creates a flush request, pushed to the queue by ``flush`` and ``aflush``.
+
+            Returns:
+                concurrent.futures.Future   : Done when the logs pushed before it are flushed, None if 
+                    there is nothing to wait for.
+        '''
+        if      not self.is_alive                       :
+            return None
+        if      isinstance(self._queue, LogChannelQueue):
+            #Child process, the logs are written by the parent process
+            self._queue.channel.flush()
+            return None
+        #Imported on first use, as asyncio and multiprocessing, to keep the module fast to import
+        from    concurrent.futures  import  Future
+        return Future()
+    def flush       (
+        self            ,
+        timeout = None  ):
+        '''Waits for the logs pushed so far to be written and flushed.
+
+            Args:
+                timeout (float  ): Max number of seconds to wait, None to wait forever.
+        '''
+        future  = self._c_flush()
+        if      future is not None  :
+            self._queue.put(future)
+            future.result(timeout)
+    async def aflush(
+        self    ):
+        '''Waits for the logs pushed so far to be written and flushed, from a coroutine.
+        '''
+        import  asyncio
+        future  = self._c_flush()
+        if      future is None      :
+            return
+        try                 :
+            self._queue.put_nowait(future)
+        except  queue.Full  :
+            await asyncio.get_running_loop().run_in_executor(None, self._queue.put, future)
+        await asyncio.wrap_future(future)
+    async def astop (
+        self    ):
+        '''Stop from a coroutine.
+
+            Same as ``stop``, the logging thread is joined from an executor thread.
+        '''
+        import  asyncio
+        if      self.is_alive   :
+            await asyncio.get_running_loop().run_in_executor(None, self.stop)
+    
+class TimestampFormatter(EasyObj   ):
+    '''Formats the ns timestamps captured by ``Logger.log`` in local iso format, by the logging thread.
+
+        The date and time are formatted once per second, only the fraction of second is formatted 
+        for each log.
+
+        Args:
+            precision   (int    ): Number of digits of the fraction of second, 0 to 9.
+    '''
+    EasyObj_PARAMS  = OrderedDict((
+        ('precision'    , {
+            'default'   : 6     ,
+            'type'      : int   }),))
+
+    def _on_init    (
+        self    ):
+        if      not 0 <= self.precision <= 9    :
+            raise ValueError(f'Invalid timestamp precision {self.precision}.')
+        self._divisor   = 10** (9- self.precision)
+        self._pattern   = f'%s.%0{self.precision}d' if self.precision else '%s'
+        self._second    = None
+        self._prefix    = None
+    def format      (
+        self    ,
+        ts      ):
+        '''Formats a timestamp.
+
+            Args:
+                ts  (int    ): Nanoseconds since the epoch.
+            Returns:
+                str : The timestamp, ex: ``2020-01-01T00:00:00.000000``.
+        '''
+        second, ns  = divmod(ts, 1000000000)
+        if      second != self._second  :
+            self._second    = second
+            self._prefix    = datetime.fromtimestamp(second).strftime('%Y-%m-%dT%H:%M:%S')
+        if      not self.precision  :
+            return self._prefix
+        return self._pattern % (self._prefix, ns// self._divisor)
+class Formatter     (EasyObj        ):
+    '''Log formatter base, turns the logs of a ``ConsoleLogger`` into text.
+
+        Derived classes override ``format``. The prefix template is compiled once per logger and 
+        level, see ``g_prefix``.
+
+        Args:
+            template    (str    ): The prefix ``str.format`` template, fields: ``ts``, ``id`` and ``level``.
+    '''
+    EasyObj_PARAMS  = OrderedDict((
+        ('template'     , {
+            'default'   : '[{ts}][{id:<20}] [{level:<8}]: ' ,
+            'type'      : str                               }),))
+    
+    def _on_init    (
+        self    ):
+        #(head, tail) by (logger id, level), the timestamp goes in between
+        self._prefixes  = {}
+    def g_prefix    (
+        self            ,
+        id_             ,
+        level           ,
+        log_datetime    ):
+        '''The formatted prefix.
+
+            Args:
+                id_         (str    ): The logger id.
+                level       (Level  ): The log level.
+                log_datetime(str    ): The log date in iso format.
+            Returns:
+                str     : The prefix.
+        '''
+        prefix  = self._prefixes.get((id_, level))
+        if      prefix is None  :
+            parts   = self.template.format(ts= '\0', id= id_, level= level.name).split('\0', 1)
+            prefix  = (parts[0], parts[1] if len(parts) == 2 else None)
+            self._prefixes[(id_, level)]    = prefix
+        head, tail  = prefix
+        return head if tail is None else f'{head}{log_datetime}{tail}'
+    def format      (
+        self            ,
+        id_             ,
+        level           ,
+        log_dict        ,
+        log_datetime    ,
+        is_one_line     ,
+        is_raw          ):
+        '''Formats a log, called by the logging thread.
+
+            Args:
+                id_         (str            ): The logger id.
+                level       (Level          ): The log level.
+                log_dict    (dict | object  ): The log.
+                log_datetime(str            ): The log date in iso format.
+                is_one_line (bool           ): Format the log in a single line.
+                is_raw      (bool           ): No prefix.
+            Returns:
+                str     : The text.
+        '''
+        raise NotImplementedError()
+class TextFormatter (Formatter      ):
+    '''The default ``ConsoleLogger`` format.
+
+        One line: ``key, value`` pairs separated by ``|``. Multi-line: a line per key followed by the 
+        value wrapped to ``width`` characters, values which fit in a line are not wrapped, then the 
+        ``separator`` line.
+
+        Args:
+            width       (int    ): Max width of the wrapped value lines.
+            key_width   (int    ): Min width of the keys.
+            separator   (str    ): The line after each multi-line log.
+    '''
+    EasyObj_PARAMS  = OrderedDict((
+        ('width'        , {
+            'default'   : 100   ,
+            'type'      : int   }),
+        ('key_width'    , {
+            'default'   : 20    ,
+            'type'      : int   }),
+        ('separator'    , {
+            'default'   : '='* 120  ,
+            'type'      : str       }),))
+
+    def _on_init    (
+        self    ):
+        self._key_format    = f'\t{{:<{self.key_width}}}:'.format
+        self._wrapper       = textwrap.TextWrapper(
+            subsequent_indent   = '\t\t'        , 
+            initial_indent      = '\t\t'        , 
+            width               = self.width    , 
+            break_on_hyphens    = True          )
+        #Longest value which fits in a line after the indent
+        self._max_length    = self.width- 2
+    def _wrap       (
+        self    ,
+        message ):
+        #Same as the wrapper if the value fits: not empty, no special whitespace, no trailing space
+        if      0 < len(message) <= self._max_length and message.isprintable() and message[-1] != ' ' :
+            return '\n\t\t'+ message
+        return '\n'+ '\n'.join(self._wrapper.wrap(message))
+    def format      (
+        self            ,
+        id_             ,
+        level           ,
+        log_dict        ,
+        log_datetime    ,
+        is_one_line     ,
+        is_raw          ):
+        if      is_one_line :
+            text    = '|'.join([f'{k}, {v}' for k, v in log_dict.items()])  if\
+                        isinstance(log_dict, dict)                          else\
+                        str(log_dict) 
+            return text if is_raw else self.g_prefix(id_, level, log_datetime)+ text
+        if      not isinstance(log_dict, dict)    :
+            log_dict = {log_dict: ''}
+        key_format  = self._key_format
+        wrap        = self._wrap
+        text        = '\n'.join([key_format(k)+ wrap(str(v)) for k, v in log_dict.items()])
+        if      is_raw  :
+            return f'{text}\n{self.separator}'
+        return f'{self.g_prefix(id_, level, log_datetime)}\n{text}\n{self.separator}'
+class RawFormatter  (Formatter      ):
+    '''Raw passthrough, ``str(log_dict)``, no prefix.
+    '''
+    def format      (
+        self            ,
+        id_             ,
+        level           ,
+        log_dict        ,
+        log_datetime    ,
+        is_one_line     ,
+        is_raw          ):
+        return str(log_dict)
+
 class ConsoleLogger (Logger         ):
     '''Console logger.
         A simple console logger, prints the logs on console.
+
+        Args:
+            is_print_log    (bool       ): Prints the log on the console if True.
+            is_one_line     (bool       ): Default log format, one line or multi-line.
+            formatter       (Formatter  ): The logs format, ``TextFormatter()`` if None.
     '''
     EasyObj_PARAMS  = OrderedDict((
         ('is_print_log' , {'default': True }),
-        ('is_one_line'     , {'default': True })))
+        ('is_one_line'     , {'default': True }),
+        ('formatter'    , {
+            'default'   : None      ,
+            'type'      : Formatter }),))
+    def _on_init    (
+        self    ):
+        if      self.formatter is None  :
+            self.formatter  = TextFormatter()
     def _execute_log(
             self            , 
             level           , 
@@ -347,50 +1261,126 @@ class ConsoleLogger (Logger         ):
             log_datetime    ,
             is_one_line     ,
             is_raw          ):
-
-        is_one_line = is_one_line if is_one_line != None else self.is_one_line
-        prefix      = '' if is_raw else f'[{log_datetime}][{self.id_:<20}] [{level.name:<8}]: '
-        if      is_one_line    :
-            dict_text   = '|'.join([f'{k}, {v}' for k, v in log_dict.items()])  if\
-                            isinstance(log_dict, dict)                          else\
-                            str(log_dict) 
-            text        = f'{prefix}{dict_text}'
-        else                :
-            if      not isinstance(log_dict, dict)    :
-                log_dict = {log_dict: ''}
-            prefix          +='' if is_raw else '\n'
-            format_message  = lambda message: '\n'+ '\n'.join(textwrap.wrap(
-                        message                         , 
-                        subsequent_indent   = '\t\t'    , 
-                        initial_indent      = '\t\t'    , 
-                        width               = 100       , 
-                        break_on_hyphens    = True      )) 
-            dict_text       = '\n'.join([f'\t{k:<20}:{format_message(str(v))}' for k,v in log_dict.items()])
-            text            = f'{prefix}{dict_text}'+'\n'+'='*120
-
+        text    = self.formatter.format(
+            self.id_                                                    ,
+            level                                                       ,
+            log_dict                                                    ,
+            log_datetime                                                ,
+            is_one_line if is_one_line != None else self.is_one_line    ,
+            is_raw                                                      )
         if self.is_print_log    :
             print(text)
 
         return text
+class _SizedFile    ():
+    '''An open log file counting the encoded size of the data written, see ``FileLogger.max_bytes``.
+
+        ``tell`` flushes a text file, the size is counted instead, seeded from the file size as 
+        the file is opened in append mode.
+
+        Args:
+            file_   (file   ): The open file, text or binary.
+    '''
+    __slots__   = ('file_', 'size', 'encoding')
+
+    def __init__    (
+        self    ,
+        file_   ):
+        self.file_      = file_
+        self.size       = os.path.getsize(file_.name)
+        #None for binary files
+        self.encoding   = getattr(file_, 'encoding', None)
+    def write       (
+        self    ,
+        data    ):
+        if      self.encoding is None or data.isascii() :
+            self.size  += len(data)
+        else                                            :
+            self.size  += len(data.encode(self.encoding))
+        return self.file_.write(data)
+    def tell        (
+        self    ):
+        return self.size
+    def flush       (
+        self    ):
+        self.file_.flush()
+    def close       (
+        self    ):
+        self.file_.close()
 class FileLogger    (ConsoleLogger  ):
     '''Text file logger.
 
         Simple text file logger based on ``ConsoleLogger``, dumps the logs generated by ``ConsoleLogger`` to txt files.
 
+        Files are kept open while the logger is running and flushed as set by the ``Logger`` 
+        flush params.
+
+        After each batch, a file is rotated if it reached ``max_bytes`` or a multiple of 
+        ``rotate_interval`` seconds since the epoch, ``combined.log`` is renamed to 
+        ``combined.<datetime>.log``. Rotated files are compressed and pruned on a background thread.
+
         Args:
             root        (str    ): The root directory to save the logs, logs will be saved under 
                                   root/id_.
             is_overwrite   (bool   ): If True, always erase previous logs on instance creation.
             is_combine     (bool   ): If True, all levels are combined in one file ``combined.log``.
+            max_bytes       (int    ): Size of a file before it is rotated, 0 to disable.
+            rotate_interval (float  ): Seconds between time rotations, ex: 3600 for hourly files, 0 to disable.
+            backup_count    (int    ): Max number of rotated files kept per file, 0 for no limit.
+            max_age         (float  ): Max age in seconds of the rotated files, 0 for no limit.
+            compression     (str    ): Rotated files compression, ``gzip``, ``zstd`` (requires 
+                                       ``zstandard``) or None.
     '''
 
     EasyObj_PARAMS  = OrderedDict((
         ('is_overwrite' , {'default': False}),
         ('is_combine'   , {'default': True }),
-        ('root'         , {'default': '.'}  )))
+        ('root'         , {'default': '.'}  ),
+        ('flush_records'    , {
+            'default'   : 1000  ,
+            'type'      : int   }),
+        ('flush_interval'   , {
+            'default'   : 1.0   ,
+            'type'      : float }),
+        ('flush_level'      , {
+            'default'   : Level.ERROR   ,
+            'type'      : Level         }),
+        ('max_bytes'        , {
+            'default'   : 0     ,
+            'type'      : int   }),
+        ('rotate_interval'  , {
+            'default'   : 0.0   ,
+            'type'      : float }),
+        ('backup_count'     , {
+            'default'   : 0     ,
+            'type'      : int   }),
+        ('max_age'          , {
+            'default'   : 0.0   ,
+            'type'      : float }),
+        ('compression'      , {
+            'default'   : None  }),))
+    COMPRESSIONS    = {
+        'gzip'  : '.gz'     ,
+        'zstd'  : '.zst'    }
+    #Log files extension and open mode
+    EXT             = '.log'
+    FILE_MODE       = 'a'
+    #Extensions of the files kept next to a log file, renamed and removed with it
+    SIDECARS        = ()
     
     def _on_init    (
         self    ):
+        #Open files by path and their time rotation timestamps, used by the logging thread only
+        self._files         = {}
+        self._rotate_at     = {}
+        #Compresses and prunes the rotated files, created on the first rotation
+        self._rotator       = None
+        if      self.compression is not None and self.compression not in self.COMPRESSIONS :
+            raise ValueError(f'Unknown compression {self.compression}.')
+        if      self.compression == 'zstd'  :
+            #Optional dependency, fails early if missing
+            import  zstandard
+
         logs_path   = os.path.join(self.root, self.id_)
         #Check and create the root directory
         if not os.path.isdir(logs_path):
@@ -399,12 +1389,14 @@ class FileLogger    (ConsoleLogger  ):
         #Check all log levels files:
         if not self.is_combine and self.is_overwrite:
             for level in Level :
-                path    = os.path.join(logs_path, level.name+ '.log')
+                path    = os.path.join(logs_path, level.name+ self.EXT)
                 open(path, 'w').close()
+                self._remove_sidecars(path)
 
         elif self.is_combine and self.is_overwrite:
-            path    = os.path.join(logs_path, 'combined'+ '.log')
+            path    = os.path.join(logs_path, 'combined'+ self.EXT)
             open(path, 'w').close()
+            self._remove_sidecars(path)
     def _g_path     (
         self    , 
         level   ):
@@ -421,7 +1413,122 @@ class FileLogger    (ConsoleLogger  ):
         return os.path.join(
             self.root                                               , 
             self.id_                                                , 
-            ('combined' if self.is_combine else level.name)+ '.log' )
+            ('combined' if self.is_combine else level.name)+ self.EXT   )
+    def _g_file     (
+        self    ,
+        level   ):
+        '''The open file for ``level``.
+
+            Args:
+                level   (Level) : The log level.
+            
+            Returns:
+                file    : The file, opened on first use, a ``_SizedFile`` if ``max_bytes``.
+        '''
+        path    = self._g_path(level)
+        file_   = self._files.get(path)
+        if      file_ is None   :
+            file_               = open(path, self.FILE_MODE)
+            if      self.max_bytes  :
+                file_   = _SizedFile(file_)
+            self._files[path]   = file_
+            if      self.rotate_interval    :
+                self._rotate_at[path]   = (time.time()// self.rotate_interval+ 1)* self.rotate_interval
+        return file_
+    def _after_batch(
+        self    ,
+        items   ):
+        '''Rotates the files, the size is counted by ``_SizedFile``, no ``stat`` or ``tell`` call.
+        '''
+        if      not (self.max_bytes or self.rotate_interval)    :
+            return
+        now     = time.time()
+        for path, file_ in list(self._files.items()):
+            if      (self.max_bytes and file_.size >= self.max_bytes)                       or \
+                    (self.rotate_interval and now >= self._rotate_at[path])                     :
+                self._rotate(path)
+    def _rotate     (
+        self    ,
+        path    ):
+        '''Closes and renames the file at ``path``, then compresses and prunes in the background.
+
+            Args:
+                path    (str    ): The file path.
+        '''
+        self._files.pop(path).close()
+        self._rotate_at.pop(path, None)
+        
+        base, ext   = os.path.splitext(path)
+        stamp       = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+        rotated     = f'{base}.{stamp}{ext}'
+        n           = 0
+        while os.path.exists(rotated)   :
+            n      += 1
+            rotated = f'{base}.{stamp}-{n}{ext}'
+        os.rename(path, rotated)
+        for sidecar in self.SIDECARS    :
+            if      os.path.isfile(path+ sidecar)   :
+                os.rename(path+ sidecar, rotated+ sidecar)
+
+        if      self._rotator is None   :
+            from concurrent.futures import ThreadPoolExecutor
+            self._rotator   = ThreadPoolExecutor(1, f'{self.id_}-rotation')
+        self._rotator.submit(self._compress_prune, path, rotated).add_done_callback(self._on_rotated)
+    def _compress_prune (
+        self    ,
+        path    ,
+        rotated ):
+        '''Compresses ``rotated`` and applies ``backup_count`` and ``max_age`` to the rotated files of 
+            ``path``, on the rotation thread.
+        '''
+        if      self.compression is not None    :
+            import  shutil
+            compressed  = rotated+ self.COMPRESSIONS[self.compression]
+            if      self.compression == 'gzip'  :
+                import  gzip
+                c_file  = lambda : gzip.open(compressed+ '.tmp', 'wb')
+            else                                :
+                import  zstandard
+                c_file  = lambda : zstandard.open(compressed+ '.tmp', 'wb')
+            with open(rotated, 'rb') as src, c_file() as dst :
+                shutil.copyfileobj(src, dst, 1<< 20)
+            os.replace(compressed+ '.tmp', compressed)
+            os.remove(rotated)
+            #Sidecars do not apply to the compressed file
+            self._remove_sidecars(rotated)
+
+        if      not (self.backup_count or self.max_age) :
+            return
+        base, ext   = os.path.splitext(path)
+        root, name  = os.path.split(base)
+        suffixes    = tuple(ext+ suffix for suffix in ['']+ list(self.COMPRESSIONS.values()))
+        #Sorted by rotation date, oldest first
+        rotated_files   = sorted(
+            os.path.join(root, f) for f in os.listdir(root) if \
+                f.startswith(name+ '.') and f.endswith(suffixes) and f != name+ ext)
+        if      self.backup_count   :
+            expired         = rotated_files[:-self.backup_count]
+            rotated_files   = rotated_files[-self.backup_count:]
+        else                        :
+            expired         = []
+        if      self.max_age        :
+            min_mtime       = time.time()- self.max_age
+            expired        += [f for f in rotated_files if os.path.getmtime(f) < min_mtime]
+        for f in expired    :
+            os.remove(f)
+            self._remove_sidecars(f)
+    def _remove_sidecars(
+        self    ,
+        path    ):
+        for sidecar in self.SIDECARS    :
+            if      os.path.isfile(path+ sidecar)   :
+                os.remove(path+ sidecar)
+    def _on_rotated (
+        self    ,
+        future  ):
+        exc     = future.exception()
+        if      exc is not None :
+            self.error({'Rotation failed': f'{type(exc).__name__}: {exc}'})
     def _execute_log(
             self            , 
             level           , 
@@ -436,9 +1543,24 @@ class FileLogger    (ConsoleLogger  ):
             is_one_line ,
             is_raw      )
 
-        with open(self._g_path(level),'a') as f :
-            f.write(text+'\n')
+        self._g_file(level).write(text+'\n')
         return text
+    def _flush      (
+        self    ):
+        for file_ in self._files.values()   :
+            file_.flush()
+        super()._flush()
+    def _close      (
+        self    ):
+        super()._close()
+        for file_ in self._files.values()   :
+            file_.close()
+        self._files.clear()
+        self._rotate_at.clear()
+        if      self._rotator is not None   :
+            #Waits for the pending compressions
+            self._rotator.shutdown()
+            self._rotator   = None
 class CsvLogger     (FileLogger     ):
     '''Csv logger.
 
@@ -446,6 +1568,36 @@ class CsvLogger     (FileLogger     ):
         Check ``ConsoleLogger`` args.
     '''
             
+    def _on_init    (
+        self    ):
+        #Csv writers by path, used by the logging thread only
+        self._writers   = {}
+    def _g_writer   (
+        self    ,
+        level   ):
+        '''The csv writer for ``level``.
+
+            Args:
+                level   (Level) : The log level.
+            
+            Returns:
+                csv.writer  : The writer of the open file, see ``_g_file``.
+        '''
+        path    = self._g_path(level)
+        writer  = self._writers.get(path)
+        if      writer is None  :
+            writer              = csv.writer(self._g_file(level), lineterminator='\n')
+            self._writers[path] = writer
+        return writer
+    def _rotate     (
+        self    ,
+        path    ):
+        self._writers.pop(path, None)
+        super()._rotate(path)
+    def _close      (
+        self    ):
+        super()._close()
+        self._writers.clear()
     def _execute_log(
             self            , 
             level           , 
@@ -453,23 +1605,245 @@ class CsvLogger     (FileLogger     ):
             log_datetime    ,
             is_one_line     ,
             is_raw          ):
-        ConsoleLogger._execute_log(
-            self        ,
-            level       , 
-            log_dict    ,
-            log_datetime,
-            is_one_line ,
-            is_raw      )
+        if      self.is_print_log   :
+            ConsoleLogger._execute_log(
+                self        ,
+                level       , 
+                log_dict    ,
+                log_datetime,
+                is_one_line ,
+                is_raw      )
         if      not isinstance(log_dict, dict):
             log_dict    = {str(log_dict): ''}
-        with open(self._g_path(level),'a') as f :
-            writer = csv.writer(f, lineterminator='\n')
-            writer.writerows([[
-                    log_datetime        ,
-                    self.id_      ,
-                    level.name          ,
-                    key                 ,
-                    str(log_dict[key])  ] for key in log_dict])
+        self._g_writer(level).writerows([[
+                log_datetime        ,
+                self.id_            ,
+                level.name          ,
+                key                 ,
+                str(log_dict[key])  ] for key in log_dict])
+class JsonLogger    (FileLogger     ):
+    '''JSON lines logger.
+
+        Writes a JSON object per log to ``combined.jsonl`` or per level files: 
+        ``{"ts": <iso datetime>, "level": <level name>, "id": <logger id>, "payload": <log dict>}``, 
+        payloads which are not dicts are saved as strings, values which are not JSON serializable 
+        are converted with ``str``.
+
+        A sparse index is kept next to each file, ``<file>.idx``, with a line per block of up to 
+        ``index_interval`` logs: offset, size, min and max timestamps and levels of the block. 
+        The logs are read back with ``read_json_logs``.
+        Check ``FileLogger`` args.
+
+        Args:
+            index_interval  (int    ): Max number of logs per index block.
+    '''
+    EasyObj_PARAMS  = OrderedDict((
+        ('index_interval'   , {
+            'default'   : 256   ,
+            'type'      : int   }),))
+    EXT         = '.jsonl'
+    FILE_MODE   = 'ab'
+    SIDECARS    = ('.idx',)
+
+    def _on_init    (
+        self    ):
+        #Open index files and the current block of each file by path, used by the logging thread only
+        self._indexes   = {}
+        self._blocks    = {}
+        self._id_json   = json.dumps(self.id_)
+    def _execute_log(
+            self            , 
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          ):
+        if      self.is_print_log   :
+            ConsoleLogger._execute_log(
+                self        ,
+                level       , 
+                log_dict    ,
+                log_datetime,
+                is_one_line ,
+                is_raw      )
+        payload = json.dumps(
+            log_dict if isinstance(log_dict, dict) else str(log_dict)   , 
+            default = str                                               )
+        path    = self._g_path(level)
+        file_   = self._g_file(level)
+        block   = self._blocks.get(path)
+        if      block is None   :
+            #[offset, number of logs, min ts, max ts, levels mask]
+            block               = [file_.tell(), 0, log_datetime, log_datetime, 0]
+            self._blocks[path]  = block
+        file_.write(
+            f'{{"ts":"{log_datetime}","level":"{level.name}","id":{self._id_json},"payload":{payload}}}\n'.encode())
+        block[1]   += 1
+        if      log_datetime < block[2]     :
+            block[2]    = log_datetime
+        elif    log_datetime > block[3]     :
+            block[3]    = log_datetime
+        block[4]   |= 1<< level.value
+        if      block[1] >= self.index_interval :
+            self._index(path)
+    def _index      (
+        self    ,
+        path    ):
+        '''Adds the current block of the file at ``path`` to its index.
+        '''
+        block   = self._blocks.pop(path, None)
+        if      block is None   :
+            return
+        offset, n, min_ts, max_ts, mask = block
+        index   = self._indexes.get(path)
+        if      index is None   :
+            index               = open(path+ '.idx', 'a')
+            self._indexes[path] = index
+        index.write(f'{offset} {self._files[path].tell()- offset} {min_ts} {max_ts} {mask}\n')
+    def _rotate     (
+        self    ,
+        path    ):
+        self._index(path)
+        index   = self._indexes.pop(path, None)
+        if      index is not None   :
+            index.close()
+        super()._rotate(path)
+    def _flush      (
+        self    ):
+        for path in list(self._blocks)  :
+            self._index(path)
+        #The index is flushed after the logs it points to
+        super()._flush()
+        for index in self._indexes.values() :
+            index.flush()
+    def _close      (
+        self    ):
+        super()._close()
+        for index in self._indexes.values() :
+            index.close()
+        self._indexes.clear()
+
+def _g_json_segments(
+    path    ):
+    '''The ``JsonLogger`` files in ``path`` in rotation order, rotated files first.
+    '''
+    suffixes    = tuple(JsonLogger.EXT+ suffix for suffix in ['']+ list(JsonLogger.COMPRESSIONS.values()))
+    segments    = {}
+    for f in os.listdir(path)   :
+        if      not f.endswith(suffixes)    :
+            continue
+        stem            = f[:f.rindex(JsonLogger.EXT)]
+        base, _, stamp  = stem.partition('.')
+        #A file being compressed is listed twice, the compressed file is complete
+        if      stem not in segments or not f.endswith(JsonLogger.EXT) :
+            segments[stem]  = (base, not stamp, stamp, os.path.join(path, f))
+    return [segment[-1] for segment in sorted(segments.values())]
+def _g_json_lines   (
+    data    ,
+    begin   ,
+    end     ,
+    chunk   = 1<< 20):
+    '''Complete lines of ``data[begin:end]``, sliced ``chunk`` bytes at a time.
+    '''
+    while begin < end   :
+        stop    = data.rfind(b'\n', begin, min(begin+ chunk, end))
+        if      stop < 0    :
+            stop    = data.find(b'\n', begin, end)
+            if      stop < 0    :
+                #Incomplete last log, not flushed yet
+                return
+        yield data[begin: stop].split(b'\n')
+        begin   = stop+ 1
+def read_json_logs  (
+    path            ,
+    start   = None  ,
+    end     = None  ,
+    level   = None  ):
+    '''Reads the logs written by ``JsonLogger``.
+
+        Files are memory-mapped, the index blocks out of range are skipped and only the logs in 
+        range are decoded, the logs which are not indexed yet are scanned. Compressed files are 
+        decompressed as a stream.
+
+        Args:
+            path    (str                    ): A log file, or a ``JsonLogger`` directory (root/id_) to 
+                read all its files in rotation order.
+            start   (datetime.datetime | str): Min timestamp, None for no limit.
+            end     (datetime.datetime | str): Max timestamp, excluded, None for no limit.
+            level   (Level | str            ): Min level, None for all levels.
+
+        Yields:
+            dict    : The logs, ``ts``, ``level``, ``id`` and ``payload``.
+    '''
+    import  mmap
+    paths   = _g_json_segments(path) if os.path.isdir(path) else [path]
+    start   = (start.isoformat() if isinstance(start, datetime) else start).encode() if start else None
+    end     = (end.isoformat() if isinstance(end, datetime) else end).encode() if end else None
+    level   = Level[level.upper()] if isinstance(level, str) else level
+    levels  = [level_ for level_ in Level if level is None or level_.value >= level.value]
+    mask    = sum(1<< level_.value for level_ in levels)
+    names   = None if level is None else {level_.name.encode() for level_ in levels}
+
+    def g_logs  (
+        lines   ):
+        if      start is None and end is None and names is None    :
+            yield from map(json.loads, filter(None, lines))
+            return
+        #Timestamp and level are checked before decoding, '{"ts":"<ts>","level":"<level>"'
+        for line in lines   :
+            if      not line    :
+                continue
+            ts_end  = line.find(b'"', 7)
+            ts      = line[7: ts_end]
+            if      (start is not None and ts < start) or (end is not None and ts >= end)   :
+                continue
+            if      names is not None and line[ts_end+ 11: line.find(b'"', ts_end+ 11)] not in names :
+                continue
+            yield json.loads(line)
+
+    for path_ in paths  :
+        if      not os.path.isfile(path_)   :
+            #Compressed since listed
+            path_   = next((path_+ ext for ext in JsonLogger.COMPRESSIONS.values() if os.path.isfile(path_+ ext)), None)
+            if      path_ is None   :
+                continue
+        compression = next((c for c, ext in JsonLogger.COMPRESSIONS.items() if path_.endswith(ext)), None)
+        if      compression is not None :
+            if      compression == 'gzip'   :
+                import  gzip
+                f   = gzip.open(path_, 'rb')
+            else                            :
+                import  zstandard
+                f   = zstandard.open(path_, 'rb')
+            with f  :
+                yield from g_logs(f)
+            continue
+
+        if      not os.path.getsize(path_)  :
+            continue
+        blocks  = []
+        if      os.path.isfile(path_+ '.idx')   :
+            with open(path_+ '.idx') as f   :
+                for line in f   :
+                    offset, length, min_ts, max_ts, block_mask  = line.split()
+                    blocks.append((int(offset), int(length), min_ts.encode(), max_ts.encode(), int(block_mask)))
+        with open(path_, 'rb') as f, mmap.mmap(f.fileno(), 0, access= mmap.ACCESS_READ) as data  :
+            size        = len(data)
+            position    = 0
+            for offset, length, min_ts, max_ts, block_mask in blocks    :
+                if      offset+ length > size   :
+                    break
+                if      offset > position   :
+                    #Not indexed
+                    for lines in _g_json_lines(data, position, offset) :
+                        yield from g_logs(lines)
+                if      (start is None or max_ts >= start)  and \
+                        (end is None or min_ts < end)       and \
+                        block_mask & mask                       :
+                    yield from g_logs(data[offset: offset+ length].split(b'\n'))
+                position    = offset+ length
+            for lines in _g_json_lines(data, position, size)   :
+                yield from g_logs(lines)
 class SQLLogger     (ConsoleLogger  ):
     '''SQLAlchemy File logger
         
@@ -483,23 +1857,95 @@ class SQLLogger     (ConsoleLogger  ):
 
         If is_overwrite is set to true, the tables are deleted and created again on each run.
 
+        The logs are inserted in bulk and committed as set by the ``Logger`` flush params, 
+        by the logging thread only.
+
+        If ``is_normalized``, a row is inserted per log instead of per key in ``events_table``, which 
+        can be shared by many loggers: ``ts`` (datetime), ``level`` (``Level`` value), ``logger`` 
+        (logger id) and ``payload`` (JSON), indexed by (logger, level, ts) and ts, ``is_overwrite`` 
+        deletes the rows of the logger only. The logs are queried with ``query_logs``.
+
         Args:
             engine      (sqlalchemy.engine.base.Engine  ): The SQLAlchemy engine instance.
+            sqlite_pragmas  (dict   ): Pragmas set on the logging connection if the database is SQLite, 
+                ``SQLITE_PRAGMAS`` if None.
+            is_normalized   (bool   ): Use the events table.
+            events_table    (str    ): The events table name.
     '''
 
     EasyObj_PARAMS  = OrderedDict((
         ('is_overwrite'        , {'default': False},),
         ('is_combine'          , {'default': False},),
         ('engine_builder'   , {
-            'type'      : SQLAlchemyEBuilder    },),))
+            'type'      : SQLAlchemyEBuilder    },),
+        ('flush_records'    , {
+            'default'   : 1000  ,
+            'type'      : int   }),
+        ('flush_interval'   , {
+            'default'   : 1.0   ,
+            'type'      : float }),
+        ('flush_level'      , {
+            'default'   : Level.ERROR   ,
+            'type'      : Level         }),
+        ('sqlite_pragmas'   , {
+            'default'   : None  ,
+            'type'      : dict  }),
+        ('is_normalized'    , {
+            'default'   : False ,
+            'type'      : bool  }),
+        ('events_table'     , {
+            'default'   : 'log_events'  ,
+            'type'      : str           }),))
+    #Default sqlite_pragmas
+    SQLITE_PRAGMAS  = {
+        'journal_mode'  : 'WAL'     ,
+        'synchronous'   : 'NORMAL'  }
 
     def _on_init    (
         self    ):
+        self.sqlite_pragmas = dict(self.SQLITE_PRAGMAS if self.sqlite_pragmas is None else self.sqlite_pragmas)
+        for name in self.sqlite_pragmas :
+            #Pragma names can not be bound, optionally prefixed by a schema name
+            if      not re.fullmatch(r'(\w+\.)?\w+', name)   :
+                raise ValueError(f'Invalid pragma name {name!r}.')
+        #Imported on first use, sqlalchemy is slow to import
+        from    sqlalchemy.ext.declarative  import  declarative_base
+        from    sqlalchemy                  import  Column          , Integer   , String    , UnicodeText   ,\
+                                                    SmallInteger    , DateTime  , Index
+        from    sqlalchemy.dialects.mysql   import  DATETIME
+        from    sqlalchemy.exc              import  OperationalError
+
         super()._on_init()
+        #Rows not inserted yet by table, and the logging connection, used by the logging thread only
+        self._rows          = {}
+        self._connection    = None
         self.engine = self.engine_builder.engine
         base = declarative_base()
         self.tables = {}
                 
+        if      self.is_normalized  :
+            name    = self.events_table
+            _class  = type(
+                name                ,
+                (base,  )           ,
+                    {
+                        '__tablename__'   : name                                                ,
+                        '__table_args__'  : (
+                            Index(f'ix_{name}_logger_level_ts', 'logger', 'level', 'ts'),
+                            Index(f'ix_{name}_ts', 'ts')                                ,)      ,
+                        'id'              : Column(Integer, primary_key=True)                   ,
+                        'ts'              : Column(DateTime().with_variant(DATETIME(fsp= 6), 'mysql'), nullable= False),
+                        'level'           : Column(SmallInteger, nullable= False)               ,
+                        'logger'          : Column(String(100), nullable= False)                ,
+                        'payload'         : Column(UnicodeText(length=2**31))                   ,
+                    })
+            self.tables['events'] = _class
+            base.metadata.create_all(self.engine)
+            if      self.is_overwrite   :
+                table   = _class.__table__
+                with self.engine.begin() as connection  :
+                    connection.execute(table.delete().where(table.c.logger == self.id_))
+            return
         if self.is_combine:
             _class = type(
                 '{}_{}'.format(self.id_, 'combined')    ,
@@ -535,7 +1981,6 @@ class SQLLogger     (ConsoleLogger  ):
                     pass
         
         base.metadata.create_all(self.engine)
-        self.session = sessionmaker(bind= self.engine)()
     def _execute_log(
             self            , 
             level           , 
@@ -543,30 +1988,960 @@ class SQLLogger     (ConsoleLogger  ):
             log_datetime    ,
             is_one_line     ,
             is_raw          ):
-        super()._execute_log(
-            level       , 
-            log_dict    ,
-            log_datetime,
-            is_one_line ,
-            is_raw      )
+        if      self.is_print_log   :
+            super()._execute_log(
+                level       , 
+                log_dict    ,
+                log_datetime,
+                is_one_line ,
+                is_raw      )
+        if      self.is_normalized  :
+            #The events rows are built from the ns timestamps, see _after_batch
+            return
         if      not isinstance(log_dict, dict)    :
                 log_dict = {log_dict: ''}
         
-        for key in log_dict:
-            if self.is_combine:
-                row = self.tables['combined'](
-                    log_datetime= log_datetime          ,
-                    level       = level.name            ,
-                    title       = f'{self.id_}:::{key}' ,
-                    message     = str(log_dict[key])    )
-                
-            else:
-                row = self.tables[level.name](
-                    log_datetime= log_datetime          ,
-                    title       = f'{self.id_}:::{key}' ,
-                    message     = str(log_dict[key])    )
-            self.session.add(row)
-        self.session.commit()
+        #The rows are added once built
+        if      self.is_combine :
+            rows    = [{
+                'log_datetime'  : log_datetime          ,
+                'level'         : level.name            ,
+                'title'         : f'{self.id_}:::{key}' ,
+                'message'       : str(log_dict[key])    } for key in log_dict]
+            self._rows.setdefault(self.tables['combined'].__table__, []).extend(rows)
+        else            :
+            rows    = [{
+                'log_datetime'  : log_datetime          ,
+                'title'         : f'{self.id_}:::{key}' ,
+                'message'       : str(log_dict[key])    } for key in log_dict]
+            self._rows.setdefault(self.tables[level.name].__table__, []).extend(rows)
+    def _after_batch    (
+        self    ,
+        items   ):
+        '''Adds the events rows of the batch if ``is_normalized``.
+
+            The event timestamps are the ns timestamps truncated to microseconds, whatever the 
+            ``ts_precision``.
+        '''
+        if      not self.is_normalized  :
+            return
+        rows    = []
+        for level, log_dict, ns, is_one_line, is_raw in items   :
+            try                     :
+                rows.append({
+                    'ts'        : datetime.fromtimestamp(ns// 10**9).replace(microsecond= ns// 1000% 10**6),
+                    'level'     : level.value                                                               ,
+                    'logger'    : self.id_                                                                  ,
+                    'payload'   : json.dumps(
+                        log_dict if isinstance(log_dict, dict) else str(log_dict)   ,
+                        default = str                                               )                       })
+            except  Exception as e  :
+                self._on_error(e)
+        if      rows    :
+            self._rows.setdefault(self.tables['events'].__table__, []).extend(rows)
+    def _g_connection   (
+        self    ):
+        '''The logging connection, created on first use.
+
+            Returns:
+                sqlalchemy.engine.Connection    : The connection.
+        '''
+        if      self._connection is None    :
+            self._connection    = self.engine.connect()
+            if      self.engine.dialect.name == 'sqlite'    :
+                from    sqlalchemy  import  text
+                for name, value in self.sqlite_pragmas.items()  :
+                    self._connection.execute(text(f'PRAGMA {name}={value}'))
+        return self._connection
+    def _flush          (
+        self    ):
+        '''Inserts the rows in bulk, a single transaction for all the tables.
+        '''
+        rows        = self._rows
+        self._rows  = {}
+        if      rows    :
+            connection  = self._g_connection()
+            with connection.begin() :
+                for table, table_rows in rows.items()   :
+                    #An empty list would insert the default values
+                    if      table_rows  :
+                        connection.execute(table.insert(), table_rows)
+        super()._flush()
+    def _close          (
+        self    ):
+        super()._close()
+        if      self._connection is not None    :
+            self._connection.close()
+            self._connection    = None
+
+    def g_logs_page (
+        self                ,
+        start   = None      ,
+        end     = None      ,
+        level   = None      ,
+        loggers = None      ,
+        after   = None      ,
+        limit   = 1000      ):
+        '''A page of logs from the events table, ordered by time, see ``is_normalized``.
+
+            Args:
+                start   (datetime.datetime | str): Min timestamp, None for no limit.
+                end     (datetime.datetime | str): Max timestamp, excluded, None for no limit.
+                level   (Level | str            ): Min level, None for all levels.
+                loggers (list                   ): The logger ids, None for this logger, empty for all loggers.
+                after   (tuple                  ): ``(ts, id)`` of the last log of the previous page.
+                limit   (int                    ): Max number of logs.
+
+            Returns:
+                list    : The logs, dicts with ``id``, ``ts``, ``level``, ``logger`` and ``payload``.
+        '''
+        from    sqlalchemy  import  select  , and_  , or_
+
+        if      not self.is_normalized  :
+            raise ValueError('Only the events table can be queried, see is_normalized.')
+        table       = self.tables['events'].__table__
+        loggers     = [self.id_] if loggers is None else loggers
+        level       = Level[level.upper()] if isinstance(level, str) else level
+        g_datetime  = lambda x: datetime.fromisoformat(x) if isinstance(x, str) else x
+        conditions  = []
+        if      loggers             :
+            conditions.append(table.c.logger.in_(loggers))
+        if      level is not None   :
+            #IN rather than a range, the (logger, level, ts) index is used for each level
+            conditions.append(table.c.level.in_([level_.value for level_ in Level if level_.value >= level.value]))
+        if      start is not None   :
+            conditions.append(table.c.ts >= g_datetime(start))
+        if      end is not None     :
+            conditions.append(table.c.ts < g_datetime(end))
+        if      after is not None   :
+            ts, id_ = after
+            conditions.append(or_(table.c.ts > ts, and_(table.c.ts == ts, table.c.id > id_)))
+        query       = select([table]).order_by(table.c.ts, table.c.id).limit(limit)
+        if      conditions          :
+            query   = query.where(and_(*conditions))
+        
+        with self.engine.connect() as connection    :
+            rows    = connection.execute(query).fetchall()
+        return [{
+            'id'        : row.id                    ,
+            'ts'        : row.ts                    ,
+            'level'     : Level(row.level)          ,
+            'logger'    : row.logger                ,
+            'payload'   : json.loads(row.payload)   } for row in rows]
+    def query_logs  (
+        self                ,
+        start       = None  ,
+        end         = None  ,
+        level       = None  ,
+        loggers     = None  ,
+        page_size   = 1000  ):
+        '''Streams the logs from the events table, a page at a time, see ``g_logs_page``.
+
+            Pages are read with a keyset on (ts, id), each page is a single indexed query.
+
+            Yields:
+                dict    : The logs.
+        '''
+        after   = None
+        while True  :
+            logs    = self.g_logs_page(start, end, level, loggers, after, page_size)
+            yield from logs
+            if      len(logs) < page_size   :
+                return
+            after   = (logs[-1]['ts'], logs[-1]['id'])
+class MultiLogger   (Logger         ):
+    '''Writes the logs to many loggers with a single queue.
+
+        The logs are pushed once and each batch is dispatched to the ``sinks``, loggers which are 
+        not started, each one with its own ``level``, formatter and flush params. The logger level 
+        is raised to the lowest sink level, and updated when a sink level is set.
+
+        If ``is_isolated``, each sink is written by its own thread from a queue of up to 
+        ``sink_capacity`` logs, the logging thread waits up to ``sink_timeout`` seconds for a full 
+        sink queue. A sink which does not make room in time is stalled, its batches are dropped 
+        without waiting until its queue has room again, so that it does not stall the others. 
+        Otherwise all the sinks are written by the logging thread.
+
+        Args:
+            sinks           (list   ): The loggers, none by default.
+            is_isolated     (bool   ): A thread per sink.
+            sink_capacity   (int    ): Max number of logs waiting for an isolated sink.
+            sink_timeout    (float  ): Max number of seconds to wait for a full isolated sink.
+    '''
+    EasyObj_PARAMS  = OrderedDict((
+        ('sinks'        , {
+            'default'   : None  ,
+            'type'      : list  }),
+        ('is_isolated'  , {
+            'default'   : True  ,
+            'type'      : bool  }),
+        ('sink_capacity', {
+            'default'   : 10000 ,
+            'type'      : int   }),
+        ('sink_timeout' , {
+            'default'   : 1.0   ,
+            'type'      : float }),))
+
+    def _on_init    (
+        self    ):
+        #Batch queues, threads and stalled flags of the isolated sinks, by sink index
+        self._sink_queues   = []
+        self._sink_threads  = []
+        self._sink_stalled  = []
+        if      self.sinks is None  :
+            self.sinks  = []
+        for sink in self.sinks  :
+            sink._composite = self
+            if      self.is_stats   :
+                sink.is_stats   = True
+        self.set_level(self._base_level)
+    
+    def set_level       (
+        self    ,
+        level   ):
+        '''Same as ``Logger.set_level``, the level is raised to the lowest sink level.
+        '''
+        level               = Level[level.upper()] if isinstance(level, str) else level
+        #The level set by the user, before raising it to the sinks levels
+        self._base_level    = level
+        if      self.sinks  :
+            min_level   = min(sink.level.value for sink in self.sinks)
+            level       = Level(max(level.value, min_level))
+        super().set_level(level)
+    def _on_sink_level  (
+        self    ):
+        '''Called when the level of a sink is set.
+        '''
+        self.set_level(self._base_level)
+    def stats           (
+        self    ):
+        '''Same as ``Logger.stats``, with the stats of each sink by id under ``sinks``.
+        '''
+        stats           = super().stats()
+        stats['sinks']  = {sink.id_: sink.stats() for sink in self.sinks}
+        return stats
+    
+    def _start_writer   (
+        self    ):
+        if      self.is_isolated    :
+            self._sink_queues   = [_SinkQueue(self.sink_capacity) for sink in self.sinks]
+            self._sink_stalled  = [False for sink in self.sinks]
+            self._sink_threads  = [Thread(
+                name    = f'{self.id_}-{sink.id_}'  ,
+                target  = self._sink_loop           ,
+                args    = (sink, sink_queue)        ,
+                daemon  = True                      ) for sink, sink_queue in zip(self.sinks, self._sink_queues)]
+            for thread in self._sink_threads    :
+                thread.start()
+        super()._start_writer()
+    def _sink_loop      (
+        self        ,
+        sink        ,
+        sink_queue  ):
+        '''Writes the batches of an isolated sink, on its own thread.
+        '''
+        while True  :
+            try                 :
+                batch   = sink_queue.get(timeout= sink._g_timeout())
+            except  queue.Empty :
+                if      sink._n_pending :
+                    sink._try_flush()
+                continue
+            if      batch is None               :
+                break
+            if      batch.__class__ is not list :
+                sink._try_flush()
+                sink._set_flushed([batch], sink._pop_flush_error())
+                continue
+            sink._write_logs(batch)
+        sink._try_close()
+    def _write_logs     (
+        self    ,
+        items   ):
+        start   = time.perf_counter()
+        for i, sink in enumerate(self.sinks)    :
+            disabled    = sink._disabled_levels
+            batch       = [item for item in items if item[0] not in disabled] if disabled else items
+            if      not batch           :
+                continue
+            if      not self.is_isolated    :
+                sink._write_logs(batch)
+                continue
+            try                 :
+                self._sink_queues[i].put(
+                    batch                                                   ,
+                    timeout = 0 if self._sink_stalled[i] else self.sink_timeout )
+                self._sink_stalled[i]   = False
+            except  queue.Full  :
+                #The sink is stalled
+                self._sink_stalled[i]   = True
+                with sink._overflow_lock    :
+                    sink.n_dropped += len(batch)
+                with self._overflow_lock    :
+                    self.n_dropped += len(batch)
+        if      not self.is_isolated    :
+            self._n_pending = sum(sink._n_pending for sink in self.sinks)
+        if      self.is_stats           :
+            self.n_written     += len(items)
+            self.write_time    += time.perf_counter()- start
+    def _g_flush_deadline   (
+        self    ):
+        return min(sink._g_flush_deadline() for sink in self.sinks if sink._n_pending)
+    def _flush          (
+        self    ):
+        '''Flushes the inline sinks, raises the first sink flush error after flushing the others.
+        '''
+        errors  = []
+        if      not self.is_isolated    :
+            for sink in self.sinks  :
+                if      sink._n_pending :
+                    sink._try_flush()
+                    errors.append(sink._pop_flush_error())
+        super()._flush()
+        errors  = [error for error in errors if error is not None]
+        if      errors  :
+            raise   errors[0]
+    def _set_flushed    (
+        self            ,
+        futures         ,
+        error   = None  ):
+        '''Notifies the flush requests once all the isolated sinks are flushed.
+        '''
+        if      not self.is_isolated or not self.sinks  :
+            super()._set_flushed(futures, error)
+            return
+        lock        = Lock()
+        n_sinks     = [len(self.sinks)]
+        errors      = [error]
+        def on_flushed  (
+            future  ):
+            with lock   :
+                n_sinks[0] -= 1
+                is_done     = not n_sinks[0]
+                if      errors[0] is None   :
+                    errors[0]   = future.exception()
+            if      is_done :
+                Logger._set_flushed(self, futures, errors[0])
+        from    concurrent.futures  import  Future
+        for sink_queue in self._sink_queues :
+            future  = Future()
+            future.add_done_callback(on_flushed)
+            sink_queue.put(future)
+    def _close          (
+        self    ):
+        super()._close()
+        if      not self.is_isolated    :
+            for sink in self.sinks  :
+                sink._try_close()
+            return
+        for sink_queue in self._sink_queues :
+            sink_queue.put(None)
+        for thread in self._sink_threads    :
+            thread.join()
+        self._sink_queues   = []
+        self._sink_threads  = []
+        self._sink_stalled  = []
+class _SinkQueue    (queue.Queue    ):
+    '''The queue of an isolated sink of a ``MultiLogger``, its size is a number of logs.
+
+        A batch counts for its number of logs, a flush request or the stop signal for one.
+    '''
+    def _init       (
+        self    ,
+        maxsize ):
+        super()._init(maxsize)
+        #Updated under self.mutex
+        self.n_logs = 0
+    def _qsize      (
+        self    ):
+        return self.n_logs
+    def _put        (
+        self    ,
+        item    ):
+        super()._put(item)
+        self.n_logs    += len(item) if item.__class__ is list else 1
+    def _get        (
+        self    ):
+        item            = super()._get()
+        self.n_logs    -= len(item) if item.__class__ is list else 1
+        return item
+class _PoolQueue    (queue.Queue    ):
+    '''The queue of a logger of a ``LogPool``, schedules the logger when a log is pushed.
+    '''
+    def __init__    (
+        self    ,
+        maxsize ,
+        pool    ,
+        logger  ):
+        super().__init__(maxsize)
+        self.pool           = pool
+        self.logger         = logger
+        #Both are updated under self.mutex
+        self.is_registered  = False
+        self.is_scheduled   = False
+    def _put        (
+        self    ,
+        item    ):
+        super()._put(item)
+        if      self.is_registered and not self.is_scheduled   :
+            self.is_scheduled   = True
+            self.pool._ready.put(self.logger)
+    def schedule    (
+        self    ):
+        '''Schedules the logger if it is not.
+        '''
+        with self.mutex :
+            if      self.is_registered and not self.is_scheduled   :
+                self.is_scheduled   = True
+                self.pool._ready.put(self.logger)
+    def release     (
+        self    ):
+        '''Called by the pool thread done with the logger, schedules it again if it has more logs.
+        '''
+        with self.mutex :
+            if      self.is_registered and self._qsize()   :
+                self.pool._ready.put(self.logger)
+            else                                            :
+                self.is_scheduled   = False
+class _PoolWriter   ():
+    '''Stands for the logging thread of a logger of a ``LogPool``, see ``Logger.stop``.
+    '''
+    def __init__    (
+        self    ):
+        self._done  = Event()
+    def join        (
+        self            ,
+        timeout = None  ):
+        self._done.wait(timeout)
+    def is_alive    (
+        self    ):
+        return not self._done.is_set()
+class LogPool       ():
+    '''A few threads writing the logs of many loggers, see ``Logger.pool``.
+
+        A logger with logs is scheduled once, a thread takes it, writes a batch of up to 
+        ``batch_size`` logs and schedules it again behind the other loggers if it has more, the 
+        loggers are served in turns and the logs of a logger are written in order by one thread at 
+        a time. The flush and reports timers of the loggers are checked every ``interval`` seconds.
+
+        Args:
+            n_threads   (int    ): Number of threads, started with the first logger.
+            interval    (float  ): Max number of seconds a due flush or report waits.
+            name        (str    ): Name prefix of the threads.
+    '''
+    def __init__    (
+        self                        ,
+        n_threads   = 2             ,
+        interval    = 0.05          ,
+        name        = 'sal-log-pool'):
+        self.n_threads  = n_threads
+        self.interval   = interval
+        self.name       = name
+        #Scheduled loggers, each one at most once
+        self._ready     = queue.Queue()
+        self._loggers   = []
+        self._threads   = []
+        self._lock      = Lock()
+        self._tick_lock = Lock()
+        self._last_tick = time.monotonic()
+    
+    def c_queue     (
+        self    ,
+        logger  ):
+        '''Creates the queue of a logger of the pool.
+        '''
+        return _PoolQueue(logger.capacity, self, logger)
+    def register    (
+        self    ,
+        logger  ):
+        '''Starts writing the logs of a logger, see ``Logger._start_writer``.
+
+            Returns:
+                _PoolWriter : Joined by ``Logger.stop``.
+        '''
+        writer  = _PoolWriter()
+        with self._lock :
+            if      not self._threads   :
+                self._threads   = [Thread(
+                    name    = f'{self.name}-{i}'    ,
+                    target  = self._loop            ,
+                    daemon  = True                  ) for i in range(self.n_threads)]
+                for thread in self._threads :
+                    thread.start()
+            self._loggers.append(logger)
+        with logger._queue.mutex    :
+            logger._queue.is_registered = True
+        logger._queue.schedule()
+        return writer
+    def _unregister (
+        self    ,
+        logger  ):
+        with logger._queue.mutex    :
+            logger._queue.is_registered = False
+            logger._queue.is_scheduled  = False
+        with self._lock :
+            self._loggers.remove(logger)
+    def _loop       (
+        self    ):
+        '''A pool thread, writes the scheduled loggers in turns.
+        '''
+        while True  :
+            try                 :
+                logger  = self._ready.get(timeout= self.interval)
+            except  queue.Empty :
+                logger  = None
+            if      logger is not None  :
+                self._serve(logger)
+            if      time.monotonic()- self._last_tick >= self.interval and self._tick_lock.acquire(False):
+                try     :
+                    self._last_tick = time.monotonic()
+                    self._tick()
+                finally :
+                    self._tick_lock.release()
+    def _serve      (
+        self    ,
+        logger  ):
+        '''Writes a batch of a logger, the logger is not scheduled meanwhile.
+        '''
+        try                     :
+            is_stop = logger._step([])
+        except  Exception as e  :
+            #The thread is shared, the logger is served again
+            logger._on_error(e)
+            is_stop = False
+        if      is_stop                 :
+            self._unregister(logger)
+            logger._try_close()
+            #Not written, as with a logging thread
+            logger.info('Logger stopped!')
+            logger._thread._done.set()
+        else                        :
+            logger._queue.release()
+    def _tick       (
+        self    ):
+        '''Schedules the loggers with a due flush or report.
+        '''
+        with self._lock :
+            loggers = self._loggers.copy()
+        for logger in loggers   :
+            if      logger._queue.is_scheduled  :
+                #Being written or about to be
+                continue
+            timeout = logger._g_timeout()
+            if      timeout is not None and timeout <= 0    :
+                logger._queue.schedule()
+############################################################
+#################### Asynchronous logging
+############################################################
+
+def _set_waiter (
+    waiter  ):
+    if      not waiter.done()   :
+        waiter.set_result(None)
+class AsyncQueue    (queue.Queue    ):
+    '''A thread safe queue awaited by an event loop, see ``AsyncLogger``.
+
+        Items can be pushed from any thread, ``aget`` wakes up the loop only when it is waiting.
+    '''
+    def __init__(
+        self            ,
+        maxsize = 0     ):
+        super().__init__(maxsize)
+        #(loop, future) of a waiting aget, accessed under mutex
+        self._waiter    = None
+    def _put    (
+        self    ,
+        item    ):
+        super()._put(item)
+        if      self._waiter is not None    :
+            loop, waiter    = self._waiter
+            self._waiter    = None
+            try                 :
+                loop.call_soon_threadsafe(_set_waiter, waiter)
+            except RuntimeError :
+                #The loop is closed
+                pass
+    def put_force   (
+        self    ,
+        item    ):
+        '''Pushes an item even if the queue is full, never blocks.
+        '''
+        with self.not_empty :
+            self._put(item)
+            self.unfinished_tasks  += 1
+            self.not_empty.notify()
+    async def aget  (
+        self            ,
+        timeout = None  ):
+        '''Removes and returns an item, waits without blocking the event loop.
+
+            Args:
+                timeout (float  ): Max number of seconds to wait, None to wait forever.
+            Returns:
+                object  : The item.
+            Raises:
+                queue.Empty : No item is available after ``timeout`` seconds.
+        '''
+        import  asyncio
+        loop    = asyncio.get_running_loop()
+        while True  :
+            with self.mutex :
+                if      self._qsize()   :
+                    item    = self._get()
+                    self.not_full.notify()
+                    return item
+                waiter          = loop.create_future()
+                self._waiter    = (loop, waiter)
+            try                             :
+                await asyncio.wait_for(waiter, timeout)
+            except  asyncio.TimeoutError    :
+                with self.mutex :
+                    self._waiter    = None
+                    if      not self._qsize()   :
+                        raise queue.Empty
+class AsyncLogger   (Logger         ):
+    '''Asynchronous logger base.
+
+        The logs are written by a task on the event loop of ``start`` instead of a thread, ``start`` 
+        must be called from a coroutine. Derived classes override ``_aexecute_log`` and ``_aflush`` to 
+        write the logs with asynchronous I/O, by default the ``_execute_log`` and ``_flush`` of the 
+        other bases are called, existing loggers can be used as mixins:
+
+        >>> class AsyncFileLogger(AsyncLogger, FileLogger):
+        >>>     pass
+
+        ``stop`` does not wait for the remaining logs, use ``astop``. On the event loop thread, 
+        ``OverflowPolicy.BLOCK`` and ``OverflowPolicy.SAMPLE`` drop the logs instead of blocking the 
+        logging task, use ``alog`` to wait for the queue.
+    '''
+    def _on_init    (
+        self    ):
+        self._queue         = AsyncQueue(self.capacity)
+        self._task          = None
+        self._thread_ident  = None
+    
+    def start           (
+        self    ):
+        '''Start loging.
+
+            Starts the logging task (self._aloop) on the running event loop.
+        '''
+        import  asyncio
+        if      not self.is_alive   :
+            #Raises RuntimeError if there is no running loop
+            asyncio.get_running_loop()
+        super().start()
+    def _start_writer   (
+        self    ):
+        self._thread        = None
+        import  asyncio
+        self._thread_ident  = get_ident()
+        self._task          = asyncio.get_running_loop().create_task(self._aloop())
+    def stop            (
+        self    ):
+        '''Pushes the stop signal, the remaining logs are written by the logging task.
+        '''
+        if      not self.is_alive   :
+            return
+        self.info('Logger stopping!')
+        if      isinstance(self._queue, AsyncQueue) :
+            self._queue.put_force(None)
+        self.is_alive  = False 
+
+        if self in Logger.LIVE_LOGGERS:
+            Logger.LIVE_LOGGERS.remove(self)
+    async def astop     (
+        self    ):
+        '''Stop and wait for the remaining logs to be written.
+        '''
+        task    = self._task
+        self.stop()
+        if      task is not None    :
+            await task
+            self._task  = None
+    def flush           (
+        self            ,
+        timeout = None  ):
+        if      get_ident() == self._thread_ident   :
+            raise RuntimeError('Cannot wait for the logging task from the event loop, use aflush.')
+        super().flush(timeout)
+    def _put_overflow   (
+        self    ,
+        item    ):
+        if      self.overflow_policy in (OverflowPolicy.BLOCK, OverflowPolicy.SAMPLE)   and \
+                get_ident() == self._thread_ident                                           :
+            #Waiting on the event loop would block the logging task
+            with self._overflow_lock    :
+                self._n_overflows  += 1
+                self.n_dropped     += 1
+            return
+        super()._put_overflow(item)
+    
+    async def _aloop            (
+        self    ):
+        '''Logging task, same as ``_loop``.
+        '''
+        import  asyncio
+        is_stop = False
+        while not is_stop:
+            try                 :
+                items   = [await self._queue.aget(self._g_timeout())]
+            except  queue.Empty :
+                items   = []
+            logs, futures, is_stop  = self._g_batch(items)
+            logs                   += self._g_dropped(is_stop)+ self._g_suppressed(is_stop)+ self._g_stats()
+            if      logs                :
+                await self._aexecute_logs(logs)
+            elif    self._n_pending     :
+                await self._atry_flush()
+            if      futures             :
+                await self._atry_flush()
+                self._set_flushed(futures, self._pop_flush_error())
+            #aget does not yield while the queue is not empty
+            await asyncio.sleep(0)
+        try                     :
+            await self._aclose()
+        except  Exception as e  :
+            self._on_error(e)
+
+        self.info('Logger stopped!')
+    async def _aexecute_logs    (
+        self    ,
+        items   ):
+        '''Write a batch of logs, same as ``_execute_logs``.
+        '''
+        if      self.is_stats   :
+            self._count_latencies(items)
+        start       = time.perf_counter()
+        format_ts   = self._ts_formatter.format
+        for item in items   :
+            try                     :
+                await self._aexecute_log(item[0], item[1], format_ts(item[2]), item[3], item[4])
+            except  Exception as e  :
+                self._on_error(e)
+        try                     :
+            self._after_batch(items)
+        except  Exception as e  :
+            self._on_error(e)
+        if      self._is_flush_due(items)   :
+            await self._atry_flush()
+        if      self.is_stats   :
+            self.n_written     += len(items)
+            self.write_time    += time.perf_counter()- start
+    async def _aexecute_log     (
+            self            , 
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          ):
+        '''Write the logs, same as ``_execute_log`` which is called by default.
+        '''
+        return self._execute_log(
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          )
+    async def _atry_flush       (
+        self    ):
+        '''Same as ``_try_flush``.
+        '''
+        try                     :
+            await self._aflush()
+        except  Exception as e  :
+            self._on_flush_error(e)
+    async def _aflush           (
+        self    ):
+        '''Flushes the written logs, ``_flush`` is called by default.
+
+            Derived classes must call ``super()._flush()`` after flushing.
+        '''
+        self._flush()
+    async def _aclose           (
+        self    ):
+        '''Flushes and releases the logger resources, ``_close`` is called by default.
+        '''
+        await self._aflush()
+        self._close()
+
+############################################################
+#################### Cross-process logging
+############################################################
+
+class LogChannelQueue   (): 
+    '''Replaces the queue of a logger in a child process, see ``LogChannel``.
+
+        The stop signal is ignored, the parent logger is never stopped by a child.
+    '''
+    def __init__(
+        self    ,
+        channel ,
+        id_     ):
+        self.channel    = channel
+        self.id_        = id_
+    
+    def put         (
+        self            ,
+        item            ,
+        block   = True  ,
+        timeout = None  ):
+        if      item is not None    :
+            self.channel.put(self.id_, item)
+    def put_nowait  (
+        self    ,
+        item    ):
+        self.put(item)
+    def qsize       (
+        self    ):
+        return 0
+class LogChannel        ():
+    '''Forwards the logs of child processes to the loggers of the parent process.
+
+        The parent calls ``start`` after starting its loggers and ``stop`` after the children exit.
+        A child calls ``attach`` first, its live loggers, and the loggers it starts, push their logs to 
+        the channel instead of writing them, then ``close`` before exiting.
+        Child logs are pickled and sent in batches of up to ``batch_size`` logs, or every ``interval`` 
+        seconds, over a ``multiprocessing.Queue``. The parent thread feeds them to the live logger with 
+        the same id, or to ``logger`` if none.
+
+        Args:
+            logger      (Logger ): The logger used for unknown logger ids, None to drop the logs.
+            batch_size  (int    ): Max number of logs sent at once by a child.
+            interval    (float  ): Max number of seconds a child log is buffered.
+    '''
+    def __init__(
+        self                    ,
+        logger      = None      ,
+        batch_size  = 256       ,
+        interval    = 0.05      ):
+        self.logger     = logger
+        self.batch_size = batch_size
+        self.interval   = interval
+        import  multiprocessing
+        self._mp_queue  = multiprocessing.Queue()
+        self._thread    = None
+        #Child state, set by attach
+        self._buffer    = None
+    def __getstate__(
+        self    ):
+        return {
+            'logger'        : None              ,
+            'batch_size'    : self.batch_size   ,
+            'interval'      : self.interval     ,
+            '_mp_queue'     : self._mp_queue    ,
+            '_thread'       : None              ,
+            '_buffer'       : None              }
+
+    def start       (
+        self    ):
+        '''Starts feeding the parent loggers, in the parent process.
+        '''
+        if      self._thread is not None    :
+            return
+        self._thread    = Thread(
+            name    = 'log_channel' ,
+            target  = self._loop    ,
+            daemon  = True          )
+        self._thread.start()
+    def stop        (
+        self    ):
+        '''Feeds the remaining logs to the parent loggers, in the parent process.
+
+            Must be called after the children exit and before the loggers are stopped.
+        '''
+        if      self._thread is None    :
+            return
+        self._mp_queue.put(None)
+        self._thread.join()
+        self._thread    = None
+    def _loop       (
+        self    ):
+        while True  :
+            data    = self._mp_queue.get()
+            if      data is None    :
+                break
+            loggers = {logger.id_: logger for logger in Logger.LIVE_LOGGERS}
+            for id_, item in pickle.loads(data) :
+                logger  = loggers.get(id_, self.logger)
+                if      logger is not None  :
+                    logger._put(item)
+    
+    def attach      (
+        self    ):
+        '''Forwards the logs of the current process to the parent, in the child process.
+        '''
+        self._lock      = Lock()
+        self._buffer    = []
+        self._is_closed = False
+        self._thread    = Thread(
+            name    = 'log_channel' ,
+            target  = self._send_loop,
+            daemon  = True          )
+        Logger.CHANNEL  = self
+        for logger in Logger.LIVE_LOGGERS   :
+            logger._queue   = self.c_queue(logger.id_)
+            logger._thread  = None
+        self._thread.start()
+    def c_queue     (
+        self    ,
+        id_     ):
+        '''Creates the queue of a child logger.
+
+            Args:
+                id_ (str    ): The logger id.
+
+            Returns:
+                LogChannelQueue : The queue.
+        '''
+        return LogChannelQueue(self, id_)
+    def put         (
+        self    ,
+        id_     ,
+        item    ):
+        '''Buffers a log, in the child process.
+        '''
+        with self._lock :
+            self._buffer.append((id_, item))
+            if      len(self._buffer) < self.batch_size :
+                return
+            buffer, self._buffer    = self._buffer, []
+        self._send(buffer)
+    def _send       (
+        self    ,
+        buffer  ):
+        try         :
+            data    = pickle.dumps(buffer, pickle.HIGHEST_PROTOCOL)
+        except      :
+            #Unpicklable log values are sent as strings
+            data    = pickle.dumps([
+                (id_, [item[0], {str(k): str(v) for k, v in item[1].items()} if isinstance(
+                    item[1], dict) else str(item[1])]+ item[2:]) for id_, item in buffer],
+                pickle.HIGHEST_PROTOCOL)
+        self._mp_queue.put(data)
+    def _send_loop  (
+        self    ):
+        while not self._is_closed   :
+            time.sleep(self.interval)
+            self.flush()
+    def flush       (
+        self    ):
+        '''Sends the buffered logs, in the child process.
+        '''
+        with self._lock :
+            buffer, self._buffer    = self._buffer, []
+        if      buffer  :
+            self._send(buffer)
+    def close       (
+        self    ):
+        '''Sends the buffered logs and waits for them to be written to the pipe, in the child process.
+        '''
+        self._is_closed = True
+        self._thread.join()
+        self.flush()
+        Logger.CHANNEL  = None
+        self._mp_queue.close()
+        self._mp_queue.join_thread()
 
 ############################################################
 #################### Exceptions
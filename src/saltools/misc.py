@@ -5,8 +5,6 @@
 from    .common                     import  EasyObj
 from    collections.abc             import  Iterable
 from    collections                 import  OrderedDict     , defaultdict
-from    sqlalchemy                  import  create_engine
-from    sqlalchemy_utils.functions  import  create_database , database_exists
 from    enum                        import  Enum
 
 import  importlib
@@ -54,6 +52,10 @@ class SQLAlchemyEBuilder(
     
     def _on_init(
         self    ):
+        #Imported on first use, sqlalchemy is slow to import
+        from    sqlalchemy                  import  create_engine
+        from    sqlalchemy_utils.functions  import  create_database , database_exists
+        
         if      self.db_engine  == DataBaseEngine.SQLITE    :
             connection_str  = '{db_engine}://{db}'.format   (
                 db_engine   = self.db_engine.name.lower()   ,
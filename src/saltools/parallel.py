@@ -1,8 +1,6 @@
-from    .common             import  EasyObj
+from    .common             import  EasyObj         , slotted
 from    collections.abc     import  Iterable        , Callable
 from    collections         import  OrderedDict
-from    sqlalchemy          import  create_engine
-from    multiprocessing     import  Process         , Queue
 from    threading           import  Thread          , Condition
 from    enum                import  Enum
 from    datetime            import  datetime
@@ -67,9 +65,11 @@ class NiceTQueue    ():
         self    ):
         self._list.clear()
 
+@slotted
 class FactoryTask(EasyObj):
-      
-    EasyObj_PARAMS  = OrderedDict((
+    EasyObj_IS_FAST_INIT    = True
+    EasyObj_IS_FROZEN       = True
+    EasyObj_PARAMS          = OrderedDict((
         ('target'       , {
             'type'      : Callable  }),
         ('id_'          , {
@@ -83,7 +83,11 @@ class FactoryTask(EasyObj):
             'default'   : {}    }),
         ('is_process'   , {
             'default'   : False }),))
-        
+    EasyObj_SLOTS           = (
+        'last_start'        ,
+        'last_stop'         ,
+        'last_stop_status'  )
+
     def _on_init(self):
         self.last_start         = None 
         self.last_stop          = None 
@@ -124,19 +128,25 @@ class NiceFactory(EasyObj):
     
     @classmethod
     def _run_task_target(
-        cls         ,
-        fn          ,
-        args        , 
-        kwargs      ,
-        id_         ,
-        status_queue):
+        cls                 ,
+        fn                  ,
+        args                , 
+        kwargs              ,
+        id_                 ,
+        status_queue        ,
+        log_channel = None  ):
         try :
             exec_report = {}
+            if      log_channel :
+                log_channel.attach()
             fn(*args, **kwargs)
             exec_report['status']   = ExitStauts.NORMAL
         except:
             exec_report['status']   = ExitStauts.ERROR
         finally:
+            #The logs are sent before the task is reported as done
+            if      log_channel :
+                log_channel.close()
             exec_report['id_']      = id_
             exec_report['last_stop']= datetime.utcnow()
             status_queue.put(exec_report)
@@ -165,8 +175,10 @@ class NiceFactory(EasyObj):
         self.workers_queue  = queue.Queue()
         self.signals_queue  = queue.Queue()
         
-        self.process_status_queue   = Queue()
         self.thread_status_queue    = queue.Queue()
+        #Created on the first process task, see _start_log_channel
+        self.process_status_queue   = None
+        self.log_channel            = None
 
         if      self.n_workers != None  :
             for i in range(self.n_workers)  :
@@ -214,6 +226,9 @@ class NiceFactory(EasyObj):
         start           = datetime.utcnow()
         task.last_start = start
 
+        if      task.is_process :
+            from    multiprocessing     import  Process
+            self._start_log_channel()
         worker              = (Process if task.is_process else Thread)(
                     target  = self._run_task_target ,
                     name    = name                  ,
@@ -222,12 +237,25 @@ class NiceFactory(EasyObj):
                         task.args                                                                   ,
                         task.kwargs                                                                 ,
                         id_                                                                         ,
-                        self.process_status_queue if task.is_process else self.thread_status_queue  ))
+                        self.process_status_queue if task.is_process else self.thread_status_queue  ,
+                        self.log_channel if task.is_process else None                               ))
         self.working[id_]   = {
             'task'  : task  ,
             'start' : start ,
             'worker': worker}
         worker.start()
+    def _start_log_channel  (
+        self    ):
+        '''Starts the log channel forwarding the logs of process tasks to the loggers of this process.
+
+            The channel and the process status queue are created on the first process task, 
+            a factory running threads only never imports ``multiprocessing``.
+        '''
+        if      self.log_channel is None    :
+            from    multiprocessing     import  Queue
+            self.process_status_queue   = Queue()
+            self.log_channel            = stl.LogChannel(self.logger)
+        self.log_channel.start()
     def _check_status       (
         self    ):
         def __check_status(status_queue):
@@ -243,7 +271,8 @@ class NiceFactory(EasyObj):
                 if      self.n_workers != None  :
                     self.workers_queue.put(worker.name)
                 self.n_tasks    +=1
-        __check_status(self.process_status_queue)
+        if      self.process_status_queue is not None   :
+            __check_status(self.process_status_queue)
         __check_status(self.thread_status_queue )
     def _check_signal       (
         self            ,
@@ -296,6 +325,9 @@ class NiceFactory(EasyObj):
             else                                            :
                 break
         self._manager_thread.join()
+        #All the process tasks are done, their logs are fed to the loggers
+        if      self.log_channel is not None    :
+            self.log_channel.stop()
         self.tasks_queue.clear()
         self.n_tasks    = 0
         self.state = State.IDLE
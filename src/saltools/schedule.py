@@ -1,6 +1,5 @@
 '''Simple Scheduling tool.
 '''
-from    dateutil.parser         import  parse   as  date_parse
 
 from    dateutil.relativedelta  import  relativedelta
 from    datetime                import  datetime        , timedelta
@@ -25,17 +24,36 @@ class TimeRangeType (Enum):
     OK      = 0
     NOT_OK  = 1
 
+def _parse_date (
+    dt_str  ):
+    '''Parses ``Schedule.dates``, missing parts default to today as in ``dateutil.parser.parse``.
+
+        Unlike ``stc.parse_dates``, a time only string as ``08:00`` is today at that time.
+    '''
+    try                 :
+        return datetime.fromisoformat(dt_str)
+    except  ValueError  :
+        pass
+    #Imported on first use, dateutil.parser is slow to import
+    from    dateutil.parser import  parse   as  date_parse
+    return date_parse(dt_str)
+
+@stc.slotted
 class ScheduledTask (stp.FactoryTask):
     EasyObj_PARAMS  = OrderedDict((
         ('is_parallel'  , {
             'default'   : False ,
             'type'      : bool  }),))
+    EasyObj_SLOTS   = (
+        'next_times'    ,)
     
     def _on_init(self):
         self.next_times         = [] 
 
+@stc.slotted
 class Time      (stl.EasyObj):
-    EasyObj_PARAMS  = OrderedDict((
+    EasyObj_IS_FAST_INIT    = True
+    EasyObj_PARAMS          = OrderedDict((
         ('type'     , {
             'default'   : TimeType.OFFSET   ,
             'type'      : TimeType          }),
@@ -60,12 +78,14 @@ class Time      (stl.EasyObj):
             ('hour'      , 0 ),
             ('day'       , 1 ),
             ('month'     , 1 ),))
+    EasyObj_SLOTS           = (
+        'sleep_time'    ,)
     
     def _on_init        (
         self    ):
         if      self.type != TimeType.OFFSET    :
             kwargs  = {
-                k+'s': v  for k,v in vars(self).items() if v!= None and k not in ['type']}
+                k+'s': v  for k,v in self._g_easyObj_values().items() if v!= None and k not in ['type']}
             self.sleep_time = relativedelta(**kwargs)
     def _g_next_offset  (
         self        , 
@@ -122,28 +142,29 @@ class Time      (stl.EasyObj):
         elif    self.type == TimeType.LAST_STOP :
             return self._g_next_relative(current_dt, last_stop)
 class TimeRange (stl.EasyObj):
-    EasyObj_PARAMS  = OrderedDict((
+    EasyObj_IS_FAST_INIT    = True
+    EasyObj_PARAMS          = OrderedDict((
         ('is_ok'    , {
             'default'   : True  ,
             'type'      : bool  }),
         ('second'   , {
             'default'   : None      ,
-            'type'      : int       }),
+            'type'      : [int]     }),
         ('minute'   , {
             'default'   : None  ,
-            'type'      : int   }),
+            'type'      : [int] }),
         ('hour'     , {
             'default'   : None  ,
-            'type'      : int   }),
+            'type'      : [int] }),
         ('day'      , {
             'default'   : None  ,
-            'type'      : int   }),
+            'type'      : [int] }),
         ('month'    , {
             'default'   : None  ,
-            'type'      : int   }),
+            'type'      : [int] }),
         ('weekday'      , {
             'default'   : None  ,
-            'type'      : int   },),))
+            'type'      : [int] },),))
         
     def __contains__(
         self        , 
@@ -167,20 +188,23 @@ class TimeRange (stl.EasyObj):
                     return False
         return True
 class Schedule  (stl.EasyObj):
-    EasyObj_PARAMS  = OrderedDict((
+    EasyObj_IS_FAST_INIT    = True
+    EasyObj_PARAMS          = OrderedDict((
         ('tasks'        , {
-            'default'   : []            ,
-            'type'      : ScheduledTask }),
+            'default'   : []                ,
+            'type'      : [ScheduledTask]   }),
         ('dates'        , {
-            'default'   : []            ,
-            'type'      : datetime      ,
-            'parser'    : date_parse    }),
+            'default'   : []                ,
+            'type'      : [datetime]        ,
+            'parser'    : _parse_date       }),
         ('times'        , {
             'default'   : [Time()]          ,
-            'type'      : Time              }),
+            'type'      : [Time]            }),
         ('ranges'       , {
             'default'   : []                ,
-            'type'      : TimeRange         }),))
+            'type'      : [TimeRange]       }),))
+    EasyObj_SLOTS           = (
+        'consumed_dates'    ,)
 
     def _on_init        (
         self    ):
@@ -219,11 +243,11 @@ class Schedule  (stl.EasyObj):
 class Scheduler (stp.NiceFactory):
     EasyObj_PARAMS  = OrderedDict((
         ('schedules'        , {
-            'type'      : Schedule  ,
-            'default'   : []        }),
+            'type'      : [Schedule]    ,
+            'default'   : []            }),
         ('reporters'        , {
-            'type'      : Callable  ,
-            'default'   : []        }),
+            'type'      : [Callable]    ,
+            'default'   : []            }),
         ('is_print_report'  , {
             'type'      : bool      ,
             'default'   : True      }),
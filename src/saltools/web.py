@@ -2,18 +2,14 @@
 
     Web utilities.
 '''
-from    lxml.html       import  fromstring      , HtmlElement
 from    .logging        import  handle_exception, Level
 from    .misc           import  g_path
 from    urllib.parse    import  urlencode       , urlparse      , parse_qs
 
-import  requests
-import  lxml
-
-requests.packages.urllib3.disable_warnings()
-
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36'} 
+#The requests module, see _g_requests.
+_requests   = None
 
 def g_url_param (
     url             ,
@@ -31,6 +27,21 @@ def g_url_param (
     query   = urlparse(url).query
     path    = [param]+([] if is_list else [0])
     return  g_path(parse_qs(query), path, is_return_last= True)
+def _g_requests (
+    ):
+    '''Imports requests on first use.
+
+        requests is slow to import, urllib3 warnings are disabled once imported.
+
+        Returns:
+            module  : The requests module.
+    '''
+    global _requests
+    if      _requests is None   :
+        import  requests
+        requests.packages.urllib3.disable_warnings()
+        _requests   = requests
+    return _requests
 def do_request  (
     url                     , 
     params      = None      , 
@@ -58,6 +69,7 @@ def do_request  (
         Returns: 
             (requests.Response, requests.Session ): A response, session tuple.
     '''
+    requests= _g_requests()
     session = session if session else requests.Session()
     session.headers.update(headers)
     session.proxies.update(proxies)
@@ -103,13 +115,17 @@ def g_xpath     (
         Returns:
             (list, str  ): An array of strings
     '''
+    #Imported on first use, lxml is slow to import
+    from    lxml.html   import  fromstring
+    from    lxml.etree  import  XMLSyntaxError
+
     #If the element has a method xpath
     if      hasattr(element, 'xpath')   :
         result  = element.xpath(xpath)
     elif    isinstance(element, str)    :
         try                                         :
             result  = fromstring(element).xpath(xpath)
-        except    lxml.etree.XMLSyntaxError as e    :
+        except    XMLSyntaxError as e               :
             result  = fromstring(f'<html>{element}</html>').xpath(xpath)
     else                                :
         raise TypeError("Expected str or lxml.etree._Element.")
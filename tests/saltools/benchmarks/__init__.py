@@ -0,0 +1,7 @@
+import  sys
+import  os
+
+src_path    = os.path.join(
+    os.path.dirname(__file__)   ,
+    '../../../src'              )
+sys.path.append(src_path)
\ No newline at end of file
@@ -0,0 +1,267 @@
+'''EasyObj benchmarks.
+
+    Run from the repository root with ``python -m tests.saltools.benchmarks.bench_common``.
+'''
+from    collections         import  OrderedDict
+from    datetime            import  datetime    as dt
+from    dateutil.parser     import  parse       as dparse
+from    timeit              import  repeat
+
+import  saltools.common     as      sltc
+
+import  saltools.schedule   as      slts
+import  saltools.parallel   as      sltp
+
+import  tracemalloc
+import  pickle
+
+N_OBJECTS   = 10000
+
+def f_target(
+    ):
+    pass
+
+def _run        (
+    title               ,
+    fn                  ,
+    number  = N_OBJECTS ,
+    unit    = 'object'  ):
+    best    = min(repeat(fn, number= number, repeat= 5))
+    print(f'{title:<50}: {best/ number* 1e6:>10.2f} us/{unit}')
+    return best
+def bench_schema(
+    ):
+    '''Per instance construction cost with and without the cached schema.
+
+        The uncached case drops the schema before each instance, this is what every 
+        construction used to cost, the generic ``__init__`` is used in both cases.
+    '''
+    class FactoryTask   (
+        sltp.FactoryTask    ):
+        EasyObj_IS_FAST_INIT    = False
+    class ScheduledTask (
+        slts.ScheduledTask  ):
+        EasyObj_IS_FAST_INIT    = False
+    class Time          (
+        slts.Time           ):
+        EasyObj_IS_FAST_INIT    = False
+    cases   = [
+        ('FactoryTask'  , FactoryTask   , lambda : FactoryTask(f_target, id_= 'task')   ),
+        ('ScheduledTask', ScheduledTask , lambda : ScheduledTask(f_target)              ),
+        ('Time'         , Time          , lambda : Time(second= 10)                     ),]
+    for name, type_, fn in cases    :
+        def uncached(
+            ):
+            type_.reset_schema()
+            fn()
+        before  = _run(f'{name} (uncached schema)'  , uncached  )
+        after   = _run(f'{name} (cached schema)'    , fn        )
+        print(f'{name:<50}: x{before/ after:.2f}')
+def bench_fast_init(
+    ):
+    '''Construction cost of the generic ``__init__``, the generated one and a plain class.
+    '''
+    class SlowTask  (
+        sltp.FactoryTask    ):
+        EasyObj_IS_FAST_INIT    = False
+    class PlainTask (
+        ):
+        def __init__(
+            self                        ,
+            target                      ,
+            id_         = 'factory_task',
+            args        = []            ,
+            kwargs      = {}            ,
+            is_process  = False         ):
+            self.target             = target
+            self.id_                = id_
+            self.args               = args
+            self.kwargs             = kwargs
+            self.is_process         = is_process
+            self.last_start         = None
+            self.last_stop          = None
+            self.last_stop_status   = None
+
+    plain   = _run('Plain class'                , lambda : PlainTask(f_target, id_= 'task')        )
+    slow    = _run('FactoryTask (generic init)' , lambda : SlowTask(f_target, id_= 'task')         )
+    fast    = _run('FactoryTask (generated init)', lambda : sltp.FactoryTask(f_target, id_= 'task'))
+    print(f'{"Generic/Generated":<50}: x{slow/ fast:.2f}')
+    print(f'{"Generated/Plain":<50}: x{fast/ plain:.2f}')
+def bench_slots (
+    ):
+    '''Memory used per instance with and without ``__slots__``.
+    '''
+    def g_size  (
+        fn  ):
+        tracemalloc.start()
+        objects = [fn() for i in range(N_OBJECTS)]
+        size    = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size/ len(objects)
+    cases   = [
+        ('FactoryTask'  , sltp.FactoryTask  , lambda type_ : type_(f_target, id_= 'task')   ),
+        ('Time'         , slts.Time         , lambda type_ : type_(second= 10)              ),]
+    for name, type_, fn in cases    :
+        slotted_type    = sltc.slotted(type_)
+        before          = g_size(lambda : fn(type_)         )
+        after           = g_size(lambda : fn(slotted_type)  )
+        print(f'{name+ " (dict)":<50}: {before:>10.0f} bytes/object')
+        print(f'{name+ " (slots)":<50}: {after:>10.0f} bytes/object')
+def bench_converters(
+    ):
+    '''Validation cost of list heavy params, legacy ``_g_param_value`` vs compiled converters.
+
+        The legacy path is selected by passing a copy of the class params.
+    '''
+    n_items = 1000
+    times   = [slts.Time(second= i% 60) for i in range(n_items)]
+    cases   = [
+        (slts.Schedule      , 'times'       , times                                             ),
+        (slts.Schedule      , 'dates'       , ['2020-01-01T10:00:00']* n_items                  ),
+        (slts.TimeRange     , 'hour'        , list(range(n_items))                              ),
+        (sltp.NiceFactory   , 'start_tasks' , [sltp.FactoryTask(f_target)]* n_items             ),
+        (sltp.NiceFactory   , 'start_tasks' , [{'target': f_target, 'id_': 'x'}]* n_items       ),]
+    for type_, param, value in cases    :
+        schema  = type_._g_schema()
+        legacy  = OrderedDict(schema.params)
+        title   = f'{type_.__name__}.{param}[{type(value[0]).__name__}]'
+        before  = _run(
+            f'{title} (legacy)'                                                         ,
+            lambda : type_._g_param_value(param, value, legacy, schema.recursive_params),
+            number  = 20                                                                ,
+            unit    = f'{len(value)} items'                                             )
+        after   = _run(
+            f'{title} (compiled)'                                                       ,
+            lambda : schema.converters[param](value)                                    ,
+            number  = 20                                                                ,
+            unit    = f'{len(value)} items'                                             )
+        print(f'{title:<50}: x{before/ after:.2f}')
+def bench_records   (
+    ):
+    '''Loading polymorphic task definitions, ``select_type`` per record vs ``from_records``.
+    '''
+    fqn     = 'saltools.schedule.ScheduledTask'
+    records = [
+        {'type': fqn, 'target': f_target, 'id_': f'task_{i}', 'is_parallel': 'y'} for i in range(1000)]
+    def select_type (
+        ):
+        for record in records   :
+            kwargs  = dict(record)
+            slts.ScheduledTask.select_type(kwargs.pop('type'), kwargs)
+    before  = _run(
+        'select_type'                                                       ,
+        select_type                                                         ,
+        number  = 20                                                        ,
+        unit    = f'{len(records)} records'                                 )
+    after   = _run(
+        'from_records'                                                      ,
+        lambda : list(slts.ScheduledTask.from_records(records, [], 'type')) ,
+        number  = 20                                                        ,
+        unit    = f'{len(records)} records'                                 )
+    print(f'{"select_type/from_records":<50}: x{before/ after:.2f}')
+def bench_frozen    (
+    ):
+    '''Set and dict operations on large task collections, str based vs cached hash.
+    '''
+    class StrHashTask   (
+        slts.ScheduledTask  ):
+        EasyObj_IS_FROZEN   = False
+    n_tasks = 2000
+    for name, type_ in [('str hash', StrHashTask), ('frozen', slts.ScheduledTask)]:
+        tasks   = [type_(f_target, id_= f'task_{i}', args= [i]) for i in range(n_tasks)]
+        tasks_s = set(tasks)
+        unit    = f'{n_tasks} tasks'
+        _run(f'set(tasks) ({name})'         , lambda : set(tasks)                           , 5, unit)
+        _run(f'task in set ({name})'        , lambda : [t in tasks_s for t in tasks]        , 5, unit)
+        _run(f'dict.fromkeys(tasks) ({name})', lambda : dict.fromkeys(tasks)                , 5, unit)
+        _run(f'task == task ({name})'       , lambda : [t == t for t in tasks]              , 5, unit)
+def _parse_date_legacy  (
+    dt_str              ,
+    is_start    = True  ):
+    try         :
+        ts  = float(dt_str)
+        if      ts > 9999999999 :
+            ts  /= 100
+        return dt.fromtimestamp(ts)
+    except      :
+        pass
+    default_date    = dt(dt.now().year, 1, 1, 0, 0, 0) if is_start else dt(dt.now().year, 12, 31, 23, 59, 59)
+    return dparse(dt_str,fuzzy= True, default= default_date )
+def bench_dates     (
+    ):
+    '''Datetime parsing, dateutil only vs fast formats and cache.
+    '''
+    n_dates = 1000
+    strs    = [f'2020-01-{i%28+1:02}T{i%24:02}:{i%60:02}:00' for i in range(n_dates)]
+    repeats = strs[:10]* (n_dates// 10)
+    unit    = f'{n_dates} dates'
+    fast    = sltc.EasyObj.DEFAULT_PARSERS[dt]
+    def c_fast_uncached (
+        ):
+        sltc._parse_date_fast.cache_clear()
+        return [fast(x) for x in strs]
+    _run('iso, distinct (legacy)'           , lambda : [_parse_date_legacy(x) for x in strs]    , 5, unit)
+    _run('iso, distinct (fast, uncached)'   , c_fast_uncached                                   , 5, unit)
+    _run('iso, repeated (legacy)'           , lambda : [_parse_date_legacy(x) for x in repeats] , 5, unit)
+    _run('iso, repeated (fast)'             , lambda : [fast(x) for x in repeats]               , 5, unit)
+    _run('iso, repeated (parse_dates)'      , lambda : sltc.parse_dates(repeats)                , 5, unit)
+    fuzzy   = [f'Jan {i%28+1} 2020 at {i%12+1}pm' for i in range(n_dates)]
+    _run('fuzzy, distinct (legacy)'         , lambda : [_parse_date_legacy(x) for x in fuzzy]   , 5, unit)
+    _run('fuzzy, distinct (fast, cached)'   , lambda : [fast(x) for x in fuzzy]                 , 5, unit)
+def bench_registry  (
+    ):
+    '''Type resolution by fqn, import_module and getattr vs the type registry.
+    '''
+    import  importlib
+    fqn     = 'saltools.schedule.ScheduledTask'
+    def g_fqn_type_legacy   (
+        fqn ):
+        module_ = '.'.join(fqn.split('.')[:-1])
+        class_  = fqn.split('.')[-1]
+        return getattr(importlib.import_module(module_), class_)
+    _run('resolve fqn (import_module)'  , lambda : g_fqn_type_legacy(fqn)       , unit= 'type')
+    _run('resolve fqn (TYPE_REGISTRY)'  , lambda : sltc.TYPE_REGISTRY.g_type(fqn), unit= 'type')
+class DictPickleTask    (
+    sltp.FactoryTask    ):
+    '''Pickled from its ``__dict__``, as before ``EasyObj.__reduce__``.
+    '''
+    __reduce__  = object.__reduce__
+class DictPickleSchedule(
+    slts.Schedule       ):
+    __reduce__  = object.__reduce__
+def bench_pickle    (
+    ):
+    '''Pickle round trips, ``__dict__`` based vs params values tuples.
+    '''
+    n_tasks = 1000
+    unit    = f'{n_tasks} tasks'
+    for name, task_type, schedule_type in [
+        ('dict'     , DictPickleTask    , DictPickleSchedule),
+        ('reduce'   , sltp.FactoryTask  , slts.Schedule     )]:
+        tasks   = [task_type(f_target, id_= f'task_{i}', args= [i, 'x']) for i in range(n_tasks)]
+        size    = sum(len(pickle.dumps(task, sltc.PICKLE_PROTOCOL)) for task in tasks)
+        print(f'{"task pickle size ("+ name+ ")":<50}: {size/ n_tasks:>10.2f} bytes/task')
+        _run(f'dumps+loads each task ({name})'  , lambda : [
+            pickle.loads(pickle.dumps(task, sltc.PICKLE_PROTOCOL)) for task in tasks]  , 5, unit)
+        _run(f'dumps+loads all tasks ({name})'  , lambda : 
+            pickle.loads(pickle.dumps(tasks, sltc.PICKLE_PROTOCOL))                     , 5, unit)
+        schedule    = schedule_type(
+            tasks   = [{'target': f_target, 'id_': f'task_{i}'} for i in range(10)]    ,
+            dates   = ['2020-01-01T10:00:00']                                           ,
+            times   = [{'second': 30}, {'minute': 5}]                                   )
+        print(f'{"schedule pickle size ("+ name+ ")":<50}: {len(pickle.dumps(schedule, sltc.PICKLE_PROTOCOL)):>10} bytes')
+    data        = bytearray(2** 24)
+    task        = sltp.FactoryTask(f_target, args= [pickle.PickleBuffer(data)])
+    _run('to_bytes 16MB arg (in-band)'      , lambda : task.to_bytes()      , 20, 'task')
+    _run('to_bytes 16MB arg (out-of-band)'  , lambda : task.to_bytes([])    , 20, 'task')
+
+if      __name__ == '__main__'  :
+    bench_schema()
+    bench_fast_init()
+    bench_slots()
+    bench_converters()
+    bench_records()
+    bench_frozen()
+    bench_dates()
+    bench_registry()
+    bench_pickle()
\ No newline at end of file
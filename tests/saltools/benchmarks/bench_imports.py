@@ -0,0 +1,67 @@
+'''Import time benchmarks.
+
+    Run from the repository root with ``python -m tests.saltools.benchmarks.bench_imports``.
+    Each module is imported in a fresh interpreter with ``-X importtime``.
+'''
+from    collections         import  defaultdict
+
+import  subprocess
+import  sys
+import  os
+
+SRC_PATH    = os.path.abspath(os.path.join(
+    os.path.dirname(__file__)   ,
+    '../../../src'              ))
+MODULES     = [
+    'saltools.common'   ,
+    'saltools.logging'  ,
+    'saltools.misc'     ,
+    'saltools.schedule' ,
+    'saltools.parallel' ,
+    'saltools.web'      ]
+#Must not be imported by any of MODULES.
+HEAVY       = [
+    'sqlalchemy'        ,
+    'sqlalchemy_utils'  ,
+    'requests'          ,
+    'lxml'              ,
+    'dateutil.parser'   ]
+
+def g_import_times  (
+    module          ,
+    repeat  = 5     ):
+    '''Imports a module in a fresh interpreter.
+
+        Args:
+            module  (str    ): The module to import.
+            repeat  (int    ): Number of runs, the best cumulative time of each module is kept.
+
+        Returns:
+            dict    : Imported module name, best cumulative import time in us.
+    '''
+    env                 = dict(os.environ)
+    env['PYTHONPATH']   = SRC_PATH
+    times               = defaultdict(lambda : float('inf'))
+    for i in range(repeat)  :
+        stderr  = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}']  ,
+            env     = env                                                   ,
+            stderr  = subprocess.PIPE                                       ,
+            check   = True                                                  ,
+            universal_newlines  = True                                      ).stderr
+        for line in stderr.splitlines()[1:] :
+            if      not line.startswith('import time:') :
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            name                = name.strip()
+            times[name]         = min(times[name], int(cumulative))
+    return times
+def bench_imports   (
+    ):
+    for module in MODULES   :
+        times   = g_import_times(module)
+        heavy   = [name for name in HEAVY if name in times]
+        print(f'{module:<30}: {times[module]/ 1e3:>10.2f} ms {"heavy: "+ ", ".join(heavy) if heavy else ""}')
+
+if      __name__ == '__main__'  :
+    bench_imports()
\ No newline at end of file
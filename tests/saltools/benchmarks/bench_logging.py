@@ -0,0 +1,572 @@
+'''Logging benchmarks.
+
+    Run from the repository root with ``python -m tests.saltools.benchmarks.bench_logging``.
+'''
+from    time                import  perf_counter    , time_ns
+from    datetime            import  datetime
+from    timeit              import  repeat
+
+import  saltools.logging    as      sltl
+
+import  multiprocessing
+import  threading
+import  textwrap
+import  asyncio
+import  tempfile
+import  csv
+import  os
+
+N_LOGS  = 20000
+
+class LegacyConsoleLogger   (
+    sltl.ConsoleLogger  ):
+    '''Formats each log from scratch, as before the formatters.
+    '''
+    def _execute_log(
+            self            , 
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          ):
+        is_one_line = is_one_line if is_one_line != None else self.is_one_line
+        prefix      = '' if is_raw else f'[{log_datetime}][{self.id_:<20}] [{level.name:<8}]: '
+        if      is_one_line    :
+            dict_text   = '|'.join([f'{k}, {v}' for k, v in log_dict.items()])  if\
+                            isinstance(log_dict, dict)                          else\
+                            str(log_dict) 
+            text        = f'{prefix}{dict_text}'
+        else                :
+            if      not isinstance(log_dict, dict)    :
+                log_dict = {log_dict: ''}
+            prefix          +='' if is_raw else '\n'
+            format_message  = lambda message: '\n'+ '\n'.join(textwrap.wrap(
+                        message                         , 
+                        subsequent_indent   = '\t\t'    , 
+                        initial_indent      = '\t\t'    , 
+                        width               = 100       , 
+                        break_on_hyphens    = True      )) 
+            dict_text       = '\n'.join([f'\t{k:<20}:{format_message(str(v))}' for k,v in log_dict.items()])
+            text            = f'{prefix}{dict_text}'+'\n'+'='*120
+        if self.is_print_log    :
+            print(text)
+        return text
+class LegacyFileLogger  (
+    sltl.FileLogger ):
+    '''Opens and closes the file for each log, as before the batched drain.
+    '''
+    def _execute_log(
+            self            , 
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          ):
+        text    = sltl.ConsoleLogger._execute_log(
+            self        ,
+            level       , 
+            log_dict    ,
+            log_datetime,
+            is_one_line ,
+            is_raw      )
+        with open(self._g_path(level),'a') as f :
+            f.write(text+'\n')
+        return text
+class LegacyCsvLogger   (
+    sltl.CsvLogger  ):
+    def _execute_log(
+            self            , 
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          ):
+        if      not isinstance(log_dict, dict):
+            log_dict    = {str(log_dict): ''}
+        with open(self._g_path(level),'a') as f :
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerows([[
+                    log_datetime        ,
+                    self.id_            ,
+                    level.name          ,
+                    key                 ,
+                    str(log_dict[key])  ] for key in log_dict])
+
+class LegacySQLLogger   (
+    sltl.SQLLogger  ):
+    '''Adds an ORM row per key and commits each log, as before the bulk inserts.
+    '''
+    def _on_init    (
+        self    ):
+        from    sqlalchemy.orm  import  sessionmaker
+        self.session = sessionmaker(bind= self.engine)()
+    def _execute_log(
+            self            , 
+            level           , 
+            log_dict        ,
+            log_datetime    ,
+            is_one_line     ,
+            is_raw          ):
+        if      not isinstance(log_dict, dict)    :
+                log_dict = {log_dict: ''}
+        for key in log_dict:
+            row = self.tables[level.name](
+                log_datetime= log_datetime          ,
+                title       = f'{self.id_}:::{key}' ,
+                message     = str(log_dict[key])    )
+            self.session.add(row)
+        self.session.commit()
+
+def _run_logger     (
+    title           ,
+    logger          ,
+    n_logs  = N_LOGS):
+    '''Logs ``n_logs`` logs and waits for the logger to write them.
+    '''
+    logger.start()
+    start   = perf_counter()
+    for i in range(n_logs)  :
+        logger.info({'index': i, 'message': 'Some message'})
+    logger.stop()
+    elapsed = perf_counter()- start
+    print(f'{title:<50}: {n_logs/ elapsed:>10.0f} logs/s')
+    return elapsed
+def bench_files     (
+    ):
+    '''File and csv loggers throughput, open per log vs buffered handles.
+    '''
+    with tempfile.TemporaryDirectory() as root  :
+        for name, type_, kwargs in [
+            ('file (open per log)'      , LegacyFileLogger  , {'batch_size': 1} ),
+            ('file (buffered)'          , sltl.FileLogger   , {}                ),
+            ('csv (open per log)'       , LegacyCsvLogger   , {'batch_size': 1} ),
+            ('csv (buffered)'           , sltl.CsvLogger    , {}                )]:
+            logger  = type_(
+                id_             = name.split()[0]   ,
+                root            = root              ,
+                is_overwrite    = True              ,
+                is_print_log    = False             ,
+                **kwargs                            )
+            _run_logger(name, logger)
+class StatFileLogger    (
+    sltl.FileLogger ):
+    '''Checks the file size with a ``stat`` per log.
+    '''
+    def _execute_log(
+            self            , 
+            *args           ):
+        text    = super()._execute_log(*args)
+        os.stat(self._g_path(args[0]))
+        return text
+def bench_rotation  (
+    ):
+    '''Rotation overhead, no rotation vs a ``stat`` per log vs the per batch check.
+    '''
+    with tempfile.TemporaryDirectory() as root  :
+        for name, type_, kwargs in [
+            ('file (no rotation)'               , sltl.FileLogger   , {}    ),
+            ('file (stat per log)'              , StatFileLogger    , {}    ),
+            ('file (1GB, never rotated)'        , sltl.FileLogger   , {
+                'max_bytes'     : 1<< 30    ,
+                'rotate_interval': 3600     }),
+            ('file (100KB, gzip, 5 kept)'       , sltl.FileLogger   , {
+                'max_bytes'     : 100<< 10  ,
+                'backup_count'  : 5         ,
+                'compression'   : 'gzip'    })]:
+            logger  = type_(
+                id_             = name.split()[0]   ,
+                root            = root              ,
+                is_overwrite    = True              ,
+                is_print_log    = False             ,
+                **kwargs                            )
+            _run_logger(name, logger)
+def bench_json      (
+    ):
+    '''Csv vs JSON lines loggers, writing and reading back the logs.
+    '''
+    n_logs  = 5* N_LOGS
+    with tempfile.TemporaryDirectory() as root  :
+        for name, type_ in [('csv', sltl.CsvLogger), ('json', sltl.JsonLogger)]   :
+            logger  = type_(id_= name, root= root, is_print_log= False)
+            logger.start()
+            start   = perf_counter()
+            for i in range(n_logs)  :
+                (logger.error if i % 1000 == 0 else logger.info)({'index': i, 'message': 'Some message'})
+            logger.stop()
+            elapsed = perf_counter()- start
+            print(f'{name+ " write":<50}: {n_logs/ elapsed:>10.0f} logs/s')
+
+        path    = os.path.join(root, 'csv', 'combined.log')
+        start   = perf_counter()
+        with open(path, newline= '') as f   :
+            n_rows  = sum(1 for row in csv.reader(f))
+        print(f'{"csv read, rows only":<50}: {perf_counter()- start:>10.4f} s, {n_rows} rows')
+        
+        path    = os.path.join(root, 'json')
+        ts      = [log['ts'] for log in sltl.read_json_logs(path)]
+        for title, kwargs in [
+            ('json read, all'           , {}                                ),
+            ('json read, last 1%'       , {'start': ts[-len(ts)// 100]}     ),
+            ('json read, errors'        , {'level': 'ERROR'}                )]:
+            start   = perf_counter()
+            n_logs_ = sum(1 for log in sltl.read_json_logs(path, **kwargs))
+            print(f'{title:<50}: {perf_counter()- start:>10.4f} s, {n_logs_} logs')
+def bench_sql       (
+    ):
+    '''SQLite logger throughput, a commit per log vs bulk inserts.
+    '''
+    import  saltools.misc   as sltm
+    with tempfile.TemporaryDirectory() as root  :
+        for name, type_, kwargs, n_logs in [
+            ('db (commit per log)'      , LegacySQLLogger   , {'batch_size': 1} , 2000  ),
+            ('db (bulk)'                , sltl.SQLLogger    , {}                , N_LOGS)]:
+            logger  = type_(
+                id_             = name.split()[0]                                           ,
+                engine_builder  = sltm.SQLAlchemyEBuilder(db= '/'+ os.path.join(root, name)),
+                is_print_log    = False                                                     ,
+                **kwargs                                                                    )
+            _run_logger(name, logger, n_logs)
+def bench_sql_query (
+    ):
+    '''"ERRORs of a logger in the last hour", per key rows vs the events table.
+
+        10 loggers, 200k logs over 10 days, 1% errors.
+    '''
+    import  saltools.misc   as sltm
+    from    datetime        import  datetime, timedelta
+    import  json
+    n_logs  = 200000
+    now     = datetime.now()
+    logs    = [(
+        now- timedelta(days= 10)* (1- i/ n_logs)        ,
+        f'factory{i % 10}'                              ,
+        sltl.Level.ERROR if i % 97 == 0 else sltl.Level.INFO  ,
+        {'index': i, 'message': 'Some message'}         ) for i in range(n_logs)]
+    with tempfile.TemporaryDirectory() as root  :
+        builder = sltm.SQLAlchemyEBuilder(db= '/'+ os.path.join(root, 'query.db'))
+        key     = sltl.SQLLogger(id_= 'key', engine_builder= builder, is_combine= True, is_print_log= False)
+        events  = sltl.SQLLogger(id_= 'factory3', engine_builder= builder, is_normalized= True, is_print_log= False)
+        with builder.engine.begin() as connection   :
+            connection.execute(key.tables['combined'].__table__.insert(), [{
+                'log_datetime'  : ts.isoformat()            ,
+                'level'         : level.name                ,
+                'title'         : f'{id_}:::{k}'            ,
+                'message'       : str(v)                    } for ts, id_, level, log in logs for k, v in log.items()])
+            connection.execute(events.tables['events'].__table__.insert(), [{
+                'ts'            : ts                        ,
+                'level'         : level.value               ,
+                'logger'        : id_                       ,
+                'payload'       : json.dumps(log)           } for ts, id_, level, log in logs])
+
+        start_ts    = now- timedelta(hours= 1)
+        sql         = '''SELECT * FROM key_combined WHERE level = 'ERROR' AND title LIKE 'factory3:::%' 
+            AND log_datetime >= ?'''
+        for name, fn in [
+            ('per key rows, LIKE scan'  , lambda : builder.engine.execute(sql, start_ts.isoformat()).fetchall()),
+            ('events table, query_logs' , lambda : list(events.query_logs(start= start_ts, level= 'ERROR')))]:
+            n_rows  = len(fn())
+            elapsed = min(repeat(fn, number= 10, repeat= 3))/ 10
+            print(f'{name:<50}: {elapsed* 1e3:>10.3f} ms, {n_rows} rows')
+def bench_formatters(
+    ):
+    '''Formatting throughput for typical logs, legacy vs ``TextFormatter``.
+    '''
+    log     = {
+        'url'       : 'https://www.example.com/products?page=12&sort=price' ,
+        'status'    : 200                                                   ,
+        'elapsed'   : 0.123456                                              ,
+        'message'   : 'Page parsed, 48 items found'                         }
+    traceback   = dict(log, trace= 'Traceback (most recent call last): '* 10)
+    for name, type_ in [('legacy', LegacyConsoleLogger), ('formatter', sltl.ConsoleLogger)]  :
+        logger  = type_(is_print_log= False)
+        for title, log_, is_one_line in [
+            ('one line'         , log       , True  ),
+            ('multi-line'       , log       , False ),
+            ('multi-line, long' , traceback , False )]:
+            elapsed = min(repeat(
+                lambda : logger._execute_log(sltl.Level.INFO, log_, '2020-01-01T00:00:00', is_one_line, False),
+                number  = N_LOGS    ,
+                repeat  = 3         ))
+            print(f'{name+ ", "+ title:<50}: {N_LOGS/ elapsed:>10.0f} logs/s')
+def bench_levels    (
+    ):
+    '''Cost of a logging call at the call site, disabled vs enabled levels.
+    '''
+    logger  = sltl.ConsoleLogger(level= sltl.Level.INFO)
+    for name, fn in [
+        ('debug, disabled'              , lambda : logger.debug('message')                  ),
+        ('log(DEBUG), disabled'         , lambda : logger.log(sltl.Level.DEBUG, 'message')  ),
+        ('info, enabled'                , lambda : logger.info('message')                   ),
+        ('empty lambda'                 , lambda : None                                     )]:
+        best    = min(repeat(fn, number= N_LOGS, repeat= 5))
+        logger._queue.queue.clear()
+        print(f'{name:<50}: {best/ N_LOGS* 1e9:>10.0f} ns/call')
+class LegacyTsLogger    (
+    sltl.ConsoleLogger  ):
+    '''Formats the timestamp at the call site, as before the ns capture.
+    '''
+    def log         (
+        self                    ,         
+        level                   , 
+        log_dict                ,
+        is_one_line    = None   ,
+        is_raw         = False  ):
+        if      level in self._disabled_levels  :
+            return
+        self._put([
+            level                           ,
+            log_dict                        ,
+            datetime.now().isoformat()      ,
+            is_one_line                     ,
+            is_raw                          ])
+def bench_timestamps(
+    ):
+    '''Timestamp cost, at the call site and on the logging thread.
+    '''
+    for name, type_ in [('call site, isoformat', LegacyTsLogger), ('call site, time_ns', sltl.ConsoleLogger)]:
+        logger  = type_()
+        best    = min(repeat(lambda : logger.log(sltl.Level.INFO, 'message'), number= N_LOGS, repeat= 5))
+        logger._queue.queue.clear()
+        print(f'{name:<50}: {best/ N_LOGS* 1e9:>10.0f} ns/call')
+    formatter   = sltl.TimestampFormatter()
+    ts          = time_ns()
+    #A log every 10 us
+    best        = min(repeat(
+        lambda : [formatter.format(ts+ i* 10000) for i in range(N_LOGS)], number= 1, repeat= 5))
+    print(f'{"logging thread, TimestampFormatter":<50}: {best/ N_LOGS* 1e9:>10.0f} ns/log')
+def bench_rate_limit(
+    ):
+    '''An exception flood from 4 threads, without and with rate limiting.
+
+        Elapsed includes the logging thread catching up on stop.
+    '''
+    from    threading   import  Thread
+    error   = {
+        'id'    : '2020-01-01T00:00:00_fn'  ,
+        'File'  : 'crawler.py'              ,
+        'Origin': 'crawler.fetch'           ,
+        'Type'  : 'ConnectionError'         ,
+        'Line'  : 42                        ,
+        'Code'  : 'return session.get(url)' ,
+        'Msg'   : 'Connection refused'      }
+    with tempfile.TemporaryDirectory() as root  :
+        for name, kwargs in [('no limit', {}), ('rate_limit= 10', {'rate_limit': 10})]:
+            logger  = sltl.FileLogger(id_= name.split()[0], root= root, is_print_log= False, **kwargs)
+            logger.start()
+            start   = perf_counter()
+            threads = [Thread(target= lambda : [logger.error(error) for i in range(N_LOGS)]) for i in range(4)]
+            for thread in threads   :
+                thread.start()
+            for thread in threads   :
+                thread.join()
+            produced= perf_counter()- start
+            logger.stop()
+            elapsed = perf_counter()- start
+            print(f'{name:<50}: {4* N_LOGS/ produced:>10.0f} calls/s, {elapsed:>8.3f} s to write, '
+                f'{logger.n_suppressed} suppressed')
+    
+    for name, kwargs in [('call site, no limit', {}), ('call site, rate_limit', {'rate_limit': 1e9})]:
+        logger  = sltl.ConsoleLogger(**kwargs)
+        best    = min(repeat(lambda : logger.error(error), number= N_LOGS, repeat= 5))
+        logger._queue.queue.clear()
+        print(f'{name:<50}: {best/ N_LOGS* 1e9:>10.0f} ns/call')
+class SlowLogger    (
+    sltl.ConsoleLogger  ):
+    '''Takes about 20 us per log.
+    '''
+    def _execute_log(
+        self    ,
+        *item   ):
+        start   = perf_counter()
+        while perf_counter()- start < 20e-6 :
+            pass
+def bench_overflow  (
+    ):
+    '''Producer throughput and drops with a slow sink, by overflow policy.
+    '''
+    for policy in [None]+ list(sltl.OverflowPolicy)   :
+        logger  = SlowLogger(
+            capacity        = 0 if policy is None else 1000 ,
+            overflow_policy = policy or 'BLOCK'             ,
+            is_print_log    = False                         )
+        logger.start()
+        start   = perf_counter()
+        max_size= 0
+        for i in range(N_LOGS)  :
+            logger.info(i)
+            if      not i% 100  :
+                max_size    = max(max_size, logger._queue.qsize())
+        elapsed = perf_counter()- start
+        logger.stop()
+        name    = 'unbounded' if policy is None else policy.name
+        print(f'{name:<50}: {N_LOGS/ elapsed:>10.0f} logs/s, {logger.n_dropped:>6} dropped, {max_size:>6} max queued')
+def _log_child      (
+    channel ,
+    root    ):
+    if      channel :
+        channel.attach()
+    logger  = sltl.CsvLogger(id_= 'child', root= root, is_print_log= False)
+    logger.start()
+    for i in range(N_LOGS)  :
+        logger.info({'index': i, 'message': 'Some message'})
+    logger.stop()
+    if      channel :
+        channel.close()
+def bench_multi     (
+    ):
+    '''File, csv and JSON sinks, three loggers vs a ``MultiLogger``.
+    '''
+    with tempfile.TemporaryDirectory() as root  :
+        g_sinks = lambda name: [type_(id_= f'{name}-{type_.__name__}', root= root, is_print_log= False) for 
+            type_ in [sltl.FileLogger, sltl.CsvLogger, sltl.JsonLogger]]
+        for name in ['three loggers', 'multi, inline', 'multi, isolated']:
+            loggers = g_sinks(name) if name == 'three loggers' else [sltl.MultiLogger(
+                sinks       = g_sinks(name)         ,
+                is_isolated = 'isolated' in name    )]
+            for logger in loggers   :
+                logger.start()
+            start   = perf_counter()
+            for i in range(N_LOGS)  :
+                log     = {'index': i, 'message': 'Some message'}
+                for logger in loggers   :
+                    logger.info(log)
+            produced= perf_counter()- start
+            for logger in loggers   :
+                logger.stop()
+            elapsed = perf_counter()- start
+            print(f'{name:<50}: {N_LOGS/ produced:>10.0f} calls/s, {N_LOGS/ elapsed:>10.0f} logs/s written')
+def bench_pool      (
+    ):
+    '''50 csv loggers, a thread each vs a ``LogPool`` of 2 threads.
+    '''
+    n_loggers   = 50
+    with tempfile.TemporaryDirectory() as root  :
+        for name, pool in [('thread per logger', None), ('pool of 2 threads', sltl.LogPool(n_threads= 2))]:
+            n_threads   = threading.active_count()
+            loggers     = [sltl.CsvLogger(
+                id_             = f'pool-{i}'   ,
+                root            = root          ,
+                is_print_log    = False         ,
+                flush_records   = 256           ,
+                flush_interval  = 1.0           ,
+                pool            = pool          ) for i in range(n_loggers)]
+            for logger in loggers   :
+                logger.start()
+            n_threads   = threading.active_count()- n_threads
+            start       = perf_counter()
+            for i in range(N_LOGS// 10) :
+                log     = {'index': i, 'message': 'Some message'}
+                for logger in loggers   :
+                    logger.info(log)
+            for logger in loggers   :
+                logger.stop()
+            elapsed     = perf_counter()- start
+            print(f'{name:<50}: {n_threads:>4} threads, {n_loggers* N_LOGS// 10/ elapsed:>10.0f} logs/s')
+def bench_stats     (
+    ):
+    '''Csv logger throughput, stats disabled vs enabled.
+    '''
+    with tempfile.TemporaryDirectory() as root  :
+        for name, is_stats in [('stats disabled', False), ('stats enabled', True)]:
+            logger  = sltl.CsvLogger(
+                id_             = name      ,
+                root            = root      ,
+                is_print_log    = False     ,
+                flush_records   = 256       ,
+                is_stats        = is_stats  )
+            logger.start()
+            start   = perf_counter()
+            for i in range(N_LOGS)  :
+                logger.info({'index': i, 'message': 'Some message'})
+            logger.stop()
+            elapsed = perf_counter()- start
+            stats   = logger.stats()
+            print(f'{name:<50}: {N_LOGS/ elapsed:>10.0f} logs/s, max queue depth {stats["max_queue_depth"]:>6}, '
+                f'latency p50 {stats["latency_p50_us"]:>8} us, p99 {stats["latency_p99_us"]:>8} us')
+def bench_channel   (
+    ):
+    '''Logging from 4 child processes, a writer thread per child vs the parent logger.
+    '''
+    n_children  = 4
+    with tempfile.TemporaryDirectory() as root  :
+        for name, is_channel in [('writer per child', False), ('log channel', True)]:
+            logger  = sltl.CsvLogger(id_= 'child', root= root, is_print_log= False)
+            channel = sltl.LogChannel(logger)
+            logger.start()
+            channel.start()
+            start       = perf_counter()
+            processes   = [multiprocessing.get_context('fork').Process(
+                target  = _log_child                                ,
+                args    = (channel if is_channel else None, root)   ) for i in range(n_children)]
+            for process in processes    :
+                process.start()
+            for process in processes    :
+                process.join()
+            channel.stop()
+            logger.stop()
+            elapsed     = perf_counter()- start
+            print(f'{name:<50}: {n_children* N_LOGS/ elapsed:>10.0f} logs/s')
+
+class AsyncCsvLogger    (
+    sltl.AsyncLogger,
+    sltl.CsvLogger  ):
+    pass
+
+def bench_async     (
+    ):
+    '''Stopping a logger with a backlog of logs from a coroutine.
+
+        The longest event loop stall is measured by a ticking task while the backlog is written.
+    '''
+    async def tick      (
+        stalls  ):
+        while True  :
+            start   = perf_counter()
+            await asyncio.sleep(0)
+            stalls.append(perf_counter()- start)
+
+    async def run       (
+        logger_type ,
+        is_astop    ,
+        root        ):
+        logger  = logger_type(id_= 'async', root= root, is_print_log= False)
+        stalls  = []
+        logger.start()
+        for i in range(N_LOGS)  :
+            await logger.alog(sltl.Level.INFO, {'message': i})
+        ticker  = asyncio.get_running_loop().create_task(tick(stalls))
+        await asyncio.sleep(0)
+        start   = perf_counter()
+        if      is_astop    :
+            await logger.astop()
+        else                :
+            logger.stop()
+        elapsed = perf_counter()- start
+        await asyncio.sleep(0)
+        ticker.cancel()
+        return elapsed, max(stalls)
+
+    with tempfile.TemporaryDirectory() as root  :
+        for name, logger_type, is_astop in [
+            ('thread logger, stop'      , sltl.CsvLogger    , False ),
+            ('thread logger, astop'     , sltl.CsvLogger    , True  ),
+            ('event loop logger, astop' , AsyncCsvLogger    , True  )]:
+            elapsed, stall  = asyncio.run(run(logger_type, is_astop, root))
+            print(f'{name:<50}: stopped in {elapsed* 1e3:>8.2f} ms, max loop stall {stall* 1e3:>8.2f} ms')
+
+if      __name__ == '__main__'  :
+    bench_files()
+    bench_rotation()
+    bench_json()
+    bench_sql()
+    bench_sql_query()
+    bench_formatters()
+    bench_levels()
+    bench_timestamps()
+    bench_rate_limit()
+    bench_overflow()
+    bench_multi()
+    bench_pool()
+    bench_stats()
+    bench_channel()
+    bench_async()
\ No newline at end of file
@@ -6,6 +6,9 @@ from    enum            import  Enum
 import  saltools.common as      sltc
 
 import  pytest 
+import  pickle
+import  copy
+import  gc
 import  json
 
 def test_DummyObj   (
@@ -40,6 +43,34 @@ class TestEasyObj   (
         self    ):
         parser  = sltc.EasyObj.DEFAULT_PARSERS[dt]
         assert  parser('1577689633.7279496') == parser('2019-12-30T08:07:13.727950')
+    def test_parse_date         (
+        self    ):
+        parser  = sltc.EasyObj.DEFAULT_PARSERS[dt]
+        date    = dt(2019, 12, 30, 8, 7, 13)
+        epoch   = dt.fromtimestamp(1577689633)
+
+        #Epochs in seconds, ms, us and ns
+        assert  parser('1577689633'         ) == epoch
+        assert  parser(1577689633000        ) == epoch
+        assert  parser('1577689633000000'   ) == epoch
+        assert  parser(1577689633000000000  ) == epoch
+        
+        #Fixed formats, the fuzzy parser is the fallback
+        assert  parser('2019-12-30T08:07:13'        ) == date
+        assert  parser('2019/12/30 08:07:13'        ) == date
+        assert  parser('12/30/2019 08:07:13'        ) == date
+        assert  parser('Dec 30 2019 at 08:07:13'    ) == date
+        
+        #Missing parts default to the end if not is_start
+        assert  parser('2019-12-30'                 ) == dt(2019, 12, 30)
+        assert  parser('2019-12-30'         , False ) == dt(2019, 12, 30, 23, 59, 59)
+        assert  parser('12/30/2019'         , False ) == dt(2019, 12, 30, 23, 59, 59)
+        assert  parser('2019-12-30 08:07'   , False ) == dt(2019, 12, 30, 8, 7, 59)
+        with    pytest.raises(ValueError):
+            parser('Not a date')
+        
+        assert  sltc.parse_dates(['2019-12-30', 1577689633, '2019-12-30']) == [
+            dt(2019, 12, 30), epoch, dt(2019, 12, 30)]
     def test_params             (
         self    ):
         #Tests inheritance, default params, positional params, named params.
@@ -253,4 +284,303 @@ class TestEasyObj   (
         rep_str     = b.__repr__()
         
         assert  'xxx'       in str_str
-        assert  'None'      in rep_str
\ No newline at end of file
+        assert  'None'      in rep_str
+    def test_schema_cache       (
+        self    ):
+        class A(
+            sltc.EasyObj    ):
+            EasyObj_PARAMS  = OrderedDict((
+                ('a0'   , {}            ),
+                ('ax'   , {
+                    'default'   : 'ax'  }),))
+        class B(
+            A   ):
+            EasyObj_PARAMS  = OrderedDict((
+                ('b0'   , {}            ),))
+
+        A('a0')
+        assert  A._g_schema() is A._g_schema()
+        assert  B._g_schema().names == ('a0', 'b0', 'ax')
+        assert  A._g_schema().names == ('a0', 'ax')
+
+        A.EasyObj_PARAMS['ay']  = {'default': 'ay'}
+        A.reset_schema()
+        assert  B('a0', 'b0').ay == 'ay'
+    def test_fast_init          (
+        self    ):
+        class TestEnum  (
+            Enum    ):
+            P0  = 0
+            P1  = 1
+        def g_class(is_fast_init):
+            class A(
+                sltc.EasyObj    ):
+                EasyObj_IS_FAST_INIT    = is_fast_init
+                EasyObj_PARAMS          = OrderedDict((
+                    ('p0'   , {
+                        'type'      : str               ,
+                        'parser'    : lambda x: x+ x    ,
+                        'adapter'   : lambda x: x+ x    },),
+                    ('p1'   , {
+                        'default'   : 'P0'      ,
+                        'type'      : TestEnum  },),
+                    ('p2'   , {
+                        'default'   : []        ,
+                        'type'      : [int]     },),))
+            class B(
+                A   ):
+                EasyObj_PARAMS          = OrderedDict((
+                    ('pB'   , {
+                        'default'   : None  ,
+                        'type'      : A     },),))
+            return B
+        cases   = [
+            (('x',)             , {}                                ),
+            (()                 , {'p0': 'x', 'p1': 'P1', 'p2': '1'}),
+            (('x',)             , {'pB': ['y']}                     ),
+            (('x', 'P1', [], 1) , {}                                ),
+            (('x',)             , {'p0': 'x'}                       ),
+            (()                 , {'px': 'x'}                       ),
+            (()                 , {}                                ),
+            (('x',)             , {'p1': 1}                         ),]
+        def g_result(Class, args, kwargs):
+            try                         :
+                return Class(*args, **kwargs)._g_easyObj_values()
+            except  Exception as e      :
+                return (type(e), getattr(e, 'error', None), getattr(e, 'params', None), str(e).split(':')[0])
+        Slow, Fast  = g_class(False), g_class(True)
+        Fast('x')
+        assert  getattr(Fast.__init__, '_EasyObj_IS_GENERATED', False)
+        for args, kwargs in cases   :
+            assert  str(g_result(Fast, args, kwargs)) == str(g_result(Slow, args, kwargs))
+        
+        #Missing params are reported before the conversion errors of the previous params
+        def g_required(is_fast_init):
+            class F(
+                sltc.EasyObj    ):
+                EasyObj_IS_FAST_INIT    = is_fast_init
+                EasyObj_PARAMS          = OrderedDict((
+                    ('a'    , {
+                        'type'  : int   },),
+                    ('b'    , {}        ),))
+            return F
+        found   = g_result(g_required(True) , (), {'a': [1]})
+        assert  str(found) == str(g_result(g_required(False), (), {'a': [1]}))
+        assert  found[:3] == (sltc.ExceptionKwargs, sltc.InfoExceptionType.MISSING, ['b'])
+    def test_slotted            (
+        self    ):
+        @sltc.slotted
+        class A(
+            sltc.EasyObj    ):
+            EasyObj_IS_FAST_INIT    = True
+            EasyObj_PARAMS          = OrderedDict((
+                ('a0'   , {}            ),
+                ('ax'   , {
+                    'default'   : '1'   ,
+                    'type'      : int   }),))
+            EasyObj_SLOTS           = ('ay',)
+            def _on_init(
+                self    ):
+                self.ay = self.ax+ 1
+        @sltc.slotted
+        class B(
+            A   ):
+            EasyObj_PARAMS          = OrderedDict((
+                ('b0'   , {}            ),))
+            EasyObj_SLOTS           = ('by',)
+            def _on_init(
+                self    ):
+                self.by = self.b0
+            def __str__ (
+                self    ):
+                return super().__str__()
+
+        b   = B('a0', 'b0')
+        assert  B.__slots__ == ('b0', 'by')
+        assert  not hasattr(b, '__dict__')
+        assert  b._g_easyObj_values() == {
+            'a0'    : 'a0'  ,
+            'b0'    : 'b0'  ,
+            'ax'    : 1     }
+        assert  (b.ay, b.by) == (2, 'b0')
+        assert  b == B('a0', 'b0') and b != B('a0', 'b1')
+        assert  'b0' in str(b)
+        with pytest.raises(AttributeError):
+            b.bz    = None
+    def test_converters         (
+        self    ):
+        class TestEnum  (
+            Enum    ):
+            P0  = 0
+            P1  = 1
+        class A(
+            sltc.EasyObj    ):
+            EasyObj_PARAMS  = OrderedDict((
+                ('p0'   , {
+                    'default'   : []                ,
+                    'type'      : [TestEnum]        ,
+                    'adapter'   : lambda x: x or [] },),
+                ('p1'   , {
+                    'default'   : None              ,
+                    'type'      : [int]             },),
+                ('p2'   , {
+                    'default'   : None              ,
+                    'type'      : [sltc.MY_CLASS]   },),))
+        
+        schema  = A._g_schema()
+        legacy  = OrderedDict(schema.params)
+        cases   = [
+            ('p0'   , ['P0', TestEnum.P1, None] ),
+            ('p0'   , 'P1'                      ),
+            ('p0'   , None                      ),
+            ('p1'   , ['1', 2]                  ),
+            ('p1'   , '3'                       ),
+            ('p2'   , [{'p1': [1]}]             ),]
+        for param, value in cases   :
+            assert  str(schema.converters[param](value)) == str(
+                A._g_param_value(param, value, legacy, schema.recursive_params))
+        with pytest.raises(AttributeError):
+            A(p0= 'P2')
+    def test_from_records       (
+        self    ):
+        records = [
+            {'id_': 'a', 'target': print}                   ,
+            {'id_': 'b'}                                    ,
+            {'id_': 'c', 'target': print, 'args': 1}        ,
+            {'id_': 'd', 'target': print, 'is_parallel': 'y',
+                'type': 'saltools.schedule.ScheduledTask'}  ,]
+        
+        import  saltools.parallel   as sltp
+        import  saltools.schedule   as slts
+        errors  = []
+        objs    = list(sltp.FactoryTask.from_records(records, errors, 'type'))
+        assert  [obj.id_ for obj in objs] == ['a', 'd']
+        assert  type(objs[1]).__name__ == 'ScheduledTask'
+        assert  [(i, type(e)) for i, e in errors] == [
+            (1, sltc.ExceptionKwargs    ),
+            (2, sltc.ExceptionWrongType )]
+        assert  objs == [sltp.FactoryTask(id_= 'a', target= print), slts.ScheduledTask(
+            id_= 'd', target= print, is_parallel= True)] and objs[1].next_times == []
+        
+        #The type must be a subclass, the records dicts
+        errors  = []
+        objs    = list(sltp.FactoryTask.from_records([
+            {'id_': 'a', 'type': 'saltools.schedule.Time'}, 'b', {'id_': 'c', 'target': print}], errors, 'type'))
+        assert  [obj.id_ for obj in objs] == ['c'] and [(i, type(e)) for i, e in errors] == [
+            (0, TypeError), (1, TypeError)]
+
+        #Types overriding __init__ are created by calling them
+        class B(
+            sltp.FactoryTask    ):
+            def __init__(
+                self        ,
+                *args       ,
+                **kwargs    ):
+                super().__init__(*args, **kwargs)
+                self.id_    = self.id_.upper()
+        errors  = []
+        objs    = list(B.from_records([{'id_': 'a', 'target': print}, {'id_': 'b'}], errors))
+        assert  objs == [B(id_= 'a', target= print)] and objs[0].id_ == 'A'
+        assert  [(i, type(e)) for i, e in errors] == [(1, sltc.ExceptionKwargs)]
+        assert  next(B.from_columns({'id_': ['c'], 'target': [print]})).id_ == 'C'
+
+        objs    = sltp.FactoryTask.from_columns({
+            'target': [print, 'print']  ,
+            'id_'   : ['a', 'b']        })
+        assert  next(objs).id_ == 'a'
+        with pytest.raises(sltc.ExceptionRecords, match= r'1 records failed.*'):
+            next(objs)
+    def test_frozen             (
+        self    ):
+        def g_class(is_fast_init):
+            class A(
+                sltc.EasyObj    ):
+                EasyObj_IS_FAST_INIT    = is_fast_init
+                EasyObj_IS_FROZEN       = True
+                EasyObj_PARAMS          = OrderedDict((
+                    ('p0'   , {}                ),
+                    ('p1'   , {
+                        'default'   : []    },),
+                    ('p2'   , {
+                        'default'   : {}    },),))
+                EasyObj_SLOTS           = ('state',)
+                def _on_init(
+                    self    ):
+                    self.state  = None
+            return A
+        for A in [g_class(False), g_class(True), sltc.slotted(g_class(True))]:
+            a0, a1  = A('a', [1], {'k': [2]}), A('a', [1], {'k': [2]})
+            assert  a0 == a1 and hash(a0) == hash(a1)
+            assert  len({a0, a1}) == 1
+            
+            hash_a0     = hash(a0)
+            a0.state    = 'x'
+            assert  a0._EasyObj_hash == hash_a0
+            a0.p0       = 'b'
+            assert  a0 != a1 and hash(a0) != hash_a0
+            assert  A.__eq__ is not sltc.EasyObj.__eq__
+    def test_type_registry      (
+        self    ):
+        registry    = sltc.TypeRegistry()
+        class A(
+            sltc.EasyObj    ):
+            EasyObj_ALIASES = ('TestA',)
+        
+        assert  sltc.TYPE_REGISTRY.g_type('TestA') is A
+        assert  sltc.TYPE_REGISTRY.g_type(sltc.TypeRegistry.g_fqn(A)) is A
+        assert  sltc.EasyObj.select_type('TestA', {}).__class__ is A
+        with pytest.raises(ValueError):
+            sltc.TYPE_REGISTRY.alias('TestA', 'saltools.common.EasyObj')
+
+        #Lazy aliases are imported on first use only
+        registry.alias('Pretty', 'pprint.PrettyPrinter')
+        assert  'Pretty' in registry.lazy
+        assert  registry.g_type('Pretty').__name__ == 'PrettyPrinter'
+        assert  'Pretty' in registry.types and 'Pretty' not in registry.lazy
+        assert  registry.g_type('OrderedDict', 'collections') is OrderedDict
+        with pytest.raises(AttributeError):
+            registry.g_type('collections.NotAType')
+        
+        #Dynamic types are not kept alive
+        fqn = sltc.TypeRegistry.g_fqn(A)
+        del A
+        gc.collect()
+        assert  fqn not in sltc.TYPE_REGISTRY.types and 'TestA' not in sltc.TYPE_REGISTRY.types
+    def test_pickle             (
+        self    ):
+        import  saltools.parallel   as sltp
+        task            = sltp.FactoryTask(print, id_= 'task', args= [1, 'x'])
+        task.last_start = 5
+        hash(task)
+        assert  not hasattr(task, '__dict__')
+        for other in [pickle.loads(pickle.dumps(task)), sltp.FactoryTask.from_bytes(task.to_bytes())]:
+            assert  other == task and hash(other) == hash(task)
+            assert  (other.last_start, other.last_stop) == (5, None)
+        
+        #Out-of-band buffers
+        data    = bytearray(b'data')
+        buffers = []
+        task    = sltp.FactoryTask(print, args= [pickle.PickleBuffer(data)])
+        assert  len(buffers) == 0 and b'data' in task.to_bytes()
+        other   = sltp.FactoryTask.from_bytes(task.to_bytes(buffers), buffers)
+        assert  len(buffers) == 1 and bytes(other.args[0]) == b'data'
+        with    pytest.raises(TypeError):
+            sltc.EasyObj.from_bytes(pickle.dumps('data'))
+        
+        #Adapters and _on_init are not called again
+        class A(
+            sltc.EasyObj    ):
+            EasyObj_PARAMS  = OrderedDict((
+                ('p0'   , {
+                    'adapter'   : lambda x: x+ 1    }),))
+            EasyObj_SLOTS   = ('state',)
+            def _on_init(
+                self    ):
+                self.state  = 'init'
+        for A in [A, sltc.slotted(A)]   :
+            a       = A(0)
+            a.state = 'changed'
+            if      hasattr(a, '__dict__')  :
+                a.extra = 'extra'
+            a       = copy.deepcopy(a)
+            assert  (a.p0, a.state, getattr(a, 'extra', 'extra')) == (1, 'changed', 'extra')
\ No newline at end of file
@@ -1,7 +1,586 @@
-import  saltools.common as      sltc
+from    concurrent.futures  import  Future
+
+import  saltools.common     as      sltc
+import  saltools.logging    as      sltl
+
+import  pytest
+
+import  multiprocessing
+import  threading
+import  textwrap
+import  asyncio
+import  time
+import  os
+
+def log_child   (
+    channel ,
+    logger  ):
+    channel.attach()
+    logger.info('forked')
+    other   = sltl.ConsoleLogger(id_= 'other', is_print_log= False)
+    other.start()
+    other.info('started')
+    other.stop()
+    channel.close()
+
+def legacy_format   (
+    id_         ,
+    level       ,
+    log_dict    ,
+    log_datetime,
+    is_one_line ,
+    is_raw      ):
+    #ConsoleLogger._execute_log before the formatters
+    prefix      = '' if is_raw else f'[{log_datetime}][{id_:<20}] [{level.name:<8}]: '
+    if      is_one_line    :
+        dict_text   = '|'.join([f'{k}, {v}' for k, v in log_dict.items()])  if\
+                        isinstance(log_dict, dict)                          else\
+                        str(log_dict) 
+        return f'{prefix}{dict_text}'
+    if      not isinstance(log_dict, dict)    :
+        log_dict = {log_dict: ''}
+    prefix          +='' if is_raw else '\n'
+    format_message  = lambda message: '\n'+ '\n'.join(textwrap.wrap(
+                message                         , 
+                subsequent_indent   = '\t\t'    , 
+                initial_indent      = '\t\t'    , 
+                width               = 100       , 
+                break_on_hyphens    = True      )) 
+    dict_text       = '\n'.join([f'\t{k:<20}:{format_message(str(v))}' for k,v in log_dict.items()])
+    return f'{prefix}{dict_text}'+'\n'+'='*120
 
 class TestLogger:
 
     def test_parse  (
         self    ):
-        pass
\ No newline at end of file
+        logger  = sltl.Logger(type= 'ConsoleLogger', id_= 'console')
+        assert  type(logger) is sltl.ConsoleLogger and logger.id_ == 'console'
+        assert  type(sltl.Logger(type= 'saltools.logging.CsvLogger' )) is sltl.CsvLogger
+        assert  type(sltl.Logger()                                  ) is sltl.Logger
+        
+        sltc.TYPE_REGISTRY.alias('TestFileLogger', 'saltools.logging.FileLogger')
+        assert  type(sltl.Logger(type= 'TestFileLogger')) is sltl.FileLogger
+    def test_formatter  (
+        self    ):
+        formatter   = sltl.TextFormatter()
+        values      = [
+            '', ' ', 'a', ' a', 'a ', 'a  b', 'x'* 98, 'x'* 99, 'x'* 98+ ' ', 'a\tb', 'a\nb', 'é'* 50,
+            'word '* 30, 'long-hyphenated-'* 10, 12, None, {'nested': 1}]
+        logs        = [{'key': value} for value in values]+ [
+            {1: 'a', 'a long key longer than twenty': 'b'}, 'not a dict', 3]
+        for log in logs :
+            for is_one_line in [True, False]    :
+                for is_raw in [True, False] :
+                    args    = ('logger', sltl.Level.WARN, log, '2020-01-01T00:00:00', is_one_line, is_raw)
+                    assert  formatter.format(*args) == legacy_format(*args)
+        
+        formatter   = sltl.TextFormatter(template= '{level} {id}: ', separator= '-')
+        assert  formatter.format('a', sltl.Level.INFO, {'k': 'v'}, 'ts', True, False) == 'INFO a: k, v'
+        assert  formatter.format('a', sltl.Level.INFO, 'v', 'ts', False, True) == '\tv                   :\n\n-'
+        
+        logger      = sltl.ConsoleLogger(formatter= sltl.RawFormatter(), is_print_log= False)
+        assert  logger._execute_log(sltl.Level.INFO, {'k': 'v'}, 'ts', None, False) == "{'k': 'v'}"
+    def test_timestamp  (
+        self        ,
+        tmp_path    ):
+        from    datetime    import  datetime
+        formatter   = sltl.TimestampFormatter()
+        for ts in [0, 1, 999999999, 1577836800000000000, 1577836800999999999, 1577836801000001000]    :
+            assert  formatter.format(ts) == datetime.fromtimestamp(ts// 10** 9).replace(
+                microsecond= ts% 10** 9// 1000).isoformat(timespec= 'microseconds')
+        ts          = 1577836800123456789
+        assert  [sltl.TimestampFormatter(precision).format(ts)[19:] for precision in [0, 3, 9]] == [
+            '', '.123', '.123456789']
+        with pytest.raises(ValueError)  :
+            sltl.TimestampFormatter(10)
+
+        logger      = sltl.JsonLogger(id_= 'ts', root= str(tmp_path), is_print_log= False, ts_precision= 3)
+        start       = datetime.now()
+        with logger :
+            logger.info('a')
+        logs        = list(sltl.read_json_logs(os.path.join(str(tmp_path), 'ts')))
+        assert  len(logs[1]['ts']) == 23 and start.isoformat()[:19] <= logs[1]['ts']
+    def test_file_flush (
+        self        ,
+        tmp_path    ):
+        #Rotation by size does not flush the files
+        for max_bytes in [0, 10**6] :
+            logger  = sltl.CsvLogger(
+                id_             = f'csv-{max_bytes}',
+                root            = str(tmp_path)     ,
+                is_print_log    = False             ,
+                flush_interval  = 60                ,
+                flush_records   = 3                 ,
+                batch_size      = 2                 ,
+                max_bytes       = max_bytes         )
+            path    = os.path.join(str(tmp_path), f'csv-{max_bytes}', 'combined.log')
+            g_lines = lambda : open(path).read().splitlines() if os.path.isfile(path) else []
+            
+            def wait    (
+                n_lines ):
+                for i in range(100) :
+                    if      len(g_lines()) >= n_lines   :
+                        break
+                    time.sleep(0.01)
+                return len(g_lines())
+            
+            with logger :
+                #Flushed by number of records, the start log included
+                logger.info({'a': 1, 'b': 2})
+                time.sleep(0.05)
+                assert  len(g_lines()) == 0
+                logger.info('c')
+                assert  wait(4) == 4
+                #Flushed by level
+                logger.error('d')
+                assert  wait(5) == 5
+                logger.info('e')
+                time.sleep(0.05)
+                assert  len(g_lines()) == 5
+            #Flushed on stop
+            assert  [line.split(',')[3] for line in g_lines()] == [
+                'Logger started!', 'a', 'b', 'c', 'd', 'e', 'Logger stopping!']
+    def test_rotation   (
+        self        ,
+        tmp_path    ):
+        import  gzip
+        logger  = sltl.CsvLogger(
+            id_             = 'rotation'    ,
+            root            = str(tmp_path) ,
+            is_print_log    = False         ,
+            batch_size      = 1             ,
+            max_bytes       = 100           ,
+            backup_count    = 2             ,
+            compression     = 'gzip'        )
+        root    = os.path.join(str(tmp_path), 'rotation')
+        with logger :
+            for i in range(10)  :
+                logger.info({'message': 'x'* 50})
+        rotated = sorted(f for f in os.listdir(root) if f != 'combined.log')
+        assert  len(rotated) == 2 and all(
+            f.startswith('combined.') and f.endswith('.log.gz') for f in rotated)
+        for f in rotated    :
+            with gzip.open(os.path.join(root, f), 'rt') as f_  :
+                assert  len(f_.read()) >= 100
+
+        #The size of an existing file is counted
+        root    = os.path.join(str(tmp_path), 'existing')
+        os.makedirs(root)
+        with open(os.path.join(root, 'combined.log'), 'w') as f :
+            f.write('x'* 200+ '\n')
+        with sltl.FileLogger(id_= 'existing', root= str(tmp_path), is_print_log= False, max_bytes= 100):
+            pass
+        rotated = [f for f in os.listdir(root) if f != 'combined.log']
+        assert  len(rotated) == 1 and open(os.path.join(root, rotated[0])).read().startswith('x'* 200)
+
+        with pytest.raises(ValueError)  :
+            sltl.FileLogger(root= str(tmp_path), compression= 'rar')
+    def test_json_logger(
+        self        ,
+        tmp_path    ):
+        logger  = sltl.JsonLogger(
+            id_             = 'json'        ,
+            root            = str(tmp_path) ,
+            is_print_log    = False         ,
+            batch_size      = 4             ,
+            index_interval  = 3             ,
+            max_bytes       = 500           ,
+            compression     = 'gzip'        )
+        root    = os.path.join(str(tmp_path), 'json')
+        with logger :
+            for i in range(20)  :
+                (logger.error if i % 5 == 0 else logger.info)({'i': i, 'object': object})
+            logger.flush()
+            #Readable while the logger is running
+            assert  len(list(sltl.read_json_logs(root))) == 21
+        assert  any(f.endswith('.jsonl.gz') for f in os.listdir(root))
+
+        logs    = list(sltl.read_json_logs(root))
+        assert  [log['payload'] for log in logs[:2]] == ['Logger started!', {'i': 0, 'object': str(object)}]
+        assert  [log['payload']['i'] for log in logs[1: -1]] == list(range(20))
+        assert  {log['id'] for log in logs} == {'json'} and logs[-1]['payload'] == 'Logger stopping!'
+        
+        assert  [log['payload']['i'] for log in sltl.read_json_logs(root, level= 'ERROR')] == [0, 5, 10, 15]
+        ts      = [log['ts'] for log in logs]
+        assert  [log['payload']['i'] for log in sltl.read_json_logs(
+            root, start= ts[3], end= ts[9], level= sltl.Level.INFO)] == [2, 3, 4, 5, 6, 7]
+    def test_sql_logger (
+        self        ,
+        tmp_path    ):
+        import  saltools.misc   as sltm
+        import  sqlalchemy      as sa
+        path    = os.path.join(str(tmp_path), 'logs.db')
+        logger  = sltl.SQLLogger(
+            id_             = 'sql'                                     ,
+            engine_builder  = sltm.SQLAlchemyEBuilder(db= '/'+ path)    ,
+            is_combine      = True                                      ,
+            is_print_log    = False                                     ,
+            flush_interval  = 60                                        )
+        engine  = sa.create_engine(f'sqlite:///{path}')
+        g_rows  = lambda : engine.execute('SELECT level, title, message FROM sql_combined').fetchall()
+        with logger :
+            logger.info({'a': 1, 'b': 2})
+            time.sleep(0.05)
+            assert  g_rows() == []
+            #Committed by level
+            logger.critical('c')
+            for i in range(100) :
+                if      len(g_rows()) == 4  :
+                    break
+                time.sleep(0.01)
+            assert  len(g_rows()) == 4
+            assert  engine.execute(sa.text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert  logger.sqlite_pragmas == sltl.SQLLogger.SQLITE_PRAGMAS and \
+            logger.sqlite_pragmas is not sltl.SQLLogger.SQLITE_PRAGMAS
+        with pytest.raises(ValueError, match= 'pragma') :
+            sltl.SQLLogger(
+                engine_builder  = sltm.SQLAlchemyEBuilder(db= '/'+ path)    ,
+                sqlite_pragmas  = {'journal_mode=OFF; DROP TABLE x; --': 1} )
+        assert  g_rows()[1:] == [
+            ('INFO'     , 'sql:::a'                 , '1'   ),
+            ('INFO'     , 'sql:::b'                 , '2'   ),
+            ('CRITICAL' , 'sql:::c'                 , ''    ),
+            ('INFO'     , 'sql:::Logger stopping!'  , ''    )]
+    def test_sql_events (
+        self        ,
+        tmp_path    ):
+        import  saltools.misc   as sltm
+        import  sqlalchemy      as sa
+        path    = os.path.join(str(tmp_path), 'logs.db')
+        builder = sltm.SQLAlchemyEBuilder(db= '/'+ path)
+        loggers = [sltl.SQLLogger(
+            id_             = id_       ,
+            engine_builder  = builder   ,
+            is_normalized   = True      ,
+            is_print_log    = False     ,
+            #Not parsed by datetime.fromisoformat before 3.11
+            ts_precision    = 9         ) for id_ in ['a', 'b']]
+        for logger in loggers   :
+            with logger :
+                for i in range(10)  :
+                    (logger.error if i % 3 == 0 else logger.info)({'i': i, 'logger': logger.id_})
+                logger.flush(timeout= 5)
+            assert  logger.n_errors == 0
+        a, b    = loggers
+        assert  {index['name'] for index in sa.inspect(a.engine).get_indexes('log_events')} == {
+            'ix_log_events_logger_level_ts', 'ix_log_events_ts'}
+        
+        logs    = list(a.query_logs(page_size= 3))
+        assert  [log['payload'] for log in logs[:2]] == ['Logger started!', {'i': 0, 'logger': 'a'}]
+        assert  len(logs) == 12 and {log['logger'] for log in logs} == {'a'}
+        assert  all(x['ts'] <= y['ts'] for x, y in zip(logs, logs[1:]))
+        
+        errors  = list(a.query_logs(level= 'ERROR', loggers= [], page_size= 2))
+        assert  [(log['logger'], log['payload']['i']) for log in errors] == [
+            ('a', 0), ('a', 3), ('a', 6), ('a', 9), ('b', 0), ('b', 3), ('b', 6), ('b', 9)]
+        assert  all(log['level'] is sltl.Level.ERROR for log in errors)
+        
+        page    = a.g_logs_page(start= logs[3]['ts'], end= logs[6]['ts'].isoformat())
+        assert  [log['payload']['i'] for log in page] == [2, 3, 4]
+        
+        #Only the rows of the logger are deleted
+        sltl.SQLLogger(id_= 'a', engine_builder= builder, is_normalized= True, is_overwrite= True)
+        assert  list(a.query_logs()) == [] and len(list(b.query_logs())) == 12
+    def test_level      (
+        self    ):
+        logger  = sltl.ConsoleLogger(level= 'INFO')
+        logger.debug('a')
+        logger.info('b')
+        logger.log(sltl.Level.DEBUG, 'c')
+        assert  logger.debug is sltl._log_no_op and logger._queue.qsize() == 1
+
+        logger.set_level('ERROR')
+        logger.warn('d')
+        logger.log(sltl.Level.WARN, 'e')
+        logger.critical('f')
+        assert  logger.level == sltl.Level.ERROR and logger._queue.qsize() == 2
+        
+        logger.set_level(sltl.Level.DEBUG)
+        logger.debug('g')
+        assert  [item[1] for item in logger._queue.queue] == ['b', 'f', 'g']
+    def test_overflow   (
+        self    ):
+        g_messages  = lambda logger: [item[1] if isinstance(item, list) else item for item in logger._queue.queue]
+        for policy, messages in [
+            ('DROP_NEWEST'  , [0, 1, 2]     ),
+            ('DROP_OLDEST'  , [7, 8, 9]     ),
+            ('SAMPLE'       , [0, 1, 2]     ),
+            ('BLOCK'        , [0, 1, 2]     )]:
+            logger  = sltl.ConsoleLogger(
+                capacity        = 3         ,
+                overflow_policy = policy    ,
+                block_timeout   = 0.001     ,
+                sample_rate     = 2         )
+            for i in range(10)  :
+                logger.info(i)
+            assert  g_messages(logger) == messages
+            assert  logger.n_dropped == 7
+            assert  logger.n_blocked == {'SAMPLE': 3, 'BLOCK': 7}.get(policy, 0)
+        
+        #Flush requests and the stop signal are never dropped
+        for type_ in [sltl.ConsoleLogger, sltl.AsyncLogger] :
+            logger  = type_(capacity= 2, overflow_policy= 'DROP_OLDEST')
+            future  = Future()
+            logger.info(0)
+            logger._queue.put(future)
+            logger.info(1)
+            logger.info(2)
+            assert  g_messages(logger) == [future, 2]
+            logger._queue.queue.pop()
+            logger._queue.put(None)
+            logger.info(3)
+            assert  g_messages(logger) == [future, None] and logger.n_dropped == 3
+        
+        #Dropped logs are reported
+        logger  = sltl.ConsoleLogger(capacity= 1, overflow_policy= 'DROP_NEWEST', is_print_log= False)
+        for i in range(3)   :
+            logger.info(i)
+        logged  = []
+        logger._execute_log = lambda *item: logged.append(item[1])
+        logger._queue.get()
+        logger._queue.put(None)
+        logger._loop()
+        assert  logged == [{'Logs dropped': '2 logs dropped'}]
+    def test_rate_limit (
+        self    ):
+        error   = lambda line: {'Origin': 'fn', 'Type': 'KeyError', 'Line': line, 'id': time.time()}
+        logger  = sltl.ConsoleLogger(rate_limit= 1, rate_burst= 2, is_print_log= False)
+        for i in range(10)  :
+            logger.error(error(1))
+        logger.error(error(2))
+        logger.warn(error(1))
+        logger.info({'not': 'limited'})
+        for i in range(3)   :
+            logger.info('message')
+        assert  [(item[0].name, item[1].get('Line') if isinstance(item[1], dict) else item[1]) for item in 
+            logger._queue.queue] == [
+            ('ERROR', 1), ('ERROR', 1), ('ERROR', 2), ('WARN', 1), ('INFO', None), ('INFO', 'message'), 
+            ('INFO', 'message')]
+        
+        #Refilled at rate_limit
+        logger._buckets[(sltl.Level.ERROR, 'fn', 'KeyError', 1)][1]    -= 1
+        logger.error(error(1))
+        assert  logger._queue.qsize() == 8
+        
+        logs    = logger._g_suppressed(True)
+        assert  [(log[0], log[1]['Logs suppressed'][:13]) for log in logs] == [
+            (sltl.Level.ERROR, 'Suppressed 8 '), (sltl.Level.INFO, 'Suppressed 1 ')]
+        assert  logger.n_suppressed == 9 and logger._g_suppressed(True) == []
+        
+        logger  = sltl.ConsoleLogger(rate_limit= 1, rate_burst= 1, fingerprint= lambda level, log: log.get('k'))
+        for log in [{'k': 1}, {'k': 1}, {'k': 2}, {}, {}]    :
+            logger.info(log)
+        assert  [item[1] for item in logger._queue.queue] == [{'k': 1}, {'k': 2}, {}, {}]
+    def test_stats      (
+        self        ,
+        tmp_path    ):
+        class FailingLogger (sltl.JsonLogger):
+            def _execute_log(
+                self    ,
+                *item   ):
+                if      item[1] == 'fail'   :
+                    raise   ValueError('fail')
+                super()._execute_log(*item)
+        logger  = FailingLogger(
+            id_             = 'stats'       ,
+            root            = str(tmp_path) ,
+            is_print_log    = False         ,
+            batch_size      = 4             ,
+            stats_interval  = 0.05          )
+        with logger :
+            for i in range(20)  :
+                logger.info(str(i))
+            logger.info('fail')
+            logger.flush()
+            stats   = logger.stats()
+            assert  stats['n_written'] >= 22 and stats['n_errors'] == 1 and stats['last_error'] == 'ValueError: fail'
+            assert  sum(stats['latency_us'].values()) == stats['n_written'] and stats['max_queue_depth'] >= 4
+            assert  0 < stats['latency_p50_us'] <= stats['latency_p99_us'] and stats['write_time'] > 0
+            time.sleep(0.1)
+            logger.flush()
+        payloads    = [log['payload'] for log in sltl.read_json_logs(os.path.join(str(tmp_path), 'stats'))]
+        assert  'fail' not in payloads and payloads[:3] == ['Logger started!', '0', '1']
+        reports     = [payload for payload in payloads if isinstance(payload, dict) and 'Logger stats' in payload]
+        assert  reports and reports[-1]['n_errors'] == 1 and reports[-1]['records_per_sec'] > 0
+        
+        assert  sltl.ConsoleLogger().stats()['n_written'] == 0
+    def test_flush_errors   (
+        self        ,
+        tmp_path    ):
+        class FailingLogger (sltl.CsvLogger):
+            def _flush  (
+                self    ):
+                if      self.is_failing :
+                    raise   OSError('disk')
+                super()._flush()
+        for pool in [None, sltl.LogPool(n_threads= 1, interval= 0.01)]  :
+            logger  = FailingLogger(
+                id_             = 'failing'     ,
+                root            = str(tmp_path) ,
+                is_print_log    = False         ,
+                pool            = pool          )
+            logger.is_failing   = True
+            with logger :
+                logger.info('lost')
+                with pytest.raises(OSError, match= 'disk')  :
+                    logger.flush(timeout= 2)
+                logger.is_failing   = False
+                logger.info('written')
+                logger.flush(timeout= 2)
+                assert  logger.n_errors >= 1 and logger.stats()['last_error'] == 'OSError: disk'
+                with open(os.path.join(str(tmp_path), 'failing', 'combined.log')) as f  :
+                    assert  'written' in f.read()
+    def test_multi_logger   (
+        self        ,
+        tmp_path    ):
+        class SlowLogger    (sltl.ConsoleLogger):
+            def _execute_log(
+                self    ,
+                *item   ):
+                time.sleep(0.02)
+                self.logged.append(item[1])
+        for is_isolated in [False, True]    :
+            root    = os.path.join(str(tmp_path), str(is_isolated))
+            json_   = sltl.JsonLogger(id_= 'json', root= root, is_print_log= False)
+            slow    = SlowLogger(id_= 'slow', level= 'ERROR', is_print_log= False)
+            slow.logged = []
+            logger  = sltl.MultiLogger(
+                sinks           = [json_, slow] ,
+                is_isolated     = is_isolated   ,
+                sink_capacity   = 2             ,
+                sink_timeout    = 0.001         ,
+                batch_size      = 1             )
+            with logger :
+                for i in range(10)  :
+                    logger.error(i)
+                    time.sleep(0.002)
+                logger.debug('debug')
+                logger.flush()
+                logs    = [log['payload'] for log in sltl.read_json_logs(os.path.join(root, 'json'))]
+                assert  logs == ['Logger started!']+ [str(i) for i in range(10)]+ ['debug']
+            if      is_isolated :
+                #The slow sink dropped logs, the others did not wait for it
+                assert  json_.n_dropped == 0 and 0 < slow.n_dropped < 10 and slow.n_dropped == len([
+                    i for i in range(10) if i not in slow.logged])
+            else                :
+                assert  slow.logged == list(range(10)) and slow.n_dropped == 0
+        
+        #A burst through healthy sinks is not dropped
+        root    = os.path.join(str(tmp_path), 'burst')
+        sinks   = [
+            sltl.FileLogger(id_= 'file', root= root, is_print_log= False)   ,
+            sltl.CsvLogger(id_= 'csv', root= root, is_print_log= False)     ]
+        logger  = sltl.MultiLogger(sinks= sinks, sink_capacity= 8, batch_size= 4)
+        with logger :
+            for i in range(5000)    :
+                logger.info(i)
+            logger.flush(timeout= 10)
+        assert  logger.n_dropped == 0 and all(sink.n_dropped == 0 for sink in sinks)
+        with open(os.path.join(root, 'csv', 'combined.log')) as f   :
+            assert  f.read().count('\n') >= 5000
+
+        warn    = sltl.ConsoleLogger(level= 'WARN')
+        info    = sltl.ConsoleLogger(level= 'INFO')
+        logger  = sltl.MultiLogger(sinks= [warn, info])
+        assert  logger.level == sltl.Level.INFO
+        #Updated with the sinks levels, never lower than the level set
+        info.set_level('ERROR')
+        assert  logger.level == sltl.Level.WARN and logger.info is sltl._log_no_op
+        info.set_level('DEBUG')
+        assert  logger.level == sltl.Level.DEBUG
+        logger.set_level('ERROR')
+        info.set_level('INFO')
+        assert  logger.level == sltl.Level.ERROR
+        assert  sltl.MultiLogger().sinks == [] and sltl.MultiLogger().sinks is not sltl.MultiLogger().sinks
+    def test_pool       (
+        self        ,
+        tmp_path    ):
+        pool    = sltl.LogPool(n_threads= 2, interval= 0.01)
+        loggers = [sltl.CsvLogger(
+            id_             = f'pool-{i}'       ,
+            root            = str(tmp_path)     ,
+            is_print_log    = False             ,
+            batch_size      = 4                 ,
+            flush_records   = 100               ,
+            flush_interval  = 0.02              ,
+            pool            = pool              ) for i in range(6)]
+        n_threads   = len(threading.enumerate())
+        for logger in loggers   :
+            logger.start()
+        for i in range(50)      :
+            for logger in loggers   :
+                logger.info(str(i))
+        assert  len(threading.enumerate()) == n_threads+ 2
+        #Flushed by the pool timer
+        time.sleep(0.2)
+        path    = os.path.join(str(tmp_path), '{}', 'combined.log')
+        g_lines = lambda id_: [line.split(',')[3] for line in open(path.format(id_)).read().splitlines()]
+        assert  g_lines('pool-0') == ['Logger started!']+ [str(i) for i in range(50)]
+        loggers[1].info('flushed')
+        loggers[1].flush()
+        assert  g_lines('pool-1')[-1] == 'flushed'
+        sltl.Logger.stop_all()
+        for logger in loggers   :
+            assert  not logger.is_alive and logger._thread.is_alive() is False
+            assert  g_lines(logger.id_)[-1] == 'Logger stopping!'
+        #Restarted with the same pool
+        with loggers[0] :
+            loggers[0].info('again')
+        assert  g_lines('pool-0')[-4:] == ['Logger stopped!', 'Logger started!', 'again', 'Logger stopping!']
+    def test_log_channel(
+        self        ,
+        tmp_path    ):
+        logger  = sltl.CsvLogger(id_= 'channel', root= str(tmp_path), is_print_log= False)
+        channel = sltl.LogChannel(logger, batch_size= 2)
+        with logger :
+            channel.start()
+            process = multiprocessing.get_context('fork').Process(
+                target  = log_child         ,
+                args    = (channel, logger) )
+            process.start()
+            process.join()
+            channel.stop()
+        with open(os.path.join(str(tmp_path), 'channel', 'combined.log')) as f   :
+            titles  = [line.split(',')[3] for line in f.read().splitlines()]
+        assert  titles == [
+            'Logger started!', 'forked', 'Logger started!', 'started', 'Logger stopping!', 'Logger stopping!']
+    def test_async      (
+        self        ,
+        tmp_path    ):
+        class AsyncCsvLogger(sltl.AsyncLogger, sltl.CsvLogger):
+            pass
+        path    = os.path.join(str(tmp_path), '{}', 'combined.log')
+        g_lines = lambda id_: [line.split(',')[3] for line in open(path.format(id_)).read().splitlines()]
+
+        async def run   (
+            ):
+            #Thread logger
+            logger          = sltl.CsvLogger(id_= 'thread', root= str(tmp_path), is_print_log= False)
+            logger.start()
+            await logger.alog(sltl.Level.INFO, 'a')
+            await logger.aflush()
+            assert  g_lines('thread') == ['Logger started!', 'a']
+            await logger.astop()
+            assert  not logger.is_alive and not logger._thread.is_alive()
+
+            #Event loop logger, no thread
+            async_logger    = AsyncCsvLogger(
+                id_             = 'task'        ,
+                root            = str(tmp_path) ,
+                is_print_log    = False         ,
+                capacity        = 2             ,
+                flush_interval  = 60            )
+            async_logger.start()
+            assert  async_logger._thread is None and async_logger._task is not None
+            for i in range(3)   :
+                await async_logger.alog(sltl.Level.INFO, str(i))
+            await async_logger.aflush()
+            async_logger.info('3')
+            await async_logger.aflush()
+            assert  g_lines('task') == ['Logger started!', '0', '1', '2', '3']
+            with pytest.raises(RuntimeError) :
+                async_logger.flush()
+            await async_logger.astop()
+            assert  async_logger._task is None
+            assert  g_lines('task')[-2:] == ['3', 'Logger stopping!']
+        asyncio.run(run())
\ No newline at end of file
@@ -1,5 +1,9 @@
 import  saltools.misc    as  sltm
 
+import  subprocess
+import  sys
+import  os
+
 def test_join_string_array  (
     ):
     case_A  = [
@@ -7,4 +11,22 @@ def test_join_string_array  (
         ','         ,
         ' ABC , '   ]
     
-    assert sltm.join_string_array(case_A, ', ') == 'hello, ABC'
\ No newline at end of file
+    assert sltm.join_string_array(case_A, ', ') == 'hello, ABC'
+def test_lazy_imports       (
+    ):
+    #Heavy dependencies are imported on first use only
+    code    = '''if True:
+        import  saltools.common, saltools.logging, saltools.misc, saltools.parallel, saltools.web
+        import  sys
+        #The log channel of a factory is created by its first process task
+        saltools.parallel.NiceFactory()
+        print(','.join(m for m in ['sqlalchemy', 'sqlalchemy_utils', 'requests', 'lxml', 'dateutil.parser', 
+            'asyncio', 'multiprocessing', 'mmap', 'concurrent.futures'] 
+            if m in sys.modules))'''
+    output  = subprocess.run(
+        [sys.executable, '-c', code]    ,
+        env     = dict(os.environ, PYTHONPATH= os.path.join(os.path.dirname(__file__), '../../../src')),
+        stdout  = subprocess.PIPE       ,
+        check   = True                  ,
+        universal_newlines  = True      ).stdout
+    assert  output.strip() == ''
\ No newline at end of file
@@ -0,0 +1,32 @@
+from    datetime            import  datetime
+
+import  saltools.schedule   as      slts
+
+def test_schedule_lists (
+    ):
+    schedule    = slts.Schedule(
+        tasks   = [
+            {'target': print, 'id_': 'task'}        ],
+        dates   = [
+            '2020-01-01T10:00:00'                   ],
+        times   = [
+            {'type': 'LAST_START', 'minute': 5}     ,
+            {'second': 30}                          ],
+        ranges  = [
+            {'hour': [9, 17]}                       ,
+            {'weekday': 5, 'is_ok': False}          ])
+    
+    assert  schedule.tasks[0].id_       == 'task'
+    assert  schedule.dates              == [datetime(2020, 1, 1, 10)]
+    assert  schedule.times[0].type      == slts.TimeType.LAST_START
+    assert  schedule.ranges[0].hour     == [9, 17]
+    assert  schedule.ranges[1].weekday  == [5]
+    assert  len(slts.Schedule().times)  == 1
+    #Time only dates are today
+    assert  slts.Schedule(dates= ['08:00']).dates == [datetime.now().replace(hour= 8, minute= 0, second= 0, microsecond= 0)]
+
+    tasks   = schedule.g_next_times(datetime(2021, 1, 4, 10))
+    assert  tasks[0].next_times == [
+        datetime(2021, 1, 4, 10         ),
+        datetime(2021, 1, 4, 10, 0, 30  ),
+        datetime(2020, 1, 1, 10         )]
\ No newline at end of file